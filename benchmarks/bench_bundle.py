@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Bundle size report for streamlit-kanban-os
+
+Measures the frontend build every board iframe downloads: the JavaScript loaded
+before the first render (the entry chunk) and the lazily loaded chunks, raw and
+compressed. Save one report per release to keep an eye on cold start on mobile.
+The reports go to benchmarks/releases/, which is committed with the release.
+Time to first render is reported by kanban_board(profile=True) as
+"timeToFirstRender", pass the value measured in a browser with --first-render-ms
+to keep it in the same report.
+
+Run from the project root after `npm run build`:
+    python benchmarks/bench_bundle.py --save --first-render-ms 180
+    python benchmarks/bench_bundle.py --compare benchmarks/releases/bundle-0.4.0-dev.json
+"""
+
+import argparse
+import gzip
+import json
+import re
+import sys
+from pathlib import Path
+
+from report import REGRESSION_RATIO, compare
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+BUILD_DIR = PROJECT_ROOT / "streamlit_kanban_os" / "src" / "frontend" / "build"
+RELEASES_DIR = PROJECT_ROOT / "benchmarks" / "releases"
+
+
+def project_version():
+    pyproject = (PROJECT_ROOT / "pyproject.toml").read_text()
+    return re.search(r'^version\s*=\s*"([^"]+)"', pyproject, re.MULTILINE).group(1)
+
+
+def build_info(build_dir):
+    """build-info.json of the build, empty for builds from before it was written"""
+    try:
+        return json.loads((build_dir / "build-info.json").read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def entry_scripts(build_dir):
+    """Scripts index.html loads up front, everything else in assets/ is loaded on demand"""
+    html = (build_dir / "index.html").read_text()
+    return {Path(src).name for src in re.findall(r'<script[^>]+src="([^"]+)"', html)}
+
+
+def sizes(path):
+    data = path.read_bytes()
+    return len(data), len(gzip.compress(data, compresslevel=9))
+
+
+def measure(build_dir):
+    entries = entry_scripts(build_dir)
+    results = {"entry.bytes": 0, "entry.gzip_bytes": 0, "lazy.bytes": 0, "lazy.gzip_bytes": 0, "lazy.chunks": 0}
+    for path in sorted((build_dir / "assets").glob("*.js")):
+        raw, compressed = sizes(path)
+        group = "entry" if path.name in entries else "lazy"
+        results[f"{group}.bytes"] += raw
+        results[f"{group}.gzip_bytes"] += compressed
+        if group == "lazy":
+            results["lazy.chunks"] += 1
+        # hashes change every build, so chunks are reported by name only
+        results[f"file.{re.sub(r'-[A-Za-z0-9_-]{8}$', '', path.stem)}.gzip_bytes"] = compressed
+    results["index_html.bytes"] = sizes(build_dir / "index.html")[0]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--build-dir", type=Path, default=BUILD_DIR, help="Frontend build folder")
+    parser.add_argument("--save", type=Path, nargs="?", const=True,
+                        help="Write the report, by default to benchmarks/releases/bundle-<version>.json")
+    parser.add_argument("--first-render-ms", type=float,
+                        help="Time to first render measured with kanban_board(profile=True), kept in the report")
+    parser.add_argument("--compare", type=Path, help="Compare against a report saved with --save")
+    options = parser.parse_args()
+
+    version = project_version()
+    results = measure(options.build_dir)
+    if options.first_render_ms is not None:
+        results["first_render_ms"] = options.first_render_ms
+    # the entry chunk names the build, its hash changes with every build
+    report = {"version": version, "build": {"entry": sorted(entry_scripts(options.build_dir)),
+                                            **build_info(options.build_dir)}, "results": results}
+
+    if options.save:
+        target = RELEASES_DIR / f"bundle-{version}.json" if options.save is True else options.save
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(json.dumps(report, indent=2))
+        print(f"✅ Report saved to {target}")
+
+    if options.compare:
+        regressions = compare(results, json.loads(options.compare.read_text()))
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) over {REGRESSION_RATIO}x")
+            sys.exit(1)
+        print("\n🎉 No regressions")
+    elif not options.save:
+        for name, value in results.items():
+            print(f"{name:<55} {value:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Python benchmarks for streamlit-kanban-os
+
+Times kanban_board() argument building (through Streamlit's AppTest, no browser),
+the size of the payload sent to the frontend, and the Python board helpers, for
+boards of 100 to 100k cards.
+
+Run from the project root:
+    python benchmarks/bench_python.py --save benchmarks/results/baseline.json
+    python benchmarks/bench_python.py --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from streamlit_kanban_os import Board, deltas  # noqa: E402
+from streamlit_kanban_os.dataframe import frame_payload, to_dataframe  # noqa: E402
+from report import REGRESSION_RATIO, compare  # noqa: E402
+
+SIZES = [100, 1_000, 10_000, 100_000]
+COLUMN_TITLES = ["Backlog", "To Do", "In Progress", "Done"]
+
+
+def make_columns(total_cards, with_help=True):
+    """A board with the cards spread over the columns, like the example app"""
+    columns = [{"title": title, "cards": []} for title in COLUMN_TITLES]
+    for i in range(total_cards):
+        card = {"id": str(i), "title": f"Task {i}"}
+        if with_help:
+            card["help"] = f"Help text for task {i}"
+        columns[i % len(columns)]["cards"].append(card)
+    return columns
+
+
+def make_moves(columns, count, seed=0):
+    """Delta mode move operations, as the frontend would send them"""
+    rng = random.Random(seed)
+    columns = json.loads(json.dumps(columns))
+    ops = []
+    for seq in range(1, count + 1):
+        source = rng.choice([i for i, column in enumerate(columns) if column["cards"]])
+        target = rng.randrange(len(columns))
+        position = rng.randrange(len(columns[source]["cards"]))
+        op = {"seq": seq, "type": "move", "card": columns[source]["cards"][position]["id"],
+              "from": source, "fromIndex": position, "to": target, "index": 0}
+        deltas.apply_op(columns, op)
+        ops.append(op)
+    return ops
+
+
+def timed(func, min_time=0.5, max_repeat=20, setup=None):
+    """Median wall time of func() in milliseconds, repeated for about min_time seconds
+
+    With a setup, func(setup()) is timed and setup() itself is left out of each sample
+    """
+    def sample():
+        arg = setup() if setup is not None else None
+        start = time.perf_counter()
+        if setup is not None:
+            func(arg)
+        else:
+            func()
+        return time.perf_counter() - start
+
+    first = sample()
+    repeat = max(1, min(max_repeat, int(min_time / max(first, 1e-9))))
+    samples = [first] + [sample() for _ in range(repeat - 1)]
+    return statistics.median(samples) * 1000
+
+
+def board_app(columns, key, revision=None):
+    """AppTest script: draws one board from the columns passed in"""
+    from streamlit_kanban_os import kanban_board
+    kanban_board(columns, key=key, revision=revision)
+
+
+def dataframe_app(data, key):
+    """AppTest script: draws one board from a DataFrame"""
+    from streamlit_kanban_os import kanban_board
+    kanban_board(data, group_by="status", help_column="help", categories=["Backlog", "To Do", "In Progress", "Done"], key=key)
+
+
+def payload_bytes(app_test):
+    """Size of the component message, JSON args plus Arrow tables"""
+    return sum(element.proto.ByteSize() for element in app_test.get("component_instance"))
+
+
+def bench_app(results, name, script, args, timeout):
+    app_test = AppTest.from_function(script, args=args, default_timeout=timeout)
+
+    def run():
+        app_test.run()
+        if app_test.exception:
+            raise RuntimeError(app_test.exception[0].message)
+
+    # First run sends the board, later runs of the same session find the revision unchanged
+    first_start = time.perf_counter()
+    run()
+    results[f"{name}.first_run_ms"] = (time.perf_counter() - first_start) * 1000
+    results[f"{name}.first_run_bytes"] = payload_bytes(app_test)
+    results[f"{name}.rerun_ms"] = timed(run, max_repeat=5)
+    results[f"{name}.rerun_bytes"] = payload_bytes(app_test)
+
+
+def run_benchmarks(sizes):
+    import pandas as pd
+
+    results = {}
+    for size in sizes:
+        print(f"⏱️  {size} cards")
+        columns = make_columns(size)
+        prefix = f"{size}"
+        timeout = max(10, size / 1000)
+
+        serialized = json.dumps(columns)
+        results[f"{prefix}.json_bytes"] = len(serialized.encode())
+        results[f"{prefix}.json_dumps_ms"] = timed(lambda: json.dumps(columns))
+
+        bench_app(results, f"{prefix}.kanban_board", board_app, (columns, "bench"), timeout)
+        bench_app(results, f"{prefix}.kanban_board_revision", board_app, (columns, "bench", "r1"), timeout)
+
+        frame = pd.DataFrame({
+            "id": range(size),
+            "title": [f"Task {i}" for i in range(size)],
+            "help": [f"Help text for task {i}" for i in range(size)],
+            "status": [COLUMN_TITLES[i % len(COLUMN_TITLES)] for i in range(size)],
+        })
+        bench_app(results, f"{prefix}.kanban_board_dataframe", dataframe_app, (frame, "bench"), timeout)
+
+        board = Board.from_columns(columns)
+        ops = make_moves(columns, 100)
+        moved = Board.from_columns(columns).apply_ops(ops)
+        results[f"{prefix}.board_from_columns_ms"] = timed(lambda: Board.from_columns(columns))
+        results[f"{prefix}.board_to_columns_ms"] = timed(board.to_columns)
+        results[f"{prefix}.board_diff_100_moves_ms"] = timed(lambda: board.diff(moved))
+        results[f"{prefix}.board_apply_100_ops_ms"] = timed(
+            lambda fresh: fresh.apply_ops(ops), setup=lambda: Board.from_columns(columns))
+        results[f"{prefix}.deltas_apply_100_ops_ms"] = timed(
+            lambda fresh: deltas.apply_ops(fresh, ops), setup=lambda: [dict(c, cards=list(c["cards"])) for c in columns])
+        results[f"{prefix}.frame_payload_ms"] = timed(lambda: frame_payload(frame, "status", help_column="help"))
+        results[f"{prefix}.to_dataframe_ms"] = timed(lambda: to_dataframe({"columns": columns}, frame, "status"))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Board sizes in cards")
+    parser.add_argument("--save", type=Path, help="Write the report to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Compare against a report saved with --save")
+    options = parser.parse_args()
+
+    results = run_benchmarks(options.sizes)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    if options.save:
+        options.save.parent.mkdir(parents=True, exist_ok=True)
+        options.save.write_text(json.dumps(report, indent=2))
+        print(f"✅ Report saved to {options.save}")
+
+    if options.compare:
+        regressions = compare(results, json.loads(options.compare.read_text()))
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) over {REGRESSION_RATIO}x")
+            sys.exit(1)
+        print("\n🎉 No regressions")
+    elif not options.save:
+        for name, value in results.items():
+            print(f"{name:<55} {value:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
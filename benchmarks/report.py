@@ -0,0 +1,30 @@
+"""
+Baseline comparison shared by the benchmark scripts
+
+Every script saves a JSON report with a "results" dict of name -> number, names ending in
+_ms are timings, the others sizes.
+"""
+
+# Slower (or bigger) than the baseline by more than this is reported as a regression,
+# timings also need to be off by more than the noise floor
+REGRESSION_RATIO = 1.2
+NOISE_FLOOR_MS = 1.0
+
+
+def compare(results, baseline):
+    """Print results next to a baseline, returns the names that regressed"""
+    regressions = []
+    print(f"\n{'benchmark':<55} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, value in results.items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            print(f"{name:<55} {'-':>12} {value:>12.2f}")
+            continue
+        ratio = value / before if before else float("inf")
+        flag = ""
+        noise = NOISE_FLOOR_MS if name.endswith("_ms") else 0
+        if ratio > REGRESSION_RATIO and value - before > noise:
+            flag = " ❌"
+            regressions.append(name)
+        print(f"{name:<55} {before:>12.2f} {value:>12.2f} {ratio:>6.2f}x{flag}")
+    return regressions
@@ -67,6 +67,17 @@ new_category_title = st.sidebar.text_input("New Category Title", value="New Cate
 
 st.sidebar.divider()
 
+# Reruns
+st.sidebar.subheader("Reruns")
+commit = st.sidebar.selectbox(
+    "Commit Policy",
+    options=['immediate', 'debounce', 'manual'],
+    help="When board changes are sent back to python. Each send is one rerun, watch the rerun counter."
+)
+debounce_ms = st.sidebar.slider("Debounce (ms)", min_value=100, max_value=3000, value=800, step=100, disabled=commit != 'debounce')
+
+st.sidebar.divider()
+
 # Layout & Theming
 st.sidebar.subheader("Layout & Theming")
 horizontal_alignment = st.sidebar.selectbox("Horizontal Alignment", ['left', 'center', 'right', 'distribute'], index=0)
@@ -169,7 +180,9 @@ board_state_regular = kanban_board(
     main_column_min_width=main_column_min_width,
     main_column_min_height=main_column_min_height,
     debug_font=st.session_state.show_font_debug,
-    font_file_name=st.session_state.selected_font
+    font_file_name=st.session_state.selected_font,
+    commit=commit,
+    debounce_ms=debounce_ms
 )
 
 st.subheader("Stacked Kanban Board (Mobile-Friendly)")
@@ -191,7 +204,9 @@ board_state_stacked = kanban_board(
     main_column_min_width=main_column_min_width,
     main_column_min_height=main_column_min_height,
     debug_font=st.session_state.show_font_debug,
-    font_file_name=st.session_state.selected_font
+    font_file_name=st.session_state.selected_font,
+    commit=commit,
+    debounce_ms=debounce_ms
 )
 
 
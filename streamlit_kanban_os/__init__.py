@@ -1,10 +1,39 @@
+import streamlit as st
 import streamlit.components.v1 as components
+import hashlib
+import json
+import marshal
 import os
+import time
+import warnings
+
+from . import deltas
+from . import dataframe, effects as side_effects, lanes, paging, persistence, ranks, sharing
+from .board import Board, BoardDiff, Card, CardMove, Column
+from .dataframe import to_dataframe
+from .effects import SideEffectQueue
+from .paging import PagedColumn
+from .persistence import MemoryStore, SQLiteStore
+from .sharing import SharedBoards
 
 __version__ = "0.4.0-dev"
 
 _RELEASE = True
 
+# Version of the arguments the frontend has to understand, written to build-info.json by
+# the frontend build (FRONTEND_PROTOCOL in vite.config.ts). Bump both together.
+_FRONTEND_PROTOCOL = 1
+
+
+def _build_protocol(build_dir):
+    """Protocol of the frontend build in ``build_dir``, 0 for builds from before build-info.json."""
+    try:
+        with open(os.path.join(build_dir, "build-info.json")) as info:
+            return int(json.load(info).get("protocol", 0))
+    except (OSError, ValueError, TypeError, AttributeError):
+        return 0
+
+
 if not _RELEASE:
     _component_func = components.declare_component(
         "kanban_board",
@@ -15,9 +44,156 @@ if not _RELEASE:
     )
 else:
     parent_dir = os.path.dirname(os.path.abspath(__file__))
+    # `npm run build` also writes .gz / .br copies of the build files (see vite.config.ts) for
+    # proxies that serve precompressed files, Streamlit itself compresses responses on the fly
     build_dir = os.path.join(parent_dir, "src/frontend/build")
     _component_func = components.declare_component("kanban_board", path=build_dir)
 
+# An older build crashes on the columns left out for an unchanged revision, so they are
+# always sent to it, and the options it doesn't know raise (see _legacy_options)
+_LEGACY_FRONTEND = _RELEASE and _build_protocol(build_dir) < _FRONTEND_PROTOCOL
+_REBUILD_HINT = "Rebuild it with `npm install && npm run build` in streamlit_kanban_os/src/frontend."
+if _LEGACY_FRONTEND:
+    warnings.warn(
+        "The streamlit_kanban_os frontend build is older than its Python package, so board "
+        "options added since (delta mode, paging, search, shared boards, ...) raise a "
+        "RuntimeError. " + _REBUILD_HINT,
+        RuntimeWarning,
+    )
+
+# Preferred first, matches FONT_EXTS in fonts.ts
+_FONT_EXTS = ('.woff2', '.woff', '.ttf', '.otf')
+
+
+def _static_dir():
+    """The folder Streamlit serves under /app/static (next to the main script)."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        main_script_path = getattr(ctx, 'main_script_path', None)
+    except ImportError:
+        main_script_path = None
+    base_dir = os.path.dirname(os.path.abspath(main_script_path)) if main_script_path else os.getcwd()
+    return os.path.join(base_dir, 'static')
+
+
+def _resolve_font_file(font_file_name):
+    """File name under /app/static to load ``font_file_name`` from, preferring woff2. None if not found."""
+    name = (font_file_name or '').strip()
+    if not name:
+        return None
+    if os.path.splitext(name)[1].lower() in _FONT_EXTS:
+        candidates = [name]
+    else:
+        stem = name.replace(' ', '')
+        candidates = [stem + ext for ext in _FONT_EXTS]
+    static_dir = _static_dir()
+    for candidate in candidates:
+        if os.path.isfile(os.path.join(static_dir, candidate)):
+            return candidate
+    return None
+
+
+def _board_revision(columns):
+    """Content hash of a board payload, used when the caller doesn't pass a revision.
+
+    marshal writes the plain dicts and lists of a board about twice as fast as JSON, version 2
+    has no back references so equal boards always hash the same. Boards holding other values
+    (dates, numpy scalars, ...) fall back to JSON.
+    """
+    try:
+        payload = marshal.dumps(columns, 2)
+    except ValueError:
+        payload = json.dumps(columns, sort_keys=True, separators=(',', ':'), default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _payload_bytes(columns, data):
+    """Size of the board sent to the frontend this rerun, 0 when it was skipped."""
+    if columns is not None:
+        return len(json.dumps(columns, separators=(',', ':'), default=str).encode())
+    if data is not None:
+        import pyarrow as pa
+        return pa.Table.from_pandas(data, preserve_index=False).nbytes
+    return 0
+
+
+def _sync_delta(state, value, page_state):
+    """Apply the operations in a component value to the delta cache, see :func:`deltas.sync`."""
+    if not isinstance(value, dict) or 'needsColumns' in value:
+        return []
+    return deltas.sync(state, value, page_state["served"] if page_state else None)
+
+
+def _legacy_options(columns, options):
+    """Names of the options in use that a frontend build from before build-info.json ignores.
+
+    Such a build sends the whole board back and knows nothing of operations, pages or lanes, so
+    with these options edits would be lost or the option would do nothing.
+    """
+    used = [name for name, in_use in options.items() if in_use]
+    if lanes.is_lanes(columns):
+        used.append('lanes')
+    elif dataframe.is_dataframe(columns):
+        used.append('DataFrame columns')
+    elif isinstance(columns, (list, tuple)) and any(isinstance(column, PagedColumn) for column in columns):
+        used.append('PagedColumn columns')
+    return used
+
+
+def _bulk_move_requests(bulk_move):
+    """Normalize ``bulk_move`` into the list of requests sent to the frontend."""
+    if bulk_move is None:
+        return None
+    moves = [bulk_move] if isinstance(bulk_move, dict) else list(bulk_move)
+    requests = []
+    for move in moves:
+        if 'to' not in move:
+            raise ValueError(f"bulk_move entries need a 'to' column, got {move!r}")
+        if move.get('cards') is None and not move.get('match'):
+            raise ValueError(f"bulk_move entries need 'cards' or 'match', got {move!r}")
+        request = {
+            'to': str(move['to']),
+            'from': None if move.get('from') is None else str(move['from']),
+            'cards': None if move.get('cards') is None else [str(card_id) for card_id in move['cards']],
+            'match': {field: str(value) for field, value in (move.get('match') or {}).items()} or None,
+        }
+        # By default the same move passed on every rerun only runs once, see _bulk_moves_to_send
+        request['request'] = str(move['request']) if move.get('request') is not None else \
+            _board_revision(request)
+        requests.append(request)
+    return requests
+
+
+def _bulk_moves_to_send(state, requests, value):
+    """The ``bulk_move`` requests the frontend still has to apply.
+
+    Each request is sent under a token (its id and a counter) until the frontend lists the token
+    under ``'bulkApplied'`` in its value. After that the request is not sent again while it keeps
+    being passed, also not to a remounted frontend. A request left out of a rerun is forgotten,
+    passing it again later moves the cards again.
+    """
+    reported = set(value.get('bulkApplied') or ()) if isinstance(value, dict) else set()
+    passed = {request['request'] for request in requests}
+    state["applied"] = {request_id for request_id in state["applied"] if request_id in passed}
+    state["applied"].update(request_id for request_id, token in state["pending"].items()
+                            if token in reported and request_id in passed)
+    pending = {}
+    sent = []
+    for request in requests:
+        request_id = request['request']
+        if request_id in state["applied"] or request_id in pending:
+            continue
+        token = state["pending"].get(request_id)
+        if token is None:
+            state["count"] += 1
+            token = f"{request_id}:{state['count']}"
+        pending[request_id] = token
+        sent.append(dict(request, request=token))
+    state["pending"] = pending
+    return sent
+
+
 def kanban_board(columns,
                  horizontal_alignment: str = 'left',
                  vertical_alignment: str = 'top',
@@ -36,17 +212,53 @@ def kanban_board(columns,
                  rename_categories: str = 'none', # 'none', 'new_only', 'all'
                  new_category_title: str = 'New Category',
                  key=None,
-                 font_file_name: str = ''
+                 font_file_name: str = '',
+                 virtualize_after: int | None = None,
+                 virtual_column_height: int = 600,
+                 commit: str = 'immediate', # 'immediate', 'debounce', 'manual'
+                 debounce_ms: int = 500,
+                 save_label: str = 'Save',
+                 delta: bool = False,
+                 revision: str | int | None = None,
+                 group_by: str | None = None,
+                 id_column: str = 'id',
+                 title_column: str = 'title',
+                 help_column: str | None = None,
+                 categories: list | None = None,
+                 profile: bool = False,
+                 multi_select: bool = False,
+                 bulk_move: dict | list | None = None,
+                 search: bool = False,
+                 search_placeholder: str = 'Search cards',
+                 persist=None,
+                 snapshot_every: int = 100,
+                 shared=None,
+                 on_change=None,
+                 args: tuple | None = None,
+                 kwargs: dict | None = None,
+                 effects=None,
+                 ranked: bool = False
                  ):
     """Create a kanban board component.
 
     Parameters
     ----------
-    columns: list
-        List of dictionaries containing column data. Each dictionary should have:
+    columns: list | Board | dict
+        A :class:`Board`, or a list of dictionaries containing column data. Each dictionary should have:
         - 'title': str - The column title
         - 'cards': list - List of card dictionaries with 'id', 'title', and optional 'help'
         - 'is_main_column': bool (optional) - Whether this column should use main column min dimensions
+        - 'id': str (optional) - Stable id of the column. The frontend matches columns by id across
+          reruns and renames, columns without one are identified by their position. Categories
+          created on the board get a generated id.
+        Entries can also be :class:`PagedColumn` objects, which load their cards a page at a time
+        from a data source (requires a ``key``).
+        A DataFrame (pandas, pyarrow or polars) with one row per card can be passed instead, see
+        ``group_by``.
+        A dict of lane name -> list of columns (or :class:`Board`) draws the lanes as swimlanes in
+        a single component, cards can be moved across lanes. The returned dict then has a
+        ``'lanes'`` entry (lane name -> columns) instead of ``'columns'``. Column ids must be
+        unique across lanes, a ValueError is raised otherwise.
     horizontal_alignment: 'left' | 'center' | 'right' | 'distribute'
         Horizontal alignment of the board. Default is 'left'.
     vertical_alignment: 'top' | 'center' | 'bottom' | 'distribute'
@@ -84,14 +296,267 @@ def kanban_board(columns,
         Default title for newly created categories. Default is 'New Category'.
     key: str or None
         Streamlit key for the component
+    font_file_name: str
+        Font to use instead of the theme font, served from the app's ``static`` folder. Without an
+        extension the first of ``.woff2``, ``.woff``, ``.ttf`` and ``.otf`` found there is used.
+    virtualize_after: int | None
+        Columns with more cards than this (e.g. 100) scroll inside a fixed height and only mount
+        the cards in view. Stacked columns always mount just the cards they show, whatever this
+        is. Default is None, columns are drawn in full.
+    virtual_column_height: int
+        Height in pixels of the scrolling area of virtualized columns. Default is 600.
+    commit: str
+        When board changes are sent back to Streamlit, each send triggers a script rerun:
+        - 'immediate': After every change
+        - 'debounce': Once no change happened for ``debounce_ms`` milliseconds
+        - 'manual': When the user clicks a Save button, sending all pending changes at once
+        Only the user's own drops and renames wait. Loaded pages, other sessions' changes and
+        ``bulk_move`` moves are sent straight away, unless user edits are waiting, then they
+        go with them. A resync the frontend is asked for also waits for the edits.
+    debounce_ms: int
+        Quiet period used by ``commit='debounce'``. Default is 500.
+    save_label: str
+        Label of the Save button shown with ``commit='manual'``. Default is 'Save'.
+    delta: bool
+        Whether the frontend should send compact, sequence-numbered operations instead of the
+        whole board after every change. The operations are applied to a board cached in
+        session state, so this requires a ``key``. Default is False.
+    revision: str | int | None
+        Version tag of ``columns``. When it matches the revision sent on the previous rerun for
+        the same ``key``, the columns are not sent to the frontend again. Without it a content
+        hash of ``columns`` is computed on every rerun, which reads the whole board (about 9 ms
+        for 10k cards), so pass one for large boards, e.g. a database version or last update
+        time. Ignored when ``key`` is None.
+    group_by: str | None
+        When ``columns`` is a DataFrame, the name of the column holding each card's board column
+        title. The DataFrame is sent as Arrow and grouped by the frontend. Use
+        :func:`to_dataframe` to map the returned board back onto the DataFrame.
+    id_column: str
+        DataFrame column holding the card ids. Default is 'id'.
+    title_column: str
+        DataFrame column holding the card titles. Default is 'title'.
+    help_column: str | None
+        DataFrame column holding the card help text. Default is None.
+    categories: list | None
+        Board column titles in order when ``columns`` is a DataFrame, so empty columns can be
+        shown. Groups not listed are added after them. Defaults to the groups in order of first
+        appearance.
+    profile: bool
+        Whether to time the board. The returned dict gets a ``'profile'`` entry with a
+        ``'frontend'`` part (initial render, drops, frame height updates, font load, value round
+        trip and payload size, each as count / last / mean / max) and a ``'python'`` part (time
+        spent building the arguments and in the component call, and the size of the board
+        sent). Default is False.
+    multi_select: bool
+        Whether cards can be selected with ctrl / cmd click (toggle), shift click (range) and a
+        select all button on each column, and dragged together. A bulk drag is one board change,
+        sent to Streamlit once. Default is False.
+    bulk_move: dict | list | None
+        Move cards on the board from Python, one dict or a list of them, each with:
+        - 'to': str - Id (or title) of the column to move the cards to
+        - 'cards': list (optional) - Ids of the cards to move
+        - 'match': dict (optional) - Move every card whose fields equal these values, e.g.
+          ``{'help': 'duplicate'}``
+        - 'from': str (optional) - Only move cards from this column (id or title)
+        - 'request': str (optional) - Id of the move. A move is applied once while it keeps
+          being passed, so a move passed on every rerun runs once, also across remounts of the
+          frontend. Left out for a rerun and passed again, it runs again. Defaults to a hash of
+          the move.
+        All the moves of a rerun are applied by the frontend as one board change. Requires a
+        ``key``.
+    search: bool
+        Whether to show a search box above the board. It filters the cards by the words of their
+        title and help text (matching word starts) and highlights the matches, without a rerun.
+        Default is False.
+    search_placeholder: str
+        Placeholder text of the search box. Default is 'Search cards'.
+    persist: MemoryStore | SQLiteStore | None
+        Store the board is saved to under ``key``, as a log of the operations of every rerun
+        plus a snapshot every ``snapshot_every`` operations. The first rerun of a session loads
+        the board from the store, ``columns`` is only used while the store has nothing for
+        ``key``. One session writes to a key at a time, a session whose board another one has
+        saved over since it loaded raises ``persistence.LogConflict`` (use ``shared`` for boards
+        edited together). Requires ``delta=True`` and a list of columns (or lanes) without
+        :class:`PagedColumn`. Default is None.
+    snapshot_every: int
+        Operations between two snapshots of a persisted board. Default is 100.
+    shared: SharedBoards | None
+        Process-wide boards (create them once, e.g. with ``st.cache_resource``) every session
+        showing ``key`` commits its changes to. Changes are versioned, a change to a card or
+        column title another session changed first is rejected, and each rerun brings the board
+        up to date with the other sessions. The returned dict gets ``'version'`` and
+        ``'conflicts'`` (the rejected operations) entries. Requires ``delta=True`` and a list of
+        columns (or lanes) without :class:`PagedColumn`, use ``SharedBoards(store=...)`` rather
+        than ``persist`` to save shared boards. Default is None.
+    on_change: callable | None
+        Called with ``*args`` and ``**kwargs`` when a rerun brings a change made on the board
+        (moves, renames, new columns). Unlike Streamlit widget callbacks it doesn't run before
+        the script: it runs inside this ``kanban_board`` call, after the script code above it
+        and before the call returns, and its exceptions are raised from here. Requires a
+        ``key``. Default is None.
+    args: tuple | None
+        Positional arguments for ``on_change``. Default is None.
+    kwargs: dict | None
+        Keyword arguments for ``on_change``. Default is None.
+    effects: SideEffectQueue | None
+        Queue the card moves of each change are submitted to (as :class:`CardMove` tuples), to
+        be handled in background threads instead of slowing down the rerun. Requires a ``key``.
+        Default is None.
+    ranked: bool
+        Whether cards carry a ``'rank'`` string, sorting in card order within their column, in
+        ``columns`` and in the returned board. Cards without one get a rank between their
+        neighbours', and a moved card gets a new rank between its new neighbours', so a move
+        changes the rank of one card only (see :mod:`streamlit_kanban_os.ranks`). Cards of pages
+        loaded later for a :class:`PagedColumn` get a rank once they are moved. Default is False.
 
     Returns
     -------
     dict
-        The current state of the kanban board
+        The current state of the kanban board. With ``delta=True`` the dict also has an
+        ``'ops'`` entry with the operations applied during this rerun.
     """
-    return _component_func(
-        columns=columns,
+    started = time.perf_counter()
+    if commit not in ('immediate', 'debounce', 'manual'):
+        raise ValueError(f"commit must be 'immediate', 'debounce' or 'manual', got {commit!r}")
+
+    if _LEGACY_FRONTEND:
+        unsupported = _legacy_options(columns, {
+            'commit': commit != 'immediate', 'delta': delta, 'persist': persist is not None,
+            'shared': shared is not None, 'profile': profile, 'multi_select': multi_select,
+            'bulk_move': bulk_move is not None, 'search': search, 'ranked': ranked,
+            'virtualize_after': virtualize_after is not None,
+        })
+        if unsupported:
+            raise RuntimeError(f"kanban_board({', '.join(unsupported)}) needs a newer frontend build than the "
+                               f"installed one. {_REBUILD_HINT}")
+
+    lane_names = None
+    if lanes.is_lanes(columns):
+        columns, column_lanes, lane_names = lanes.flatten(columns)
+
+    if isinstance(columns, Board):
+        columns = columns.to_columns()
+
+    data = None
+    data_columns = None
+    if dataframe.is_dataframe(columns):
+        if group_by is None:
+            raise ValueError("kanban_board with a DataFrame requires group_by")
+        data, categories = dataframe.frame_payload(columns, group_by, id_column, title_column,
+                                                   help_column, categories)
+        data_columns = {'id': id_column, 'title': title_column, 'help': help_column, 'group': group_by}
+        columns = None
+
+    page = None
+    page_state = None
+    if columns is not None and any(isinstance(column, PagedColumn) for column in columns):
+        if key is None:
+            raise ValueError("kanban_board with PagedColumn columns requires a key to cache pages between reruns")
+        page_state = st.session_state.setdefault(f"_kanban_board_pages_{key}", paging.new_state())
+        # Widget values can be read before the widget is drawn, so a page asked for by the
+        # frontend is served in the same rerun
+        previous_value = st.session_state.get(key)
+        request = previous_value.get('loadMore') if isinstance(previous_value, dict) else None
+        columns, page = paging.prepare(columns, page_state, request)
+
+    if lane_names is not None:
+        columns = lanes.tag(columns, column_lanes)
+
+    if ranked and columns is not None:
+        columns = ranks.fill(columns)
+
+    board_log = None
+    if persist is not None:
+        if key is None or not delta:
+            raise ValueError("kanban_board(persist=...) requires a key and delta=True")
+        if data is not None or page_state is not None:
+            raise ValueError("kanban_board(persist=...) does not support DataFrames or PagedColumn columns")
+        log_key = f"_kanban_board_persist_{key}"
+        if log_key not in st.session_state:
+            board_log = persistence.BoardLog(persist, key, snapshot_every)
+            st.session_state[f"_kanban_board_delta_{key}"] = deltas.new_state(board_log.load(columns))
+            st.session_state[log_key] = board_log
+        board_log = st.session_state[log_key]
+        # the stored board wins, it only has to be sent again to a fresh frontend mount
+        columns = st.session_state[f"_kanban_board_delta_{key}"]["columns"]
+        if revision is None:
+            revision = "persist"
+
+    shared_update = None
+    if shared is not None:
+        if key is None or not delta:
+            raise ValueError("kanban_board(shared=...) requires a key and delta=True")
+        if persist is not None:
+            raise ValueError("kanban_board(shared=...) is persisted with SharedBoards(store=...), not persist")
+        if data is not None or page_state is not None:
+            raise ValueError("kanban_board(shared=...) does not support DataFrames or PagedColumn columns")
+        state_key = f"_kanban_board_delta_{key}"
+        if state_key not in st.session_state:
+            version, shared_columns = shared.checkout(key, columns)
+            st.session_state[state_key] = dict(deltas.new_state(shared_columns), version=version)
+        # Committed before the widget is drawn, so other sessions' changes reach the frontend
+        # in this rerun
+        shared_ops, shared_update, conflicts = sharing.sync_session(
+            shared, key, st.session_state[state_key], st.session_state.get(key))
+        columns = st.session_state[state_key]["columns"]
+        if revision is None:
+            revision = "shared"
+
+    # Skip re-sending (and re-reconciling) a board the frontend already has
+    sent_columns = columns
+    sent_data = data
+    if key is not None:
+        if revision is not None:
+            revision = str(revision)
+        elif data is not None:
+            revision = dataframe.frame_revision(data, categories)
+        else:
+            revision = _board_revision(columns)
+        revision_state = st.session_state.setdefault(f"_kanban_board_revision_{key}", {})
+        if revision_state.get("revision") == revision and not _LEGACY_FRONTEND:
+            sent_columns = None
+            sent_data = None
+        revision_state["revision"] = revision
+    else:
+        revision = None
+
+    if delta:
+        if key is None:
+            raise ValueError("kanban_board(delta=True) requires a key to cache the board between reruns")
+        state_key = f"_kanban_board_delta_{key}"
+        if state_key not in st.session_state:
+            # with a DataFrame the frontend's first snapshot fills the cache
+            st.session_state[state_key] = deltas.new_state(columns if columns is not None else [])
+        delta_state = st.session_state[state_key]
+        previous_columns = delta_state["columns"]
+        # operations name columns by position, the moves handed to effects also by id
+        column_ids = [column.get("id") for column in previous_columns]
+        if shared is not None:
+            # as committed to the shared board, naming their columns by id, the cache is already
+            # past them
+            ops = shared_ops
+            column_ids = None
+        else:
+            # The value that triggered this rerun can be read before the widget is drawn, applied
+            # now the ack sent with it covers its operations and the frontend can drop them
+            ops = _sync_delta(delta_state, st.session_state.get(key), page_state)
+
+    bulk_moves = _bulk_move_requests(bulk_move)
+    bulk_key = f"_kanban_board_bulk_{key}"
+    if bulk_moves is not None and key is None:
+        raise ValueError("kanban_board(bulk_move=...) requires a key to apply each move once")
+    if key is not None and (bulk_moves is not None or bulk_key in st.session_state):
+        bulk_state = st.session_state.setdefault(bulk_key, {"pending": {}, "applied": set(), "count": 0})
+        bulk_moves = _bulk_moves_to_send(bulk_state, bulk_moves or [], st.session_state.get(key))
+
+    called = time.perf_counter()
+    value = _component_func(
+        columns=sent_columns,
+        revision=revision,
+        data=sent_data,
+        dataColumns=data_columns,
+        categories=categories if data is not None else None,
+        page=page,
         horizontal_alignment=horizontal_alignment,
         vertical_alignment=vertical_alignment,
         horizontal=horizontal,
@@ -109,5 +574,73 @@ def kanban_board(columns,
         renameCategories=rename_categories,
         newCategoryTitle=new_category_title,
         debug_font=debug_font,
-        font_file_name=font_file_name
+        font_file_name=font_file_name,
+        fontFile=_resolve_font_file(font_file_name),
+        virtualizeAfter=virtualize_after,
+        virtualColumnHeight=virtual_column_height,
+        commit=commit,
+        debounceMs=debounce_ms,
+        saveLabel=save_label,
+        delta=delta,
+        deltaAck=deltas.ack(delta_state) if delta else None,
+        deltaResync=delta_state["resync"] if delta else None,
+        profile=profile,
+        multiSelect=multi_select,
+        bulkMoves=bulk_moves,
+        search=search,
+        searchPlaceholder=search_placeholder,
+        lanes=lane_names,
+        shared=shared_update,
+        ranked=ranked
     )
+
+    if profile:
+        python_stats = {
+            'build_ms': round((called - started) * 1000, 2),
+            'component_ms': round((time.perf_counter() - called) * 1000, 2),
+            'payload_bytes': _payload_bytes(sent_columns, sent_data),
+        }
+
+    if isinstance(value, dict) and 'needsColumns' in value:
+        # A fresh frontend mounted while we skipped the columns, send them on the next run
+        if key is not None and revision_state.get("needs_columns") != value['needsColumns']:
+            revision_state["needs_columns"] = value['needsColumns']
+            revision_state.pop("revision", None)
+            st.rerun()
+        value = None
+
+    frontend_stats = value.get('profile', {}) if isinstance(value, dict) else {}
+    if isinstance(value, dict) and ('loadMore' in value or 'bulkApplied' in value):
+        # the page request was served and the applied moves noted above, they are not part of the board
+        value = {name: field for name, field in value.items() if name not in ('loadMore', 'bulkApplied')}
+    if delta:
+        if shared is None:
+            # usually the value already applied above, unless the component returned a newer one
+            ops = ops + _sync_delta(delta_state, value, page_state)
+        if board_log is not None:
+            if ops:
+                board_log.record(ops, delta_state["columns"])
+            elif delta_state["columns"] is not previous_columns and delta_state["columns"] != previous_columns:
+                # a resync snapshot brought changes the operations missed
+                board_log.snapshot(delta_state["columns"])
+        value = {"columns": delta_state["columns"], "ops": ops}
+        if shared is not None:
+            value.update(version=delta_state["version"], conflicts=conflicts)
+    if on_change is not None or effects is not None:
+        if key is None:
+            raise ValueError("kanban_board(on_change=..., effects=...) requires a key to spot changes between reruns")
+        change_state = st.session_state.setdefault(f"_kanban_board_change_{key}", {"columns": columns})
+        changed, moves = side_effects.detect_change(
+            change_state, value.get('columns') if isinstance(value, dict) else None, ops if delta else None,
+            column_ids if delta else None)
+        if moves and effects is not None:
+            effects.submit(moves)
+        if changed and on_change is not None:
+            on_change(*(args or ()), **(kwargs or {}))
+    if lane_names is not None and isinstance(value, dict) and value.get('columns') is not None:
+        value = dict(value)
+        value['lanes'] = lanes.group(value.pop('columns'), lane_names)
+    if profile and isinstance(value, dict):
+        # a copy, the component value itself stays as the frontend sent it
+        value = dict(value, profile={'frontend': frontend_stats, 'python': python_stats})
+    return value
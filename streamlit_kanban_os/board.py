@@ -0,0 +1,360 @@
+"""Indexed Python model of a kanban board.
+
+``kanban_board`` takes and returns plain lists of column dicts. :class:`Board`
+wraps the same data in compact ``__slots__`` records and keeps an
+id -> column and id -> position index, so questions like "which column is
+card 123 in?" are dictionary lookups. :meth:`Board.diff` still reads every
+card of both boards, but only works out moves in the columns whose card order
+changed.
+"""
+from bisect import bisect_left
+from operator import attrgetter
+from typing import NamedTuple
+
+from . import deltas
+from .ranks import RANK_KEY
+
+_card_id = attrgetter("id")
+
+_CARD_KEYS = ("id", "title", "help")
+_COLUMN_KEYS = ("id", "title", "cards", "is_main_column", "isNewColumn")
+
+
+class Card:
+    """A single card. Keys other than ``id``, ``title`` and ``help`` are kept in ``extra``."""
+
+    __slots__ = ("id", "title", "help", "extra")
+
+    def __init__(self, id, title, help=None, extra=None):
+        self.id = id
+        self.title = title
+        self.help = help
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {k: v for k, v in data.items() if k not in _CARD_KEYS} or None
+        return cls(data["id"], data.get("title", ""), data.get("help"), extra)
+
+    def to_dict(self):
+        data = {"id": self.id, "title": self.title}
+        if self.help is not None:
+            data["help"] = self.help
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self):
+        return f"Card(id={self.id!r}, title={self.title!r})"
+
+
+class Column:
+    """A column of cards. Keys the board doesn't know about are kept in ``extra``."""
+
+    __slots__ = ("id", "title", "cards", "is_main_column", "is_new_column", "extra")
+
+    def __init__(self, title, cards=None, is_main_column=False, is_new_column=False, extra=None, id=None):
+        self.id = id
+        self.title = title
+        self.cards = cards if cards is not None else []
+        self.is_main_column = is_main_column
+        self.is_new_column = is_new_column
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, data):
+        extra = {k: v for k, v in data.items() if k not in _COLUMN_KEYS} or None
+        return cls(
+            data["title"],
+            [Card.from_dict(card) for card in data.get("cards", [])],
+            bool(data.get("is_main_column", False)),
+            bool(data.get("isNewColumn", False)),
+            extra,
+            data.get("id"),
+        )
+
+    def to_dict(self):
+        data = {"title": self.title, "cards": [card.to_dict() for card in self.cards]}
+        if self.id is not None:
+            data["id"] = self.id
+        if self.is_main_column:
+            data["is_main_column"] = True
+        if self.is_new_column:
+            data["isNewColumn"] = True
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def card_ids(self):
+        return tuple(map(_card_id, self.cards))
+
+    def __repr__(self):
+        return f"Column(title={self.title!r}, cards={len(self.cards)})"
+
+
+class CardMove(NamedTuple):
+    """A card that changed column, or changed order within its column.
+
+    Columns are given by index and by ``id`` (None for columns without one), positions are
+    indexes within the column.
+    """
+
+    card_id: object
+    from_column: int
+    from_position: int
+    to_column: int
+    to_position: int
+    from_column_id: object = None
+    to_column_id: object = None
+
+
+class BoardDiff(NamedTuple):
+    """Result of :meth:`Board.diff`."""
+
+    moves: list
+    renamed: list  # (column index, old title, new title)
+    created: list  # indexes of columns that only exist in the new board
+
+    def __bool__(self):
+        return bool(self.moves or self.renamed or self.created)
+
+
+class Board:
+    """A kanban board with O(1) card lookup.
+
+    Build one from the ``kanban_board`` list-of-dicts format with
+    :meth:`from_columns` (or :meth:`from_value` for the component's return
+    value) and pass it straight to ``kanban_board``, which accepts a
+    :class:`Board` anywhere it accepts ``columns``.
+    """
+
+    __slots__ = ("columns", "_column_of", "_position_of")
+
+    def __init__(self, columns=None):
+        self.columns = columns if columns is not None else []
+        self._reindex()
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Build a board from a list of column dicts, raising ``ValueError`` on duplicate card ids."""
+        return cls([Column.from_dict(column) for column in columns])
+
+    @classmethod
+    def from_value(cls, value):
+        """Build a board from the value returned by ``kanban_board`` (``None`` gives an empty board)."""
+        return cls.from_columns(value["columns"] if value else [])
+
+    def to_columns(self):
+        """Return the board in the list-of-dicts format ``kanban_board`` takes."""
+        return [column.to_dict() for column in self.columns]
+
+    def _reindex(self):
+        column_of = {}
+        position_of = {}
+        total = 0
+        for column_index, column in enumerate(self.columns):
+            ids = column.card_ids()
+            column_of.update(dict.fromkeys(ids, column_index))
+            position_of.update(zip(ids, range(len(ids))))
+            total += len(ids)
+        if len(column_of) != total:
+            seen = set()
+            duplicates = {card_id for column in self.columns for card_id in column.card_ids()
+                          if card_id in seen or seen.add(card_id)}
+            raise ValueError(f"Duplicate card ids on the board: {sorted(map(str, duplicates))}")
+        self._column_of = column_of
+        self._position_of = position_of
+
+    def _shift_positions(self, column_index, start):
+        cards = self.columns[column_index].cards
+        for position in range(start, len(cards)):
+            self._position_of[cards[position].id] = position
+
+    def __contains__(self, card_id):
+        return card_id in self._column_of
+
+    def __len__(self):
+        return len(self._column_of)
+
+    def column_of(self, card_id):
+        """Index of the column holding ``card_id``."""
+        return self._column_of[card_id]
+
+    def position_of(self, card_id):
+        """Position of ``card_id`` within its column."""
+        return self._position_of[card_id]
+
+    def card(self, card_id):
+        """The :class:`Card` with id ``card_id``."""
+        return self.columns[self._column_of[card_id]].cards[self._position_of[card_id]]
+
+    def move(self, card_id, to_column, index=None):
+        """Move ``card_id`` to ``to_column`` at ``index`` (the end when ``None``)."""
+        from_column = self._column_of[card_id]
+        from_position = self._position_of[card_id]
+        card = self.columns[from_column].cards.pop(from_position)
+        target = self.columns[to_column].cards
+        if index is None:
+            index = len(target)
+        target.insert(index, card)
+        self._column_of[card_id] = to_column
+        # only the cards after the touched positions change place
+        if from_column == to_column:
+            self._shift_positions(to_column, min(index, from_position))
+        else:
+            self._shift_positions(from_column, from_position)
+            self._shift_positions(to_column, min(index, len(target) - 1))
+        return card
+
+    def move_many(self, card_ids, to_column, index=None):
+        """Move several cards to ``to_column`` at ``index`` (the end when ``None``), in the order given.
+
+        Each column the cards leave is rebuilt once, so moving a whole selection costs about
+        the same as moving one card.
+        """
+        card_ids = list(card_ids)
+        cards = [self.card(card_id) for card_id in card_ids]
+        first_removed = {}
+        for card_id in card_ids:
+            column_index = self._column_of[card_id]
+            first_removed[column_index] = min(first_removed.get(column_index, self._position_of[card_id]),
+                                              self._position_of[card_id])
+        moving = set(card_ids)
+        for column_index in first_removed:
+            column = self.columns[column_index]
+            column.cards[:] = [card for card in column.cards if card.id not in moving]
+        target = self.columns[to_column].cards
+        if index is None:
+            index = len(target)
+        target[index:index] = cards
+        self._column_of.update(dict.fromkeys(card_ids, to_column))
+        for column_index, start in first_removed.items():
+            if column_index != to_column:
+                self._shift_positions(column_index, start)
+        self._shift_positions(to_column, min(index, first_removed.get(to_column, index)))
+        return cards
+
+    def add_column(self, title, index=None, is_new_column=False, id=None, extra=None):
+        """Insert an empty column, shifting the column index of the ones after it."""
+        if index is None:
+            index = len(self.columns)
+        self.columns.insert(index, Column(title, is_new_column=is_new_column, extra=extra, id=id))
+        if index < len(self.columns) - 1:
+            for column_index in range(index + 1, len(self.columns)):
+                self._column_of.update(dict.fromkeys(self.columns[column_index].card_ids(), column_index))
+        return self.columns[index]
+
+    def append_cards(self, column_index, cards):
+        """Add card dicts or :class:`Card` records to the end of a column."""
+        column = self.columns[column_index]
+        for card in cards:
+            card = card if isinstance(card, Card) else Card.from_dict(card)
+            if card.id in self._column_of:
+                raise ValueError(f"Duplicate card ids on the board: [{str(card.id)!r}]")
+            self._column_of[card.id] = column_index
+            self._position_of[card.id] = len(column.cards)
+            column.cards.append(card)
+
+    def apply_ops(self, ops, pages=None):
+        """Apply delta mode operations (see :mod:`streamlit_kanban_os.deltas`) using the index.
+
+        ``pages`` maps request ids to the cards served for paged columns and is only needed for
+        ``append`` operations.
+        """
+        for op in ops:
+            kind = op.get("type")
+            if kind == deltas.MOVE:
+                card = self.move(op["card"], op["to"], op["index"])
+                if op.get("rank") is not None:
+                    card.extra = dict(card.extra or {}, **{RANK_KEY: op["rank"]})
+            elif kind == deltas.RENAME:
+                self.columns[op["column"]].title = op["title"]
+            elif kind == deltas.CREATE:
+                lane = op.get("lane")
+                self.add_column(op["title"], op["column"], is_new_column=True, id=op.get("id"),
+                                extra={"lane": lane} if lane is not None else None)
+            elif kind == deltas.BULK_MOVE:
+                cards = self.move_many(op["cards"], op["to"], op["index"])
+                for card, rank in zip(cards, op.get("ranks") or ()):
+                    card.extra = dict(card.extra or {}, **{RANK_KEY: rank})
+            elif kind == deltas.APPEND:
+                self.append_cards(op["column"], deltas.page_cards(op, pages))
+            else:
+                raise ValueError(f"Unknown board operation type: {kind!r}")
+        return self
+
+    def diff(self, other):
+        """Changes that turn this board into ``other``, with as few moves as possible.
+
+        Columns are matched by position. Building ``other`` and comparing the card ids of each
+        pair of columns reads every card, so a diff costs O(total cards) however small the
+        change. Only columns whose card order differs are looked at further: cards that stayed
+        in the column only count as moved when they are not part of the longest run that kept
+        its relative order (O(n log n) per column). In delta mode the operations of a rerun
+        give its moves without a diff (see :func:`effects.moves_from_ops`).
+
+        Parameters
+        ----------
+        other: Board | list | dict
+            The newer board, as a :class:`Board`, a list of column dicts or a component value.
+
+        Returns
+        -------
+        BoardDiff
+        """
+        if not isinstance(other, Board):
+            other = Board.from_value(other) if isinstance(other, dict) else Board.from_columns(other)
+
+        moves = []
+        renamed = []
+        created = list(range(len(self.columns), len(other.columns)))
+        for column_index, new_column in enumerate(other.columns):
+            new_ids = new_column.card_ids()
+            if column_index < len(self.columns):
+                old_column = self.columns[column_index]
+                if old_column.title != new_column.title:
+                    renamed.append((column_index, old_column.title, new_column.title))
+                if old_column.card_ids() == new_ids:
+                    continue
+
+            stayed = []
+            for position, card_id in enumerate(new_ids):
+                old_column_index = self._column_of.get(card_id)
+                if old_column_index == column_index:
+                    stayed.append(position)
+                elif old_column_index is not None:
+                    moves.append(CardMove(card_id, old_column_index, self._position_of[card_id],
+                                          column_index, position, self.columns[old_column_index].id,
+                                          new_column.id))
+            in_order = _longest_increasing([self._position_of[new_ids[p]] for p in stayed])
+            for i, position in enumerate(stayed):
+                if i not in in_order:
+                    card_id = new_ids[position]
+                    moves.append(CardMove(card_id, column_index, self._position_of[card_id],
+                                          column_index, position, new_column.id, new_column.id))
+        return BoardDiff(moves, renamed, created)
+
+    def __repr__(self):
+        return f"Board(columns={len(self.columns)}, cards={len(self)})"
+
+
+def _longest_increasing(values):
+    """Indexes of one longest strictly increasing subsequence of ``values`` (O(n log n))."""
+    tails = []  # values ending the best run of each length
+    tail_index = []
+    previous = [-1] * len(values)
+    for i, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_index.append(i)
+        else:
+            tails[length] = value
+            tail_index[length] = i
+        previous[i] = tail_index[length - 1] if length else -1
+    result = set()
+    i = tail_index[-1] if tail_index else -1
+    while i != -1:
+        result.add(i)
+        i = previous[i]
+    return result
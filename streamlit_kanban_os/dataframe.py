@@ -0,0 +1,124 @@
+"""DataFrame input and output for ``kanban_board``.
+
+Instead of building a list of column dicts row by row, pass a DataFrame and
+the names of its id, title, help and group columns. Only those columns are
+sent, as an Arrow table, and the frontend groups the rows into columns.
+:func:`to_dataframe` maps the returned board back onto the DataFrame.
+
+Rows without a group (None / NaN) are shown in a column titled
+:data:`MISSING_GROUP`, and get a missing group back from :func:`to_dataframe`.
+"""
+import hashlib
+
+MISSING_GROUP = '(no group)'
+
+
+def is_dataframe(data):
+    """Whether ``data`` is a pandas DataFrame or something with ``to_pandas`` (pyarrow, polars)."""
+    return hasattr(data, 'to_pandas') or (hasattr(data, 'columns') and hasattr(data, 'loc'))
+
+
+def frame_payload(data, group_by, id_column='id', title_column='title', help_column=None, categories=None):
+    """Select and cast the columns the board needs, without touching individual rows.
+
+    Parameters
+    ----------
+    data: pandas.DataFrame | pyarrow.Table | polars.DataFrame
+        One row per card.
+    group_by: str
+        Column holding the title of the board column each card belongs to.
+    id_column, title_column: str
+        Columns holding the card ids and titles.
+    help_column: str | None
+        Optional column holding the card help text.
+    categories: list | None
+        Board column titles, in order. Groups not listed are added after them. Defaults to the
+        groups in order of first appearance.
+
+    Returns
+    -------
+    tuple
+        The trimmed pandas DataFrame (ids, titles and groups as strings) and the category list.
+
+    Raises
+    ------
+    ValueError
+        When a card id is missing.
+    """
+    import pandas as pd
+
+    # the same column may serve as, say, id and title
+    names = list(dict.fromkeys([id_column, title_column, group_by] + ([help_column] if help_column else [])))
+    if hasattr(data, 'loc'):
+        frame = data.loc[:, names]
+    else:
+        frame = data.select(names).to_pandas()
+    frame = frame.reset_index(drop=True)
+    if frame[id_column].isna().any():
+        raise ValueError(f"kanban_board: the {id_column!r} column has rows without a card id")
+    # cast to str, missing values would become 'nan' / 'None'
+    frame[group_by] = frame[group_by].astype(object).where(frame[group_by].notna(), MISSING_GROUP)
+    frame[title_column] = frame[title_column].astype(object).where(frame[title_column].notna(), '')
+    frame = frame.astype({id_column: str, title_column: str, group_by: str})
+    if categories is None:
+        categories = pd.unique(frame[group_by]).tolist()
+    else:
+        categories = [str(category) for category in categories]
+    return frame, categories
+
+
+def frame_revision(frame, categories):
+    """Content hash of a payload built by :func:`frame_payload`."""
+    import pandas as pd
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    digest.update('\x1f'.join(map(str, frame.columns)).encode())
+    digest.update('\x1f'.join(map(str, categories)).encode())
+    return digest.hexdigest()
+
+
+def to_dataframe(value, data, group_by, id_column='id', position_column=None):
+    """Return a copy of ``data`` with ``group_by`` set to the board column each card is in.
+
+    Parameters
+    ----------
+    value: dict | list | Board | None
+        The value returned by ``kanban_board``, its ``'columns'`` list, or a :class:`Board`.
+        With None ``data`` is returned unchanged (as a copy).
+    data: pandas.DataFrame
+        The DataFrame the board was built from.
+    group_by: str
+        The group column to update.
+    id_column: str
+        Column holding the card ids.
+    position_column: str | None
+        When given, this column is set to each card's position within its board column.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    result = data.copy()
+    if value is None:
+        return result
+
+    group_of = {}
+    position_of = {}
+    if hasattr(value, 'to_columns'):
+        value = value.to_columns()
+    columns = value['columns'] if isinstance(value, dict) else value
+    for column in columns:
+        title = column['title']
+        for position, card in enumerate(column['cards']):
+            group_of[str(card['id'])] = title
+            position_of[str(card['id'])] = position
+
+    ids = result[id_column].astype(str)
+    groups = ids.map(group_of)
+    # the column of rows without a group gives them a missing group again
+    groups = groups.where(groups != MISSING_GROUP, None)
+    result[group_by] = groups.where(ids.isin(list(group_of)), result[group_by].astype(object))
+    if position_column:
+        result[position_column] = ids.map(position_of)
+    return result
@@ -0,0 +1,229 @@
+"""Operation log used by ``kanban_board(delta=True)``.
+
+Instead of sending the whole board back after every change, the frontend
+sends the operations it applied since the last value Python acknowledged:
+
+- ``{"seq": 4, "type": "move", "card": "12", "from": 0, "fromIndex": 3, "to": 2, "index": 0}``
+- ``{"seq": 5, "type": "rename", "column": 2, "title": "Blocked"}``
+- ``{"seq": 6, "type": "create", "column": 3, "title": "New Category", "id": "k2-new-1"}``
+  (with a ``"lane"`` entry when the board has swimlanes)
+- ``{"seq": 7, "type": "append", "column": 0, "request": "k2-3", "cards": ["51", "52"], "loaded": 52}``
+- ``{"seq": 8, "type": "bulkMove", "cards": ["3", "9"], "from": [0, 1], "to": 2, "index": 0}``
+
+``append`` adds cards of a page served for a paged column (see
+:mod:`streamlit_kanban_os.paging`) to the end of the column. It only carries
+card ids, the card data is looked up in the pages Python served.
+
+``bulkMove`` moves a selection of cards (or the cards matched by a
+``kanban_board(bulk_move=...)`` request) in one step: the cards, listed in
+board order with the column each one comes from, are taken out of their
+columns and inserted together at ``index`` of column ``to``.
+
+With ``kanban_board(ranked=True)`` a ``move`` also carries the new ``"rank"``
+of the card and a ``bulkMove`` the ``"ranks"`` of its cards, in the same order
+(see :mod:`streamlit_kanban_os.ranks`).
+
+Columns are addressed by their position on the board. ``create`` carries the
+id the frontend generated for the new column. A full snapshot
+(``{"mode": "snapshot", "columns": [...]}``) is only sent on first mount or
+when Python asks for one because the sequence numbers got out of sync.
+"""
+import copy
+
+from .ranks import RANK_KEY
+
+MOVE = "move"
+RENAME = "rename"
+CREATE = "create"
+APPEND = "append"
+BULK_MOVE = "bulkMove"
+
+
+def page_cards(op, pages):
+    """Card dicts referenced by an ``append`` operation, looked up in the served ``pages``."""
+    served = {card["id"]: card for card in (pages or {}).get(op["request"], [])}
+    return [served[card_id] for card_id in op["cards"]]
+
+
+def _editable(columns, index, copied):
+    """``columns[index]`` replaced by a copy the current batch may change, copied once per batch."""
+    column = columns[index]
+    if id(column) not in copied:
+        column = columns[index] = dict(column, cards=list(column["cards"]))
+        copied.add(id(column))
+    return column
+
+
+def _apply(columns, op, pages, copied):
+    kind = op.get("type")
+    if kind == MOVE:
+        source = columns[op["from"]]["cards"]
+        position = op.get("fromIndex")
+        # fromIndex is a hint, fall back to a scan of the source column only
+        if position is None or position >= len(source) or source[position]["id"] != op["card"]:
+            position = next((i for i, card in enumerate(source) if card["id"] == op["card"]), None)
+            if position is None:
+                raise KeyError(f"Card {op['card']!r} is not in column {op['from']}")
+        target = _editable(columns, op["to"], copied)
+        card = _editable(columns, op["from"], copied)["cards"].pop(position)
+        if op.get("rank") is not None:
+            card = dict(card, **{RANK_KEY: op["rank"]})
+        target["cards"].insert(op["index"], card)
+    elif kind == RENAME:
+        _editable(columns, op["column"], copied)["title"] = op["title"]
+    elif kind == CREATE:
+        column = {"title": op["title"], "cards": [], "isNewColumn": True}
+        if op.get("id") is not None:
+            column["id"] = op["id"]
+        if op.get("lane") is not None:
+            column["lane"] = op["lane"]
+        columns.insert(op["column"], column)
+        copied.add(id(column))
+    elif kind == BULK_MOVE:
+        moving = set(op["cards"])
+        sources = set(op["from"])
+        # every card is found before any column changes, so a bad operation takes nothing out
+        taken = {card["id"]: card for source in sources for card in columns[source]["cards"]
+                 if card["id"] in moving}
+        missing = moving.difference(taken)
+        if missing:
+            raise KeyError(f"Cards {sorted(map(str, missing))} are not in columns {sorted(sources)}")
+        # one pass over each source column, however many cards leave it
+        for source in sources:
+            column = _editable(columns, source, copied)
+            column["cards"] = [card for card in column["cards"] if card["id"] not in moving]
+        for card_id, rank in zip(op["cards"], op.get("ranks") or ()):
+            taken[card_id] = dict(taken[card_id], **{RANK_KEY: rank})
+        _editable(columns, op["to"], copied)["cards"][op["index"]:op["index"]] = \
+            [taken[card_id] for card_id in op["cards"]]
+    elif kind == APPEND:
+        column = _editable(columns, op["column"], copied)
+        column["cards"].extend(page_cards(op, pages))
+        column["loaded"] = op.get("loaded", column.get("loaded"))
+    else:
+        raise ValueError(f"Unknown board operation type: {kind!r}")
+
+
+def apply_op(columns, op, pages=None):
+    """Apply a single frontend operation to ``columns`` in place.
+
+    Parameters
+    ----------
+    columns: list
+        Board in the ``kanban_board`` list-of-dicts format.
+    op: dict
+        One operation as sent by the frontend (see module docstring).
+    pages: dict | None
+        Pages served for paged columns, by request id. Only needed for ``append`` operations.
+
+    Returns
+    -------
+    list
+        The same ``columns`` list, for chaining.
+    """
+    return apply_ops(columns, [op], pages)
+
+
+def apply_ops(columns, ops, pages=None):
+    """Apply a list of frontend operations to ``columns`` in place, in order.
+
+    The operations apply all or nothing: when one of them fails (e.g. it moves a card that
+    is not where it says) the error is raised and ``columns`` is left as it was. The column
+    dicts and cards an operation changes are replaced by changed copies, they are never
+    modified themselves.
+
+    Parameters
+    ----------
+    columns: list
+        Board in the ``kanban_board`` list-of-dicts format.
+    ops: list
+        Operations as sent by the frontend.
+    pages: dict | None
+        Pages served for paged columns, by request id. Only needed for ``append`` operations.
+
+    Returns
+    -------
+    list
+        The same ``columns`` list, for chaining.
+    """
+    working = list(columns)
+    copied = set()  # ids of the column dicts this batch made, safe to change
+    for op in ops:
+        _apply(working, op, pages, copied)
+    columns[:] = working
+    return columns
+
+
+def new_state(columns):
+    """Create the per-key cache ``kanban_board`` keeps in session state."""
+    return {
+        "columns": copy.deepcopy(columns),
+        "session": None,  # id of the frontend mount we are following
+        "seq": 0,  # last operation applied
+        "resync": 0,  # bumped to ask the frontend for a fresh snapshot
+        "awaiting_snapshot": False,
+    }
+
+
+def ack(state):
+    """Acknowledgement passed back to the frontend so it can drop sent operations."""
+    if state["session"] is None:
+        return None
+    return {"session": state["session"], "seq": state["seq"]}
+
+
+def sync(state, value, pages=None):
+    """Bring the cached board in ``state`` up to date with a component value.
+
+    Streamlit returns the last component value on every rerun, so replayed
+    snapshots and already applied operations are skipped using the sequence
+    numbers. When operations are missing (or come from an unknown frontend
+    mount) a snapshot is requested and the cached board is left untouched.
+
+    Parameters
+    ----------
+    state: dict
+        Cache created by :func:`new_state`.
+    value: dict | None
+        Value returned by the component.
+    pages: dict | None
+        Pages served for paged columns, by request id.
+
+    Returns
+    -------
+    list
+        Operations newly applied to ``state["columns"]`` by this call.
+    """
+    if not value:
+        return []
+
+    session = value.get("session")
+    seq = value.get("seq", 0)
+
+    if value.get("mode") == "snapshot":
+        if session != state["session"] or seq > state["seq"] or state["awaiting_snapshot"]:
+            state["columns"] = copy.deepcopy(value["columns"])
+            state["session"] = session
+            state["seq"] = seq
+            state["awaiting_snapshot"] = False
+        return []
+
+    if state["awaiting_snapshot"]:
+        return []
+
+    ops = [op for op in value.get("ops", []) if op["seq"] > state["seq"]]
+    if session != state["session"] or (ops and ops[0]["seq"] != state["seq"] + 1):
+        state["resync"] += 1
+        state["awaiting_snapshot"] = True
+        return []
+
+    try:
+        apply_ops(state["columns"], ops, pages)
+    except (KeyError, IndexError, ValueError):
+        # cached board diverged from the frontend (and was left as it was), start over from a snapshot
+        state["resync"] += 1
+        state["awaiting_snapshot"] = True
+        return []
+    if ops:
+        state["seq"] = ops[-1]["seq"]
+    return ops
@@ -0,0 +1,198 @@
+"""Board change callbacks and background side effects.
+
+``kanban_board(on_change=..., args=..., kwargs=...)`` calls back when a rerun
+brings a board change, and ``kanban_board(effects=queue)`` hands the card
+moves of that change to a :class:`SideEffectQueue`. The queue runs slow work
+(database writes, webhooks, audit logs) on a thread pool, so the rerun that
+follows a drop doesn't wait for it.
+
+Moves are :class:`~streamlit_kanban_os.board.CardMove` tuples. They come from
+the operations in delta mode, and from :meth:`Board.diff` of the previous and
+the new board otherwise. Cards of a bulk move have no ``from_position``.
+
+``on_change`` is not a Streamlit widget callback: Streamlit only learns of the
+change when the component value comes back, and the board is only brought up to
+date inside the ``kanban_board`` call. So it runs there, during the rerun, after
+the script code above the board and before ``kanban_board`` returns.
+"""
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from . import deltas
+from .board import Board, CardMove
+
+logger = logging.getLogger(__name__)
+
+
+def moves_from_ops(ops, column_ids=None):
+    """The card moves of a list of delta operations.
+
+    ``column_ids`` are the ids of the columns before the operations, by position, used to give
+    the moves column ids. Operations on a shared board name their columns themselves.
+    """
+    column_ids = list(column_ids or ())
+
+    def column_id(position):
+        return column_ids[position] if 0 <= position < len(column_ids) else None
+
+    moves = []
+    for op in ops:
+        if op["type"] == deltas.MOVE:
+            moves.append(CardMove(op["card"], op["from"], op.get("fromIndex"), op["to"], op["index"],
+                                  op.get("fromId", column_id(op["from"])), op.get("toId", column_id(op["to"]))))
+        elif op["type"] == deltas.BULK_MOVE:
+            to_id = op.get("toId", column_id(op["to"]))
+            from_ids = op.get("fromIds") or [column_id(source) for source in op["from"]]
+            moves.extend(CardMove(card_id, source, None, op["to"], op["index"] + i, from_id, to_id)
+                         for i, (card_id, source, from_id) in enumerate(zip(op["cards"], op["from"], from_ids)))
+        elif op["type"] == deltas.CREATE:
+            column_ids.insert(op["column"], op.get("id"))
+    return moves
+
+
+def detect_change(state, columns, ops=None, column_ids=None):
+    """Whether the board changed since the previous rerun, and the card moves of the change.
+
+    Parameters
+    ----------
+    state: dict
+        Per-key dict kept in session state between reruns.
+    columns: list | None
+        The board as returned on this rerun.
+    ops: list | None
+        Operations applied on this rerun, in delta mode.
+    column_ids: list | None
+        Ids of the columns before ``ops`` were applied, in delta mode.
+
+    Returns
+    -------
+    tuple
+        ``(changed, moves)``.
+    """
+    if ops is not None:
+        return bool(ops), moves_from_ops(ops, column_ids)
+    previous = state.get("columns")
+    if columns is None or columns is previous:
+        return False, []
+    state["columns"] = columns
+    if previous is None or columns == previous:
+        return False, []
+    diff = Board.from_columns(previous).diff(columns)
+    return bool(diff), diff.moves
+
+
+class SideEffectQueue:
+    """Runs ``handler`` on batches of board events in background threads.
+
+    Events are collected into batches of up to ``batch_size``, waiting at most ``batch_wait``
+    seconds for a batch to fill, and at most ``max_workers`` batches run at a time. A batch whose
+    handler raises is retried ``retries`` times with exponential backoff, then logged and kept in
+    :attr:`failed`. Batches may finish out of order unless ``max_workers`` is 1.
+
+    Create it once per process (e.g. with ``st.cache_resource``) so its threads outlive reruns.
+
+    Parameters
+    ----------
+    handler: callable
+        Called with a list of events, e.g. :class:`CardMove` tuples.
+    max_workers: int
+        Batches handled at the same time. Default is 4.
+    batch_size: int
+        Most events per batch. Default is 50.
+    batch_wait: float
+        Seconds to wait for more events before handling a partial batch. Default is 0.2.
+    retries: int
+        Retries of a failing batch. Default is 3.
+    backoff: float
+        Seconds before the first retry, doubled for each next one. Default is 0.5.
+    """
+
+    def __init__(self, handler, max_workers=4, batch_size=50, batch_wait=0.2, retries=3, backoff=0.5):
+        self.handler = handler
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.retries = retries
+        self.backoff = backoff
+        self.failed = deque(maxlen=1000)  # (batch, exception) of batches that ran out of retries
+        self._events = queue.Queue()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="kanban-effects")
+        self._pending = 0
+        self._idle = threading.Condition()
+        self._closed = False
+        self._dispatcher = threading.Thread(target=self._dispatch, name="kanban-effects-dispatch", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, events):
+        """Queue ``events`` and return straight away."""
+        if self._closed:
+            raise RuntimeError("SideEffectQueue is closed")
+        events = list(events)
+        if not events:
+            return
+        with self._idle:
+            self._pending += len(events)
+        for event in events:
+            self._events.put(event)
+
+    @property
+    def pending(self):
+        """Events queued or being handled."""
+        return self._pending
+
+    def flush(self, timeout=None):
+        """Wait until every submitted event was handled (or failed), True unless ``timeout`` ran out."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, wait=True):
+        """Stop taking events, handle the queued ones when ``wait``, and shut the threads down."""
+        self._closed = True
+        if wait:
+            self.flush()
+        self._events.put(None)
+        self._dispatcher.join()
+        self._executor.shutdown(wait=wait)
+
+    def _dispatch(self):
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            batch = [event]
+            deadline = time.monotonic() + self.batch_wait
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    event = self._events.get(timeout=remaining) if remaining > 0 else self._events.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None:
+                    self._events.put(None)  # seen again by the outer loop once this batch is out
+                    break
+                batch.append(event)
+            # blocks while max_workers batches are running, the rest waits in the queue
+            self._slots.acquire()
+            self._executor.submit(self._run, batch)
+
+    def _run(self, batch):
+        try:
+            for attempt in range(self.retries + 1):
+                try:
+                    self.handler(batch)
+                    return
+                except Exception as error:
+                    if attempt == self.retries:
+                        logger.exception("Board side effect failed after %d attempts", attempt + 1)
+                        self.failed.append((batch, error))
+                        return
+                    time.sleep(self.backoff * 2 ** attempt)
+        finally:
+            self._slots.release()
+            with self._idle:
+                self._pending -= len(batch)
+                self._idle.notify_all()
@@ -0,0 +1,84 @@
+"""Swimlanes for ``kanban_board``.
+
+Passing a dict of ``{lane name: columns}`` draws every lane in one component
+(one iframe, one payload, one frame height loop) instead of one
+``kanban_board`` call per lane. The lanes are sent as a single list of
+columns tagged with a ``lane`` key, so cards move across lanes like they move
+across columns, and :func:`group` turns the returned list back into lanes.
+"""
+from .board import Board
+
+LANE_KEY = "lane"
+
+
+def is_lanes(columns):
+    """Whether ``columns`` is a dict of lanes rather than a list of columns or a DataFrame."""
+    return isinstance(columns, dict) and not hasattr(columns, "loc")
+
+
+def flatten(lanes):
+    """All the columns of ``lanes`` in one list, and the lane of each column.
+
+    Parameters
+    ----------
+    lanes: dict
+        Lane name -> list of columns (dicts or :class:`PagedColumn`) or :class:`Board`.
+
+    Returns
+    -------
+    tuple
+        The columns (lane tags are added by :func:`tag`, once paged columns are plain dicts),
+        the lane name of each column and the lane names in order.
+
+    Raises
+    ------
+    ValueError
+        If a lane is not a list of columns or a Board, or if a column id is used in more than
+        one lane (the frontend matches columns by id, so the lanes would share one column).
+    """
+    columns = []
+    column_lanes = []
+    names = []
+    lane_of = {}
+    for name, lane in lanes.items():
+        name = str(name)
+        if isinstance(lane, Board):
+            lane = lane.to_columns()
+        elif not isinstance(lane, (list, tuple)):
+            raise ValueError(f"Lane {name!r} must be a list of columns or a Board, got {type(lane).__name__}")
+        for column in lane:
+            column_id = _column_id(column)
+            if column_id is None:
+                continue
+            if lane_of.get(column_id, name) != name:
+                raise ValueError(f"Column id {column_id!r} is used in lanes {lane_of[column_id]!r} and {name!r}, "
+                                 "column ids must be unique across lanes")
+            lane_of[column_id] = name
+        names.append(name)
+        columns.extend(lane)
+        column_lanes.extend([name] * len(lane))
+    return columns, column_lanes, names
+
+
+def _column_id(column):
+    column_id = column.get("id") if isinstance(column, dict) else getattr(column, "id", None)
+    return None if column_id is None else str(column_id)
+
+
+def tag(columns, column_lanes):
+    """Copies of the column dicts with their lane name under ``"lane"``."""
+    return [dict(column, **{LANE_KEY: lane}) for column, lane in zip(columns, column_lanes)]
+
+
+def group(columns, names):
+    """Split a list of lane-tagged columns (as returned by the component) back into lanes.
+
+    Columns keep their order within a lane and lose the ``"lane"`` tag. Lanes without columns
+    are kept, columns tagged with a lane not in ``names`` get a lane of their own at the end.
+    """
+    lanes = {name: [] for name in names}
+    for column in columns:
+        column = dict(column)
+        lane = column.pop(LANE_KEY, None)
+        lanes.setdefault(lane, []).append(column)
+    return lanes
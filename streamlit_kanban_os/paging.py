@@ -0,0 +1,143 @@
+"""Lazily loaded columns for ``kanban_board``.
+
+A :class:`PagedColumn` only sends its first page of cards. The frontend shows
+a "Load more" button (and loads automatically when a virtualized column is
+scrolled to the end), which asks for the next page through the component
+value. ``kanban_board`` serves the page from the column's source on the next
+rerun and caches every page it has fetched, so the source is queried once
+per page per session.
+"""
+import itertools
+
+
+class PagedColumn:
+    """A column whose cards are fetched from a data source a page at a time.
+
+    Parameters
+    ----------
+    title: str
+        The column title.
+    source: callable | iterable
+        Either ``source(offset, limit)`` returning a list of card dicts, or an iterable of card
+        dicts consumed in order. Passing the same iterator object on every rerun (e.g. from
+        ``st.cache_resource``) avoids skipping over the cards already fetched.
+    total: int | None
+        Total number of cards in the source, shown on the column. When None the length of
+        ``source`` is used if it has one, otherwise more pages are offered until a short page
+        comes back.
+    page_size: int
+        Cards per page. Default is 50.
+    is_main_column: bool
+        Whether this column should use main column min dimensions. Default is False.
+    id: str | None
+        Stable id of the column, see ``kanban_board``. Default is None.
+    """
+
+    def __init__(self, title, source, total=None, page_size=50, is_main_column=False, id=None):
+        self.title = title
+        self.id = id
+        self.source = source
+        if total is None and not callable(source) and hasattr(source, '__len__'):
+            total = len(source)
+        self.total = total
+        self.page_size = page_size
+        self.is_main_column = is_main_column
+
+    def _fetch(self, cache, offset, limit):
+        """Cards ``[offset, offset + limit)`` of the source, reading through ``cache``."""
+        cards = cache["cards"]
+        missing = offset + limit - len(cards)
+        if missing > 0 and not cache["exhausted"]:
+            if callable(self.source):
+                fetched = list(self.source(len(cards), missing))
+            else:
+                if cache.get("iterator") is not self.source:
+                    # a fresh iterable, skip what was already read from the previous one
+                    iterator = iter(self.source)
+                    cache["iterator"] = self.source if iterator is self.source else None
+                    skip = len(cards)
+                else:
+                    iterator = self.source
+                    skip = 0
+                fetched = list(itertools.islice(iterator, skip, skip + missing))
+            cards.extend(fetched)
+            if len(fetched) < missing:
+                cache["exhausted"] = True
+        return cards[offset:offset + limit]
+
+    def _has_more(self, cache, loaded):
+        if self.total is not None:
+            return loaded < self.total
+        return not cache["exhausted"] or loaded < len(cache["cards"])
+
+    def to_dict(self, cache):
+        """The column in the ``kanban_board`` format, holding just the first page."""
+        cards = self._fetch(cache, 0, self.page_size)
+        column = {
+            "title": self.title,
+            "cards": cards,
+            "total": self.total,
+            "loaded": len(cards),
+            "pageSize": self.page_size,
+            "hasMore": self._has_more(cache, len(cards)),
+        }
+        if self.is_main_column:
+            column["is_main_column"] = True
+        if self.id is not None:
+            column["id"] = self.id
+        return column
+
+    def __repr__(self):
+        return f"PagedColumn(title={self.title!r}, total={self.total!r}, page_size={self.page_size})"
+
+
+def new_state():
+    """Create the per-key page cache ``kanban_board`` keeps in session state."""
+    return {
+        "columns": {},  # column index -> {"cards": [...], "exhausted": bool}
+        "served": {},  # request id -> cards sent for it, used to resolve 'append' operations
+        "page": None,  # last page sent, re-sent unchanged until the next request
+    }
+
+
+def prepare(columns, state, request=None):
+    """Turn :class:`PagedColumn` entries into column dicts and serve a pending page request.
+
+    Parameters
+    ----------
+    columns: list
+        Columns as passed to ``kanban_board``, mixing dicts and :class:`PagedColumn`.
+    state: dict
+        Cache created by :func:`new_state`.
+    request: dict | None
+        The ``loadMore`` entry of the last component value:
+        ``{"request": str, "column": int, "offset": int}``.
+
+    Returns
+    -------
+    tuple
+        The columns as plain dicts, and the page to send to the frontend (or None).
+    """
+    prepared = []
+    for index, column in enumerate(columns):
+        if isinstance(column, PagedColumn):
+            cache = state["columns"].setdefault(index, {"cards": [], "exhausted": False})
+            prepared.append(column.to_dict(cache))
+        else:
+            prepared.append(column)
+
+    if request and request.get("request") not in state["served"]:
+        column = columns[request["column"]] if request["column"] < len(columns) else None
+        if isinstance(column, PagedColumn):
+            cache = state["columns"][request["column"]]
+            offset = request["offset"]
+            cards = column._fetch(cache, offset, column.page_size)
+            state["served"][request["request"]] = cards
+            state["page"] = {
+                "request": request["request"],
+                "column": request["column"],
+                "offset": offset,
+                "cards": cards,
+                "hasMore": column._has_more(cache, offset + len(cards)),
+            }
+    return prepared, state["page"]
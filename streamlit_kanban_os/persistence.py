@@ -0,0 +1,204 @@
+"""Saving boards as an append-only log of changes.
+
+``kanban_board(delta=True, persist=store, key=...)`` records the operations
+of every rerun (see :mod:`streamlit_kanban_os.deltas`) as events instead of
+rewriting the whole board. Every ``snapshot_every`` events the full board is
+written as a snapshot, so :meth:`BoardLog.load` only has to replay the events
+after the latest one.
+
+A store is any object with the four methods of :class:`MemoryStore`;
+:class:`SQLiteStore` keeps boards in a local SQLite file. Each key must have
+a single writer, events are positional and are not merged: a :class:`BoardLog`
+only appends after the event it last saw and raises :class:`LogConflict`
+otherwise. Boards edited by several sessions at once go through
+:class:`streamlit_kanban_os.SharedBoards`.
+"""
+import copy
+import json
+import logging
+import sqlite3
+import threading
+
+from . import deltas
+
+logger = logging.getLogger(__name__)
+
+
+class LogConflict(Exception):
+    """Another writer appended to the log of a key since this one last read it."""
+
+
+def _check_last(key, last, after):
+    if after is not None and last != after:
+        raise LogConflict(
+            f"The log of board {key!r} is at event {last}, not {after}: another session wrote to it. "
+            "Use SharedBoards for boards edited by several sessions at once")
+
+
+class MemoryStore:
+    """Keeps the logs in memory, for tests and throwaway apps."""
+
+    def __init__(self):
+        self._events = {}
+        self._snapshots = {}
+        self._lock = threading.Lock()
+
+    def append(self, key, events, after=None):
+        """Add ``events`` to the log of ``key``, returns the sequence number of the last one.
+
+        With ``after``, raises :class:`LogConflict` unless the log ends at event ``after``.
+        """
+        with self._lock:
+            log = self._events.setdefault(key, [])
+            _check_last(key, len(log), after)
+            for event in events:
+                log.append((len(log) + 1, copy.deepcopy(event)))
+            return len(log)
+
+    def events(self, key, after=0):
+        """``(seq, event)`` pairs of ``key`` with a sequence number above ``after``, in order."""
+        with self._lock:
+            return [(seq, copy.deepcopy(event)) for seq, event in self._events.get(key, []) if seq > after]
+
+    def save_snapshot(self, key, seq, columns):
+        """Store the whole board of ``key`` as it is after event ``seq``."""
+        with self._lock:
+            self._snapshots[key] = (seq, copy.deepcopy(columns))
+
+    def latest_snapshot(self, key):
+        """``(seq, columns)`` of the latest snapshot of ``key``, or None."""
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            return (snapshot[0], copy.deepcopy(snapshot[1])) if snapshot else None
+
+
+class SQLiteStore:
+    """Keeps the logs in a SQLite file, one row per event and per snapshot.
+
+    Parameters
+    ----------
+    path: str
+        Database file, created if missing. Default is 'kanban_boards.sqlite3'.
+    keep_snapshots: int
+        Snapshots kept per key, older ones are deleted when a new one is saved. Default is 2.
+    """
+
+    def __init__(self, path='kanban_boards.sqlite3', keep_snapshots=2):
+        self.path = path
+        self.keep_snapshots = keep_snapshots
+        self._lock = threading.Lock()
+        # Streamlit runs each session in its own thread, the lock serializes access
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "key TEXT NOT NULL, seq INTEGER NOT NULL, event TEXT NOT NULL, PRIMARY KEY (key, seq))")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                "key TEXT NOT NULL, seq INTEGER NOT NULL, columns TEXT NOT NULL, PRIMARY KEY (key, seq))")
+
+    def append(self, key, events, after=None):
+        with self._lock, self._connection:
+            (last,) = self._connection.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM events WHERE key = ?", (key,)).fetchone()
+            _check_last(key, last, after)
+            self._connection.executemany(
+                "INSERT INTO events (key, seq, event) VALUES (?, ?, ?)",
+                [(key, last + i, json.dumps(event, separators=(',', ':'))) for i, event in enumerate(events, 1)])
+            return last + len(events)
+
+    def events(self, key, after=0):
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT seq, event FROM events WHERE key = ? AND seq > ? ORDER BY seq", (key, after)).fetchall()
+        return [(seq, json.loads(event)) for seq, event in rows]
+
+    def save_snapshot(self, key, seq, columns):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO snapshots (key, seq, columns) VALUES (?, ?, ?)",
+                (key, seq, json.dumps(columns, separators=(',', ':'), default=str)))
+            self._connection.execute(
+                "DELETE FROM snapshots WHERE key = ? AND seq NOT IN "
+                "(SELECT seq FROM snapshots WHERE key = ? ORDER BY seq DESC LIMIT ?)",
+                (key, key, self.keep_snapshots))
+
+    def latest_snapshot(self, key):
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT seq, columns FROM snapshots WHERE key = ? ORDER BY seq DESC LIMIT 1", (key,)).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def close(self):
+        self._connection.close()
+
+
+class BoardLog:
+    """The event log of one board in a store.
+
+    Parameters
+    ----------
+    store: MemoryStore | SQLiteStore
+        Where the events and snapshots are kept.
+    key: str
+        Board the log belongs to.
+    snapshot_every: int
+        Events between two snapshots. Default is 100.
+    """
+
+    def __init__(self, store, key, snapshot_every=100):
+        self.store = store
+        self.key = key
+        self.snapshot_every = snapshot_every
+        self.seq = 0
+        self.since_snapshot = 0
+
+    def load(self, initial=None):
+        """The current board: the latest snapshot with the events after it replayed.
+
+        An empty log starts from ``initial``, which is saved as the first snapshot. Events that
+        no longer apply (written by a second writer before appends were checked) are skipped
+        and a snapshot is saved, so they are not replayed again.
+        """
+        snapshot = self.store.latest_snapshot(self.key)
+        if snapshot is None:
+            columns = copy.deepcopy(initial) if initial is not None else []
+            self.seq = 0
+            events = self.store.events(self.key)
+            if not events:
+                self.store.save_snapshot(self.key, 0, columns)
+        else:
+            self.seq, columns = snapshot
+            events = self.store.events(self.key, after=self.seq)
+        skipped = 0
+        for seq, event in events:
+            try:
+                deltas.apply_op(columns, event)
+            except (KeyError, IndexError, ValueError) as error:
+                logger.warning("Skipping event %s of board %r that no longer applies: %r", seq, self.key, error)
+                skipped += 1
+            self.seq = seq
+        self.since_snapshot = len(events)
+        if skipped:
+            self.snapshot(columns)
+        return columns
+
+    def record(self, ops, columns):
+        """Append ``ops`` (as applied to ``columns``) and snapshot ``columns`` when it is time.
+
+        Raises :class:`LogConflict` when another writer appended to the log since it was loaded.
+        """
+        if not ops:
+            return
+        # the frontend's sequence numbers only mean something to the mount that sent them
+        self.seq = self.store.append(
+            self.key, [{k: v for k, v in op.items() if k != "seq"} for op in ops], after=self.seq)
+        self.since_snapshot += len(ops)
+        if self.since_snapshot >= self.snapshot_every:
+            self.snapshot(columns)
+
+    def snapshot(self, columns):
+        """Save ``columns`` as the board after the last recorded event."""
+        self.store.save_snapshot(self.key, self.seq, columns)
+        self.since_snapshot = 0
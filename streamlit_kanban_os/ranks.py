@@ -0,0 +1,114 @@
+"""Fractional rank keys for ``kanban_board(ranked=True)``.
+
+Card order is otherwise implied by list position, so storing a reorder
+means rewriting the position of every card after the moved one. With
+ranks each card carries a ``"rank"`` string, and string order matches card
+order within a column. A moved card gets a new rank between those of its
+new neighbours (:func:`key_between`), so a move changes one card's rank and
+a store only has to update one row.
+
+Ranks are base 62 fractions written without the leading ``0.`` (``"V"`` is
+about a half) and never end with ``"0"``. The frontend computes them the
+same way (``ranks.ts``), ``tests/data/rank_vectors.json`` holds cases both
+sides are tested against.
+"""
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+RANK_KEY = "rank"
+
+_DIGIT_VALUES = {digit: value for value, digit in enumerate(DIGITS)}
+
+
+def is_rank(value):
+    """Whether ``value`` is a well formed rank key."""
+    return (isinstance(value, str) and value != "" and not value.endswith("0")
+            and all(digit in _DIGIT_VALUES for digit in value))
+
+
+def _midpoint(low, high):
+    # low < high as fractions, high None stands for 1
+    if high is not None:
+        shared = 0
+        while shared < len(high) and (low[shared] if shared < len(low) else "0") == high[shared]:
+            shared += 1
+        if shared:
+            return high[:shared] + _midpoint(low[shared:], high[shared:])
+    low_digit = _DIGIT_VALUES[low[0]] if low else 0
+    high_digit = _DIGIT_VALUES[high[0]] if high is not None else len(DIGITS)
+    if high_digit - low_digit > 1:
+        return DIGITS[(low_digit + high_digit + 1) // 2]
+    # consecutive digits, go one digit further
+    if high is not None and len(high) > 1:
+        return high[:1]
+    return DIGITS[low_digit] + _midpoint(low[1:], None)
+
+
+def key_between(before=None, after=None):
+    """A rank sorting after ``before`` and before ``after`` (None for no bound).
+
+    Raises
+    ------
+    ValueError
+        When ``before`` doesn't sort before ``after``.
+    """
+    if before is not None and after is not None and before >= after:
+        raise ValueError(f"Rank {before!r} does not sort before {after!r}")
+    return _midpoint(before or "", after)
+
+
+def keys_between(before, after, count):
+    """``count`` increasing ranks between ``before`` and ``after``, spread so none grows long."""
+    if count <= 0:
+        return []
+    middle = key_between(before, after)
+    half = count // 2
+    return keys_between(before, middle, half) + [middle] + keys_between(middle, after, count - half - 1)
+
+
+def _column_ranks(cards):
+    """New ranks for the cards of a column, or None when they are all ranked and in order."""
+    # board imports this module through deltas
+    from .board import _longest_increasing
+
+    ranks = [card.get(RANK_KEY) for card in cards]
+    ranked = [i for i, rank in enumerate(ranks) if is_rank(rank)]
+    # the most cards whose ranks are already in order keep them, the others are ranked again
+    kept = {ranked[i] for i in _longest_increasing([ranks[i] for i in ranked])}
+    if len(kept) == len(ranks):
+        return None
+    # rank the cards missing one between their kept neighbours
+    result = [rank if i in kept else None for i, rank in enumerate(ranks)]
+    start = 0
+    while start < len(result):
+        if result[start] is not None:
+            start += 1
+            continue
+        end = start
+        while end < len(result) and result[end] is None:
+            end += 1
+        before = result[start - 1] if start > 0 else None
+        after = result[end] if end < len(result) else None
+        result[start:end] = keys_between(before, after, end - start)
+        start = end
+    return result
+
+
+def fill(columns):
+    """``columns`` with a rank on every card.
+
+    Cards missing a rank get one between their neighbours. In a column whose ranks are out of
+    order, the most cards whose ranks are in order keep them and the others get one between
+    their neighbours. Only the columns and cards that change are copied, the same list is
+    returned when every card already has a rank in order.
+    """
+    result = columns
+    for i, column in enumerate(columns):
+        ranks = _column_ranks(column.get("cards", []))
+        if ranks is None:
+            continue
+        if result is columns:
+            result = list(columns)
+        result[i] = dict(column, cards=[
+            card if card.get(RANK_KEY) == rank else dict(card, **{RANK_KEY: rank})
+            for card, rank in zip(column["cards"], ranks)
+        ])
+    return result
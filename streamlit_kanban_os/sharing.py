@@ -0,0 +1,271 @@
+"""One board per key shared by every session of the app.
+
+Each Streamlit session normally caches its own copy of a board. With
+``kanban_board(delta=True, shared=boards, key=...)`` the sessions commit their
+operations (see :mod:`streamlit_kanban_os.deltas`) to a :class:`SharedBoards`
+created once per process, e.g. with ``st.cache_resource``. Every committed
+operation gets the next version number of its board.
+
+Commits are optimistic: a session sends the version its operations were made
+on, and operations other sessions committed since then win per card (a card
+moved by someone else is not moved again) and per column title. The rest is
+rebased onto the shared board, columns are matched by id. A session that made
+no change of its own gets only the operations since its version, a session
+whose changes were rebased or rejected gets the whole shared board.
+"""
+import collections
+import copy
+import threading
+
+from . import deltas, persistence
+
+CommitResult = collections.namedtuple("CommitResult", ["version", "accepted", "rejected", "remote"])
+CommitResult.__doc__ = """Outcome of :meth:`SharedBoards.commit`.
+
+``remote`` holds the operations other sessions committed since the session's
+version, or None when they are no longer in the history.
+"""
+
+
+class SharedBoards:
+    """Thread-safe boards, one per key, with versioned changes.
+
+    Parameters
+    ----------
+    store: MemoryStore | SQLiteStore | None
+        Where the boards are persisted (see :mod:`streamlit_kanban_os.persistence`). Default is
+        None, the boards only live as long as the process.
+    snapshot_every: int
+        Operations between two snapshots in ``store``. Default is 100.
+    history: int
+        Operations kept per board to bring sessions up to date. A session further behind gets
+        the whole board. Default is 1000.
+    """
+
+    def __init__(self, store=None, snapshot_every=100, history=1000):
+        self.store = store
+        self.snapshot_every = snapshot_every
+        self.history = history
+        self._boards = {}
+        self._lock = threading.Lock()
+
+    def _board(self, key, initial):
+        with self._lock:
+            board = self._boards.get(key)
+            if board is None:
+                board_log = None
+                columns = _with_column_ids(copy.deepcopy(initial) if initial is not None else [])
+                if self.store is not None:
+                    board_log = persistence.BoardLog(self.store, key, self.snapshot_every)
+                    columns = _with_column_ids(board_log.load(columns))
+                board = {
+                    "lock": threading.Lock(),
+                    "columns": columns,
+                    "version": 0,
+                    "log": collections.deque(maxlen=self.history),
+                    "persist": board_log,
+                }
+                self._boards[key] = board
+            return board
+
+    def checkout(self, key, initial=None):
+        """The version and a copy of the board ``key``, created from ``initial`` if it is new."""
+        board = self._board(key, initial)
+        with board["lock"]:
+            return board["version"], copy.deepcopy(board["columns"])
+
+    def changes(self, key, version):
+        """The current version of ``key`` and the operations committed after ``version``.
+
+        The operations are None when some of them are no longer in the history.
+        """
+        board = self._board(key, None)
+        with board["lock"]:
+            return board["version"], _since(board, version)
+
+    def commit(self, key, version, ops, column_ids):
+        """Apply operations made by a session on ``version`` of the board ``key``.
+
+        Parameters
+        ----------
+        key: str
+            Board the operations belong to.
+        version: int
+            Version the session's board was at before the operations.
+        ops: list
+            Operations as sent by the frontend.
+        column_ids: list
+            Ids of the session's columns by position, used to find them on the shared board.
+
+        Returns
+        -------
+        CommitResult
+            The new version, the operations as applied to the shared board, the operations
+            rejected for conflicting with a change committed since ``version``, and those changes.
+        """
+        board = self._board(key, None)
+        with board["lock"]:
+            remote = _since(board, version)
+            moved = set()
+            renamed = set()
+            for op in remote or []:
+                moved.update(_op_cards(op))
+                if op["type"] == deltas.RENAME:
+                    renamed.add(op["columnId"])
+            columns = board["columns"]
+            positions = {column["id"]: i for i, column in enumerate(columns)}
+            accepted = []
+            rejected = []
+            for op in ops:
+                resolved = _resolve(op, columns, positions, column_ids, moved, renamed)
+                if resolved is None:
+                    rejected.append(op)
+                    continue
+                deltas.apply_op(columns, resolved)
+                if resolved["type"] == deltas.CREATE:
+                    positions[resolved["id"]] = resolved["column"]
+                board["version"] += 1
+                board["log"].append((board["version"], resolved))
+                accepted.append(resolved)
+            if board["persist"] is not None:
+                board["persist"].record(accepted, columns)
+            return CommitResult(board["version"], accepted, rejected, remote)
+
+
+def _with_column_ids(columns):
+    # the frontend names columns without an id the same way
+    for i, column in enumerate(columns):
+        column.setdefault("id", f"__column_{i}")
+    return columns
+
+
+def _since(board, version):
+    log = board["log"]
+    if version == board["version"]:
+        return []
+    if not log or log[0][0] > version + 1:
+        return None
+    return [op for op_version, op in log if op_version > version]
+
+
+def _op_cards(op):
+    if op["type"] == deltas.MOVE:
+        return [op["card"]]
+    if op["type"] == deltas.BULK_MOVE:
+        return op["cards"]
+    return []
+
+
+def _column_id(column_ids, position):
+    return column_ids[position] if 0 <= position < len(column_ids) else None
+
+
+def _locate(columns, card_id, column_hint=None, index_hint=None):
+    """Column and index of a card, trying the hinted position first."""
+    if column_hint is not None:
+        cards = columns[column_hint]["cards"]
+        if index_hint is not None and index_hint < len(cards) and cards[index_hint]["id"] == card_id:
+            return column_hint, index_hint
+    for column_index, column in enumerate(columns):
+        for index, card in enumerate(column["cards"]):
+            if card["id"] == card_id:
+                return column_index, index
+    return None
+
+
+def _resolve(op, columns, positions, column_ids, moved, renamed):
+    """``op`` made on a session's board, rewritten for the shared ``columns``; None on conflict.
+
+    The result also names its columns by id (``fromId``, ``fromIds``, ``toId``, ``columnId``) so
+    frontends whose boards differ from the shared one can apply it.
+    """
+    kind = op["type"]
+    if kind == deltas.MOVE:
+        to = positions.get(_column_id(column_ids, op["to"]))
+        if op["card"] in moved or to is None:
+            return None
+        hint = positions.get(_column_id(column_ids, op["from"]))
+        location = _locate(columns, op["card"], hint, op.get("fromIndex"))
+        if location is None:
+            return None
+        source, position = location
+        size = len(columns[to]["cards"]) - (1 if source == to else 0)
+        resolved = {"type": kind, "card": op["card"], "from": source, "fromIndex": position, "to": to,
+                    "index": min(op["index"], size), "fromId": columns[source]["id"], "toId": columns[to]["id"]}
+        if op.get("rank") is not None:
+            resolved["rank"] = op["rank"]
+        return resolved
+    if kind == deltas.BULK_MOVE:
+        to = positions.get(_column_id(column_ids, op["to"]))
+        if to is None:
+            return None
+        located = []
+        for card_id in op["cards"]:
+            location = None if card_id in moved else _locate(columns, card_id)
+            if location is not None:
+                located.append((location, card_id))
+        if not located:
+            return None
+        located.sort()
+        staying = len(columns[to]["cards"]) - sum(1 for (source, _), _ in located if source == to)
+        resolved = {"type": kind, "cards": [card_id for _, card_id in located],
+                    "from": [source for (source, _), _ in located], "to": to,
+                    "index": min(op["index"], staying), "toId": columns[to]["id"],
+                    "fromIds": [columns[source]["id"] for (source, _), _ in located]}
+        if op.get("ranks"):
+            rank_of = dict(zip(op["cards"], op["ranks"]))
+            resolved["ranks"] = [rank_of[card_id] for card_id in resolved["cards"]]
+        return resolved
+    if kind == deltas.RENAME:
+        column_id = _column_id(column_ids, op["column"])
+        if column_id in renamed or column_id not in positions:
+            return None
+        return {"type": kind, "column": positions[column_id], "title": op["title"], "columnId": column_id}
+    if kind == deltas.CREATE:
+        if op.get("id") is None or op["id"] in positions:
+            return None
+        # new columns always go at the end, so the positions of the others never change
+        return dict(op, column=len(columns))
+    # appended pages only exist on the board of the session that loaded them
+    return None
+
+
+def sync_session(boards, key, state, value):
+    """Commit the operations in a component value and bring the session's board up to date.
+
+    Parameters
+    ----------
+    boards: SharedBoards
+        The shared boards.
+    key: str
+        Board key.
+    state: dict
+        The session's delta cache (see :func:`deltas.new_state`) with a ``"version"`` entry.
+    value: dict | None
+        Value returned by the component.
+
+    Returns
+    -------
+    tuple
+        The session's operations as applied to the shared board (``accepted`` of
+        :meth:`SharedBoards.commit`, naming their columns by id), the update for the frontend
+        (None, or a dict with an ``"id"`` and either the ``"ops"`` committed by other sessions
+        or the shared board as ``"columns"``) and the operations rejected for conflicts.
+    """
+    previous_columns = state["columns"]
+    ops = deltas.sync(state, value)
+    column_ids = [column.get("id") for column in state["columns"]]
+    reset = state["columns"] is not previous_columns and state["columns"] != previous_columns
+    result = boards.commit(key, state["version"], [] if reset else ops, column_ids)
+    state["version"] = result.version
+    if not result.remote and not result.rejected and not reset and result.remote is not None:
+        # the session's own changes are all the news
+        return result.accepted, None, []
+    state["updates"] = state.get("updates", 0) + 1
+    if result.remote and not ops and not reset:
+        # nothing of its own to rebase, catch up on the others' changes
+        deltas.apply_ops(state["columns"], result.remote)
+        return result.accepted, {"id": state["updates"], "ops": result.remote}, []
+    # rebased, rejected or after a resync snapshot: the frontend starts over from the shared board
+    state["version"], state["columns"] = boards.checkout(key)
+    return result.accepted, {"id": state["updates"], "columns": state["columns"]}, result.rejected
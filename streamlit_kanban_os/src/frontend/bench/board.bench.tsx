@@ -0,0 +1,56 @@
+import { afterAll, beforeAll, bench, describe } from 'vitest';
+import { BoardArgs } from '../src/types';
+import {
+  SIZES, MountedBoard, columnElements, dragCard, makeArgs, makeColumns, mountBoard, renameColumn, unmountBoard
+} from './fixtures';
+
+// Rendering every card of a 100k board in jsdom takes minutes, plain boards stop here
+const MAX_PLAIN_CARDS = 10_000;
+
+const variants: Array<{ name: string; extra: Partial<BoardArgs>; maxCards: number }> = [
+  { name: 'plain', extra: {}, maxCards: MAX_PLAIN_CARDS },
+  { name: 'virtualized', extra: { virtualizeAfter: 50 }, maxCards: Infinity },
+  { name: 'stacked', extra: { stacked: true }, maxCards: Infinity },
+];
+
+// Fewer rounds for the big boards so a full run stays in the minutes
+const options = (size: number) => (size >= 10_000 ? { iterations: 3, time: 0 } : { iterations: 10, time: 500 });
+
+for (const size of SIZES) {
+  const columns = makeColumns(size);
+
+  for (const variant of variants) {
+    if (size > variant.maxCards) continue;
+    const args = makeArgs(columns, variant.extra);
+
+    describe(`${size} cards, ${variant.name}`, () => {
+      bench('initial render (mount + unmount)', () => {
+        unmountBoard(mountBoard(args));
+      }, options(size));
+
+      describe('interactions', () => {
+        let board: MountedBoard;
+        let drops = 0;
+        let renames = 0;
+
+        beforeAll(() => {
+          board = mountBoard(makeArgs(columns, { ...variant.extra, renameCategories: 'all' }));
+        });
+        afterAll(() => unmountBoard(board));
+
+        // Each drop moves a card on to the next column, so the board keeps its size
+        bench('handleDrop', () => {
+          const count = columnElements(board).length;
+          const from = drops % count;
+          dragCard(board, from, (from + 1) % count);
+          drops += 1;
+        }, options(size));
+
+        bench('rename column', () => {
+          renames += 1;
+          renameColumn(board, renames % 4, `Column ${renames}`);
+        }, options(size));
+      });
+    });
+  }
+}
@@ -0,0 +1,96 @@
+import React, { act } from 'react';
+import { createRoot, Root } from 'react-dom/client';
+import { Board } from '../src/Board';
+import { BoardArgs, BoardProps, ColumnData } from '../src/types';
+
+// Same boards as benchmarks/bench_python.py so both reports line up
+export const SIZES = (process.env.BENCH_SIZES || '100,1000,10000,100000').split(',').map(Number);
+const COLUMN_TITLES = ['Backlog', 'To Do', 'In Progress', 'Done'];
+
+// Tell React the renders below are wrapped in act()
+(globalThis as any).IS_REACT_ACT_ENVIRONMENT = true;
+
+export const makeColumns = (totalCards: number): ColumnData[] => {
+  const columns: ColumnData[] = COLUMN_TITLES.map(title => ({ title, cards: [] }));
+  for (let i = 0; i < totalCards; i++) {
+    columns[i % columns.length].cards.push({ id: String(i), title: `Task ${i}`, help: `Help text for task ${i}` });
+  }
+  return columns;
+};
+
+export const makeArgs = (columns: ColumnData[], extra: Partial<BoardArgs> = {}): BoardArgs => ({
+  horizontal_alignment: 'left',
+  vertical_alignment: 'top',
+  horizontal: true,
+  gap: 'medium',
+  width: 'stretch',
+  height: 'content',
+  border: false,
+  columns,
+  revision: 'bench',
+  ...extra
+});
+
+export interface MountedBoard {
+  container: HTMLElement;
+  root: Root;
+}
+
+export const mountBoard = (args: BoardArgs): MountedBoard => {
+  const container = document.createElement('div');
+  document.body.appendChild(container);
+  const root = createRoot(container);
+  const props = { args, disabled: false, theme: undefined } as unknown as BoardProps;
+  act(() => root.render(<Board {...props} />));
+  return { container, root };
+};
+
+export const unmountBoard = ({ container, root }: MountedBoard) => {
+  act(() => root.unmount());
+  container.remove();
+};
+
+// The column elements, in board order (the manual Save bar is not a column)
+export const columnElements = ({ container }: MountedBoard): HTMLElement[] =>
+  Array.from(container.querySelectorAll<HTMLElement>('.board > div')).filter(el => el.querySelector('h3, input'));
+
+// jsdom has no DragEvent, so drag events are plain events carrying a stub dataTransfer
+const dispatchDragEvent = (target: Element, type: string) => {
+  const event = new Event(type, { bubbles: true, cancelable: true });
+  Object.defineProperty(event, 'dataTransfer', {
+    value: { setData: () => {}, getData: () => '', dropEffect: 'move', effectAllowed: 'all' }
+  });
+  act(() => {
+    target.dispatchEvent(event);
+  });
+};
+
+// Drag the first card of one column onto another, as a user would
+export const dragCard = (board: MountedBoard, from: number, to: number) => {
+  const columns = columnElements(board);
+  const card = columns[from].querySelector('[draggable="true"]');
+  if (!card) throw new Error(`Column ${from} has no card to drag`);
+  dispatchDragEvent(card, 'dragstart');
+  dispatchDragEvent(columns[to], 'drop');
+};
+
+// Set an input the way React expects (through the native value setter) and fire its events
+const typeInto = (input: HTMLInputElement, value: string) => {
+  const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value')!.set!;
+  setter.call(input, value);
+  input.dispatchEvent(new Event('input', { bubbles: true }));
+};
+
+// Click a column title, type a new one and leave the field
+export const renameColumn = (board: MountedBoard, column: number, title: string) => {
+  const heading = columnElements(board)[column].querySelector('h3');
+  if (!heading) throw new Error(`Column ${column} is already being edited`);
+  act(() => {
+    heading.dispatchEvent(new MouseEvent('click', { bubbles: true }));
+  });
+  const input = columnElements(board)[column].querySelector('input')!;
+  act(() => typeInto(input, title));
+  act(() => {
+    input.dispatchEvent(new FocusEvent('focusout', { bubbles: true }));
+  });
+};
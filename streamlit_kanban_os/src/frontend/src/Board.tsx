@@ -1,11 +1,38 @@
-import React, { useState, useEffect, useMemo } from 'react';
+import React, { Suspense, lazy, useState, useEffect, useMemo, useRef, useCallback, useDeferredValue } from 'react';
 import { Column } from './Column';
 import { Streamlit, withStreamlitConnection } from 'streamlit-component-lib';
-import { SimpleTooltip } from './SimpleTooltip';
-import { BoardProps } from './types';
-
-// Common font file extensions we want to support
-const FONT_EXTS = [ "ttf","woff2", "woff", "otf"];
+import { BoardOp, BoardProps, BulkMoveRequest, CardData, ColumnData, SequencedOp } from './types';
+import { CardIndex, buildCardIndex, moveCards, reindexColumn } from './cardIndex';
+import { FontStatus, fontFileUrl, getAppBaseUrl, loadFont, parseFontList } from './fonts';
+import { columnsFromFrame } from './frame';
+import { Profiler } from './profiler';
+import { useFrameHeight } from './frameHeight';
+import { SearchIndex, tokenize } from './searchIndex';
+import { applySharedOps } from './sharedOps';
+import { gapClass, useBoardStylesheet } from './styles';
+import { ranksAt } from './ranks';
+import { commitAction, deferSnapshot } from './commitPolicy';
+
+// Only loaded (as its own chunk) when debug_font is on
+const FontDebugPanel = lazy(() => import('./FontDebugPanel'));
+
+// Shared by every render so the memoized pseudo column doesn't see new cards
+const NO_CARDS: ColumnData['cards'] = [];
+const PSEUDO_COLUMN_ID = '__pseudo_column';
+// With swimlanes every lane has its own pseudo column, its id carries the lane name
+const pseudoColumnLane = (id: string) =>
+  id.startsWith(`${PSEUDO_COLUMN_ID}:`) ? id.slice(PSEUDO_COLUMN_ID.length + 1) : undefined;
+const EMPTY_SELECTION: ReadonlySet<string> = new Set();
+
+// Columns sent without an id are identified by their position when they arrive
+const withColumnIds = (columns: ColumnData[]): ColumnData[] =>
+  columns.every(column => column.id != null)
+    ? columns
+    : columns.map((column, index) => column.id != null ? column : { ...column, id: `__column_${index}` });
+
+const handleDragOver = (e: React.DragEvent) => {
+  e.preventDefault(); // This is necessary to allow dropping
+};
 
 /**
  * A Kanban board component for Streamlit
@@ -18,16 +45,104 @@ const FONT_EXTS = [ "ttf","woff2", "woff", "otf"];
  * @param {BoardProps} props - The props passed from Streamlit
  */
 const Board: React.FC<BoardProps> = ({ args, disabled, theme }) => {
-  const [columns, setColumns] = useState(args.columns);
-  const [draggedCardId, setDraggedCardId] = useState<string | null>(null);
+  // Board data from args: a list of columns, or a DataFrame grouped here. Python
+  // leaves both out (null) when the board revision hasn't changed since the last rerun
+  const columnsFromArgs = (): ColumnData[] | null => {
+    if (args.columns != null) return withColumnIds(args.columns);
+    if (args.data != null && args.dataColumns) {
+      return columnsFromFrame(args.data, args.dataColumns, args.categories ?? []);
+    }
+    return null;
+  };
+  const [columns, setColumns] = useState<ColumnData[]>(() => columnsFromArgs() ?? []);
+  const hydratedRef = useRef(args.columns != null || args.data != null);
+  // The card being dragged, or the whole selection when a selected card is dragged
+  const [draggedCardIds, setDraggedCardIds] = useState<string[] | null>(null);
+  const [selection, setSelection] = useState<ReadonlySet<string>>(EMPTY_SELECTION);
+  const selectionAnchorRef = useRef<string | null>(null);
   const [fontUrl, setFontUrl] = useState<string | null>(null);
+  const [fontStatus, setFontStatus] = useState<FontStatus>('idle');
+
+  // Delta mode bookkeeping (see deltas.py for the Python side)
+  const sessionRef = useRef(Math.random().toString(36).slice(2));
+  const seqRef = useRef(0);
+  const pendingOpsRef = useRef<SequencedOp[]>([]);
+  const lastSentSeqRef = useRef<number | null>(null);
+  const lastResyncRef = useRef(args.deltaResync);
+
+  // Commit policy bookkeeping: what Streamlit last received and how many edits are waiting
+  const columnsRef = useRef(columns);
+  columnsRef.current = columns;
+  const publishedColumnsRef = useRef<ColumnData[] | null>(null);
+  const [pendingChanges, setPendingChanges] = useState(0);
+  // Set by the user's own edits for the commit policy (see commitPolicy.ts)
+  const userEditRef = useRef(false);
+  // A snapshot Python asked for while edits were held back, sent with them
+  const snapshotDueRef = useRef(false);
+  const lastValueRef = useRef<Record<string, unknown> | null>(null);
+
+  // Paged columns: load more requests waiting for Python, request id -> "column:offset"
+  const pageRequestsRef = useRef(new Map<string, string>());
+  const pageCounterRef = useRef(0);
+  const newColumnCounterRef = useRef(0);
+  // bulk_move requests (tokens sent by Python) applied and still sent, reported with every value
+  const appliedBulkMovesRef = useRef(new Set<string>());
+  // Last shared board update applied, the columns a mount starts with already include it
+  const lastSharedUpdateRef = useRef(args.shared?.id ?? null);
+
+  // profile=True timings, the initial render is measured from the first render to the first effect
+  const profilerRef = useRef<Profiler | null>(null);
+  if (profilerRef.current === null) {
+    profilerRef.current = new Profiler();
+    profilerRef.current.enabled = !!args.profile;
+    profilerRef.current.start('initialRender');
+  }
+  const profiler = profilerRef.current;
+  profiler.enabled = !!args.profile;
+
+  // Card id -> (column, index), kept in step with the columns it was built for
+  const cardIndexRef = useRef<{ columns: ColumnData[]; index: CardIndex } | null>(null);
+  const getCardIndex = (current: ColumnData[]) => {
+    if (!cardIndexRef.current || cardIndexRef.current.columns !== current) {
+      cardIndexRef.current = { columns: current, index: buildCardIndex(current) };
+    }
+    return cardIndexRef.current.index;
+  };
+  // Column id -> index, rebuilt only when the list of columns changes
+  const columnIndexRef = useRef<{ columns: ColumnData[]; index: Map<string, number> } | null>(null);
+  const getColumnIndex = (current: ColumnData[]) => {
+    if (!columnIndexRef.current || columnIndexRef.current.columns !== current) {
+      columnIndexRef.current = { columns: current, index: new Map(current.map((column, i) => [column.id!, i])) };
+    }
+    return columnIndexRef.current.index;
+  };
+  // Search box: the word index is built from the board on the first query and only grows with
+  // loaded pages, moves don't touch it. Typing stays responsive, filtering follows the deferred query
+  const [query, setQuery] = useState('');
+  const deferredQuery = useDeferredValue(query);
+  const searchIndexRef = useRef<SearchIndex | null>(null);
+  const [searchIndexVersion, setSearchIndexVersion] = useState(0);
+  const matches = useMemo(() => {
+    if (!args.search || deferredQuery.trim() === '') return null;
+    if (searchIndexRef.current === null) {
+      searchIndexRef.current = new SearchIndex(columnsRef.current);
+    }
+    return searchIndexRef.current.search(deferredQuery);
+  }, [args.search, deferredQuery, searchIndexVersion]);
+  const highlightWords = useMemo(() => tokenize(deferredQuery), [deferredQuery]);
+
+  // For updates that leave every card where it was (renames, column flags)
+  const carryCardIndex = (previous: ColumnData[], next: ColumnData[]) => {
+    if (cardIndexRef.current && cardIndexRef.current.columns === previous) {
+      cardIndexRef.current = { columns: next, index: cardIndexRef.current.index };
+    }
+  };
   
   // Parse font list - font_file_name takes priority over theme.font
-  const fontList = args.font_file_name && args.font_file_name.trim() !== ''
-    ? [args.font_file_name]
-    : theme?.font
-    ? theme.font.replace(/"/g, '').split(',').map(f => f.trim())
-    : [];
+  const fontList = useMemo(
+    () => parseFontList(args.font_file_name, theme?.font),
+    [args.font_file_name, theme?.font]
+  );
 
   // Determine applied font family - use full font stack with fallbacks
   // const appliedFontFamily = fontUrl && fontList.length > 0
@@ -39,15 +154,6 @@ const Board: React.FC<BoardProps> = ({ args, disabled, theme }) => {
     ? fontList.map(f => `"${f}"`).join(', ') 
     : (theme?.font );
   // Add these helper functions to convert Streamlit properties
-  const getGapSize = (gap: string) => {
-    switch(gap) {
-      case 'small': return '0.5rem';
-      case 'medium': return '1rem';
-      case 'large': return '2rem';
-      default: return '1rem'; // default if not specified
-    }
-  };
-
   const getVerticalAlignment = (alignment: string) => {
     switch(alignment) {
       case 'top': return 'flex-start';
@@ -76,21 +182,65 @@ const Board: React.FC<BoardProps> = ({ args, disabled, theme }) => {
     display: 'flex' as 'flex',
     flexDirection: args.horizontal ? 'row' as 'row' : 'column' as 'column',
     flexWrap: args.horizontal ? 'wrap' as 'wrap' : 'nowrap' as 'nowrap',
-    gap: getGapSize(args.gap || 'medium'),
     justifyContent: getHorizontalAlignment(args.horizontal_alignment || 'left'),
     alignItems: getVerticalAlignment(args.vertical_alignment || 'top'),
     opacity: disabled ? 0.5 : 1,
     width: args.width === 'stretch' ? '100%' : args.width,
     overflowY: 'scroll' as 'scroll',
     border: args.border || false ? '1px solid #ddd' : 'none',
-  }), [theme, disabled, args.gap, args.horizontal_alignment, args.vertical_alignment, args.width, args.height, args.horizontal, fontUrl, fontList, appliedFontFamily]);
+  }), [theme, disabled, args.horizontal_alignment, args.vertical_alignment, args.width, args.height, args.horizontal, appliedFontFamily]);
+
+  // Swimlanes stack the lanes, each lane lays out its columns like a board without lanes does
+  const boardStyle = useMemo(() => args.lanes
+    ? { ...style, flexDirection: 'column' as 'column', flexWrap: 'nowrap' as 'nowrap', justifyContent: 'flex-start', alignItems: 'stretch' }
+    : style, [style, args.lanes]);
+  const laneColumnsStyle = useMemo(() => ({
+    display: 'flex' as 'flex',
+    flexDirection: style.flexDirection,
+    flexWrap: style.flexWrap,
+    justifyContent: style.justifyContent,
+    alignItems: style.alignItems,
+  }), [style]);
+  const laneTitleStyle = useMemo(() => ({
+    color: theme?.textColor || '#31333F',
+    fontSize: '1.2em',
+    fontWeight: 600,
+    margin: '0 0 0.5rem 0',
+    padding: 0,
+  }), [theme]);
+
+  // Mounted without board data (Python thought we already had it), ask for it once
+  useEffect(() => {
+    profiler.end('initialRender');
+    // Since the iframe started loading, so it includes fetching and parsing the bundle
+    profiler.record('timeToFirstRender', performance.now());
+    if (!hydratedRef.current) {
+      Streamlit.setComponentValue({ needsColumns: sessionRef.current });
+    }
+  }, []);
 
-  // Update is_main_column property when args.columns changes, but preserve local card state
+  // Update is_main_column property when the board revision changes, but preserve local card state
   useEffect(() => {
+    if (args.columns == null && args.data == null) return;
+    const newColumns = hydratedRef.current && args.columns == null
+      ? null  // a DataFrame carries no per-column flags to sync
+      : columnsFromArgs();
+    if (newColumns == null) return;
+    if (!hydratedRef.current) {
+      hydratedRef.current = true;
+      searchIndexRef.current = null;
+      setSearchIndexVersion(version => version + 1);
+      setColumns(newColumns);
+      return;
+    }
     setColumns(prevColumns => {
-      return prevColumns.map((prevColumn, index) => {
-        const newColumn = args.columns[index];
-        if (newColumn) {
+      let changed = false;
+      // Matched by id, so columns created or reordered on the board keep their flags
+      const newById = new Map(newColumns.map(column => [column.id, column]));
+      const nextColumns = prevColumns.map(prevColumn => {
+        const newColumn = newById.get(prevColumn.id);
+        if (newColumn && newColumn.is_main_column !== prevColumn.is_main_column) {
+          changed = true;
           return {
             ...prevColumn,
             is_main_column: newColumn.is_main_column
@@ -98,119 +248,354 @@ const Board: React.FC<BoardProps> = ({ args, disabled, theme }) => {
         }
         return prevColumn;
       });
+      // Keep the same array when nothing changed so nothing downstream re-runs
+      if (!changed) return prevColumns;
+      carryCardIndex(prevColumns, nextColumns);
+      return nextColumns;
     });
-  }, [args.columns]);
+    // Without a revision (no key) fall back to the columns identity, which changes every rerun
+  }, [args.revision ?? args.columns]);
+
+  // Resize the iframe whenever the board changes height, at most once per frame
+  const boardRef = useRef<HTMLDivElement>(null);
+  useFrameHeight(boardRef, profiler);
 
-  // Update frame height when columns change
+  // A new args object means Streamlit reran the script after the last value we sent
   useEffect(() => {
-    Streamlit.setFrameHeight();
-  }, [columns, args]);
+    profiler.end('roundTrip');
+  }, [args]);
 
-  // Notify Streamlit of the current board state
+  const recordOp = (op: BoardOp) => {
+    if (!args.delta) return;
+    seqRef.current += 1;
+    pendingOpsRef.current.push({ ...op, seq: seqRef.current });
+  };
+
+  // Every value sent to Streamlit goes through here so it can be re-sent with a page request
+  const sendValue = (value: Record<string, unknown>) => {
+    if (profiler.enabled) {
+      profiler.record('payloadBytes', JSON.stringify(value).length);
+      profiler.start('roundTrip');
+      value = { ...value, profile: profiler.snapshot() };
+    }
+    if (appliedBulkMovesRef.current.size > 0) {
+      value = { ...value, bulkApplied: [...appliedBulkMovesRef.current] };
+    }
+    lastValueRef.current = value;
+    Streamlit.setComponentValue(value);
+  };
+
+  const sendSnapshot = (snapshotColumns: ColumnData[]) => {
+    publishedColumnsRef.current = snapshotColumns;
+    setPendingChanges(0);
+    pendingOpsRef.current = [];
+    lastSentSeqRef.current = seqRef.current;
+    sendValue({
+      mode: 'snapshot',
+      session: sessionRef.current,
+      seq: seqRef.current,
+      columns: snapshotColumns
+    });
+  };
+
+  // Send the current board state to Streamlit (each value triggers one script rerun)
+  const publish = () => {
+    const current = columnsRef.current;
+    if (!args.delta) {
+      publishedColumnsRef.current = current;
+      setPendingChanges(0);
+      sendValue({ columns: current });
+      return;
+    }
+    if (lastSentSeqRef.current === null || snapshotDueRef.current) {
+      // First mount (Python has nothing to apply operations to yet) or a resync
+      snapshotDueRef.current = false;
+      sendSnapshot(current);
+    } else if (seqRef.current !== lastSentSeqRef.current) {
+      publishedColumnsRef.current = current;
+      setPendingChanges(0);
+      lastSentSeqRef.current = seqRef.current;
+      sendValue({
+        mode: 'delta',
+        session: sessionRef.current,
+        seq: seqRef.current,
+        ops: pendingOpsRef.current
+      });
+    }
+  };
+
+  // A drop is measured until the columns it produced are committed
   useEffect(() => {
-    Streamlit.setComponentValue({ columns });
+    profiler.end('drop');
   }, [columns]);
 
-  // Simple font loading - assume font name is correct and load from /app/static
+  // Notify Streamlit of board changes according to the commit policy
   useEffect(() => {
-    if (fontList.length === 0) {
-      setFontUrl(null);
+    if (!hydratedRef.current) return;
+    const userEdit = userEditRef.current;
+    userEditRef.current = false;
+    const action = commitAction(args.commit, {
+      first: publishedColumnsRef.current === null,
+      unchanged: columns === publishedColumnsRef.current,
+      userEdit,
+      pendingEdits: pendingChanges
+    });
+    if (action === 'publish') {
+      publish();
       return;
     }
+    if (action === 'none') return;
+    if (userEdit) setPendingChanges(count => count + 1);
+    if (action === 'debounce') {
+      // Every change restarts the timer, so a burst of edits is sent as one value
+      const timer = setTimeout(publish, args.debounceMs ?? 500);
+      return () => clearTimeout(timer);
+    }
+    // 'hold' waits for the Save button
+  }, [columns]);
 
-    // Get app base URL
-    const getAppBaseUrl = () => {
-      try {
-        if (window.parent && window.parent.location) {
-          return window.parent.location.origin;
-        }
-      } catch (e) {
-        // CORS might block this
-      }
-      return window.location.origin.replace(':5173', ':9268');
-    };
+  // Forget operations Python has already applied
+  useEffect(() => {
+    const ack = args.deltaAck;
+    if (!args.delta || !ack || ack.session !== sessionRef.current) return;
+    pendingOpsRef.current = pendingOpsRef.current.filter(op => op.seq > ack.seq);
+  }, [args.delta, args.deltaAck?.session, args.deltaAck?.seq]);
 
-    const appBaseUrl = getAppBaseUrl();
+  // Python lost track of the sequence, start over from a full snapshot
+  useEffect(() => {
+    if (!args.delta || args.deltaResync === lastResyncRef.current) return;
+    lastResyncRef.current = args.deltaResync;
+    if (deferSnapshot(args.commit, pendingChanges)) {
+      snapshotDueRef.current = true;
+      return;
+    }
+    sendSnapshot(columns);
+  }, [args.delta, args.deltaResync]);
 
-    // Generate simple CSS for fonts
-    let fontCss = '';
-    for (const fontName of fontList) {
-      // Check if font name already has extension
-      const hasExtension = /\.(ttf|woff|woff2|otf)$/i.test(fontName);
-      const fontFileName = hasExtension ? fontName : `${fontName.replace(/\s+/g, '')}.ttf`;
-      const fontUrl = `${appBaseUrl}/app/static/${fontFileName}`;
-
-      fontCss += `
-@font-face {
-  font-family: "${fontName}";
-  src: url("${fontUrl}");
-  font-weight: 400;
-  font-style: normal;
-  font-display: swap;
-}
-`;
+  // Changes other sessions committed to a shared board, or the whole board when ours conflicted
+  useEffect(() => {
+    const update = args.shared;
+    if (!update || update.id === lastSharedUpdateRef.current || !hydratedRef.current) return;
+    lastSharedUpdateRef.current = update.id;
+    const next = update.columns ? withColumnIds(update.columns) : applySharedOps(columns, update.ops ?? []);
+    if (next === columns) return;
+    if (update.columns) {
+      searchIndexRef.current = null;
+      setSearchIndexVersion(version => version + 1);
+      // Unsent edits are replaced along with the board, and their operations point at
+      // positions of the old one: drop them and carry on numbering from the last value sent
+      pendingOpsRef.current = [];
+      if (lastSentSeqRef.current !== null) seqRef.current = lastSentSeqRef.current;
+      publishedColumnsRef.current = next;
+      setPendingChanges(0);
+    } else if (columns === publishedColumnsRef.current) {
+      // Not an edit of this mount, so the commit policy has nothing new to send
+      publishedColumnsRef.current = next;
     }
+    setColumns(next);
+  }, [args.shared?.id]);
+
+  // Ask Python for the next page of a paged column
+  const requestPage = (columnIndex: number) => {
+    const column = columnsRef.current[columnIndex];
+    if (!column || !column.hasMore) return;
+    const offset = column.loaded ?? column.cards.length;
+    const pendingKey = `${columnIndex}:${offset}`;
+    if (Array.from(pageRequestsRef.current.values()).includes(pendingKey)) return;
+    pageCounterRef.current += 1;
+    const request = `${sessionRef.current}-${pageCounterRef.current}`;
+    pageRequestsRef.current.set(request, pendingKey);
+    // Piggyback on the last value sent so the request doesn't commit edits the
+    // commit policy is still holding back
+    Streamlit.setComponentValue({
+      ...(lastValueRef.current || {}),
+      loadMore: { request, column: columnIndex, offset }
+    });
+  };
+
+  // Cards Python served for a load more request go at the end of their column
+  useEffect(() => {
+    const page = args.page;
+    if (!page || !pageRequestsRef.current.has(page.request)) return;
+    pageRequestsRef.current.delete(page.request);
+    const column = columns[page.column];
+    if (!column || (column.loaded ?? column.cards.length) !== page.offset) return;
+
+    // Cards already on the board (e.g. moved there before the page arrived) are skipped
+    const cardIndex = getCardIndex(columns);
+    const newCards = page.cards.filter(card => !cardIndex.has(card.id));
+    const loaded = page.offset + page.cards.length;
+    const updatedColumns = columns.slice();
+    updatedColumns[page.column] = {
+      ...column,
+      cards: [...column.cards, ...newCards],
+      loaded,
+      hasMore: page.hasMore
+    };
+    reindexColumn(cardIndex, updatedColumns, page.column, column.cards.length);
+    cardIndexRef.current = { columns: updatedColumns, index: cardIndex };
+    if (searchIndexRef.current !== null) {
+      searchIndexRef.current.add(newCards);
+      setSearchIndexVersion(version => version + 1);
+    }
+    recordOp({ type: 'append', column: page.column, request: page.request, cards: newCards.map(card => card.id), loaded });
+    setColumns(updatedColumns);
+  }, [args.page?.request]);
 
-    // Inject CSS
-    const styleElement = document.createElement('style');
-    styleElement.textContent = fontCss;
-    document.head.appendChild(styleElement);
-
-    // Set font URL for debug
-    if (fontList.length > 0) {
-      const firstFont = fontList[0];
-      const hasExtension = /\.(ttf|woff|woff2|otf)$/i.test(firstFont);
-      const fontFileName = hasExtension ? firstFont : `${firstFont.replace(/\s+/g, '')}.ttf`;
-      setFontUrl(`${appBaseUrl}/app/static/${fontFileName}`);
+  // Load fonts from /app/static, each @font-face is registered once per document (see fonts.ts)
+  useEffect(() => {
+    if (fontList.length === 0) {
+      setFontUrl(null);
+      setFontStatus('idle');
+      return;
     }
 
+    let cancelled = false;
+    const appBaseUrl = getAppBaseUrl();
+    // Python resolves font_file_name to the best file it found in the static folder
+    const urls = fontList.map((fontName, index) =>
+      fontFileUrl(fontName, appBaseUrl, index === 0 && args.font_file_name ? args.fontFile : null)
+    );
+
+    setFontStatus('loading');
+    profiler.start('fontLoad');
+    Promise.all(fontList.map((fontName, index) => loadFont(fontName, urls[index]))).then(results => {
+      if (cancelled) return;
+      profiler.end('fontLoad');
+      const firstLoaded = results.indexOf(true);
+      setFontUrl(firstLoaded === -1 ? null : urls[firstLoaded]);
+      setFontStatus(firstLoaded === -1 ? 'failed' : 'loaded');
+    });
+
     return () => {
-      if (styleElement.parentNode) {
-        document.head.removeChild(styleElement);
-      }
+      cancelled = true;
     };
-  }, [fontList]);
+  }, [fontList, args.fontFile]);
 
   const handleDragStart = (e: React.DragEvent, cardId: string) => {
     if (disabled) return;
-    setDraggedCardId(cardId);
+    setDraggedCardIds(args.multiSelect && selection.size > 1 && selection.has(cardId)
+      ? Array.from(selection)
+      : [cardId]);
+  };
+
+  // ctrl / cmd click toggles a card, shift click selects a range within the column
+  const handleSelectCard = (e: React.MouseEvent, cardId: string) => {
+    if (!args.multiSelect || disabled) return;
+    const cardIndex = getCardIndex(columns);
+    const location = cardIndex.get(cardId);
+    if (!location) return;
+    const anchor = selectionAnchorRef.current !== null ? cardIndex.get(selectionAnchorRef.current) : undefined;
+
+    if (e.shiftKey && anchor && anchor.column === location.column) {
+      const next = new Set(selection);
+      const start = Math.min(anchor.index, location.index);
+      const end = Math.max(anchor.index, location.index);
+      columns[location.column].cards.slice(start, end + 1).forEach(card => next.add(card.id));
+      setSelection(next);
+      return;
+    }
+    selectionAnchorRef.current = cardId;
+    if (e.ctrlKey || e.metaKey) {
+      const next = new Set(selection);
+      if (next.has(cardId)) {
+        next.delete(cardId);
+      } else {
+        next.add(cardId);
+      }
+      setSelection(next);
+    } else {
+      setSelection(selection.size === 1 && selection.has(cardId) ? EMPTY_SELECTION : new Set([cardId]));
+    }
   };
 
+  // Selects every card of a column, or clears them when they all are selected already
+  const handleSelectAll = (columnIndex: number) => {
+    const column = columns[columnIndex];
+    if (!args.multiSelect || !column) return;
+    // While searching only the cards shown are selected
+    const cards = matches ? column.cards.filter(card => matches.has(card.id)) : column.cards;
+    const allSelected = cards.every(card => selection.has(card.id));
+    const next = new Set(selection);
+    cards.forEach(card => {
+      if (allSelected) {
+        next.delete(card.id);
+      } else {
+        next.add(card.id);
+      }
+    });
+    setSelection(next);
+  };
+
+  // Only columns holding selected cards get the selection, the others don't re-render
+  const selectedColumns = useMemo(() => {
+    const result = new Set<number>();
+    if (selection.size === 0) return result;
+    const cardIndex = getCardIndex(columns);
+    selection.forEach(id => {
+      const location = cardIndex.get(id);
+      if (location) result.add(location.column);
+    });
+    return result;
+  }, [selection, columns]);
+
   // Handle column title changes
   const handleTitleChange = (oldTitle: string, newTitle: string, columnIndex: number) => {
-    setColumns(prevColumns => {
-      // Check if title already exists (for warning purposes only, not prohibition)
-      const isDuplicate = prevColumns.some((col, idx) => 
-        idx !== columnIndex && col.title === newTitle
-      );
-
-      if (isDuplicate) {
-        console.warn(`Warning: Column title "${newTitle}" already exists. Duplicate titles are allowed but may lead to confusion.`);
-        // Do not return here; proceed with the update
-      }
+    // The pseudo column is not part of the board state
+    if (columnIndex >= columns.length) return;
 
-      return prevColumns.map((column, idx) => {
-        // Only update the column at the specific index
-        if (idx === columnIndex) {
-          return {
-            ...column,
-            title: newTitle
-          };
-        }
-        return column;
-      });
+    // Check if title already exists (for warning purposes only, not prohibition)
+    const isDuplicate = columns.some((col, idx) => 
+      idx !== columnIndex && col.title === newTitle
+    );
+
+    if (isDuplicate) {
+      console.warn(`Warning: Column title "${newTitle}" already exists. Duplicate titles are allowed but may lead to confusion.`);
+      // Do not return here; proceed with the update
+    }
+
+    recordOp({ type: 'rename', column: columnIndex, title: newTitle });
+    const updatedColumns = columns.map((column, idx) => {
+      // Only update the column at the specific index
+      if (idx === columnIndex) {
+        return {
+          ...column,
+          title: newTitle
+        };
+      }
+      return column;
     });
+    carryCardIndex(columns, updatedColumns);
+    userEditRef.current = true;
+    setColumns(updatedColumns);
   };
 
+  const pseudoColumn = (lane?: string): ColumnData => ({
+    id: lane === undefined ? PSEUDO_COLUMN_ID : `${PSEUDO_COLUMN_ID}:${lane}`,
+    title: args.newCategoryTitle || 'New Category',
+    cards: NO_CARDS,
+    isPseudoColumn: true,
+    lane
+  });
+
   // Add pseudo-transparent column if allowed
   const displayColumns = args.allowNewCategories 
-    ? [...columns, { 
-        title: args.newCategoryTitle || 'New Category',
-        cards: [],
-        isPseudoColumn: true 
-      }] 
+    ? [...columns, pseudoColumn()] 
     : columns;
 
+  // Swimlanes: the columns of each lane with their board index, lanes in the order Python sent
+  // them (columns of lanes Python doesn't know about go last)
+  const laneGroups = useMemo(() => {
+    if (!args.lanes) return null;
+    const groups = new Map<string, Array<[ColumnData, number]>>(args.lanes.map(lane => [lane, []]));
+    columns.forEach((column, index) => {
+      const lane = column.lane ?? '';
+      if (!groups.has(lane)) groups.set(lane, []);
+      groups.get(lane)!.push([column, index]);
+    });
+    return Array.from(groups.entries());
+  }, [args.lanes, columns]);
+
   // Add this helper function at the top of the component
   const getUniqueColumnTitle = (baseTitle: string, existingColumns: Array<{title: string}>) => {
     let counter = 1;
@@ -224,128 +609,340 @@ const Board: React.FC<BoardProps> = ({ args, disabled, theme }) => {
     return newTitle;
   };
 
-  const handleDrop = (e: React.DragEvent, targetColumnTitle: string, isTargetPseudoColumn: boolean) => {
-    e.preventDefault();
-    if (disabled || !draggedCardId) return;
+  // Appends a new category holding `cards` to `updatedColumns`, returns its index
+  const createColumn = (updatedColumns: ColumnData[], cards: CardData[], lane?: string) => {
+    const newColumnTitle = getUniqueColumnTitle(
+      args.newCategoryTitle || 'New Category',
+      updatedColumns
+    );
+    // An id no other mount of the board generates
+    newColumnCounterRef.current += 1;
+    const newColumnId = `${sessionRef.current}-new-${newColumnCounterRef.current}`;
+    const columnIndex = updatedColumns.length;
+    updatedColumns.push({
+      id: newColumnId,
+      title: newColumnTitle,
+      cards,
+      isNewColumn: true,
+      ...(lane !== undefined ? { lane } : {})
+    });
+    recordOp({
+      type: 'create', column: columnIndex, title: newColumnTitle, id: newColumnId,
+      ...(lane !== undefined ? { lane } : {})
+    });
+    return columnIndex;
+  };
 
-    setColumns(prevColumns => {
-      // Find the source column and card
-      const sourceColumnIndex = prevColumns.findIndex(col => 
-        col.cards.some(card => card.id === draggedCardId)
-      );
-      
-      if (sourceColumnIndex === -1) return prevColumns;
-      
-      const sourceColumn = prevColumns[sourceColumnIndex];
-      const cardIndex = sourceColumn.cards.findIndex(c => c.id === draggedCardId);
-      const movedCard = sourceColumn.cards[cardIndex];
-
-      // Create a deep copy of the columns array
-      let updatedColumns = prevColumns.map(col => ({
-        ...col,
-        cards: [...col.cards]
-      }));
-
-      // Remove card from source
-      updatedColumns[sourceColumnIndex].cards = 
-        updatedColumns[sourceColumnIndex].cards.filter(c => c.id !== draggedCardId);
-
-      // Handle dropping in pseudo column using the flag
-      if (isTargetPseudoColumn) { // Use the boolean flag here
-        const newColumnTitle = getUniqueColumnTitle(
-          args.newCategoryTitle || 'New Category',
-          updatedColumns
-        );
-        
-        // Add the new column with the card
-        updatedColumns.push({
-          title: newColumnTitle,
-          cards: [movedCard],
-          isNewColumn: true
-        });
-      } else {
-        // Find target column and add card
-        const targetColumnIndex = updatedColumns.findIndex(col => col.title === targetColumnTitle); // Use targetColumnTitle for existing columns
-        if (targetColumnIndex !== -1) {
-          const targetCards = [...updatedColumns[targetColumnIndex].cards];
-          if (args.stacked) {
-            targetCards.unshift(movedCard); // Add to top if stacked
-          } else {
-            targetCards.push(movedCard); // Add to bottom if not stacked
-          }
-          updatedColumns[targetColumnIndex].cards = targetCards;
+  // Moves several cards as one operation, returns the new columns
+  const applyBulkMove = (
+    current: ColumnData[],
+    cardIndex: CardIndex,
+    ids: Iterable<string>,
+    target: number,
+    beforeCardId?: string | null
+  ) => {
+    const moved = moveCards(current, cardIndex, ids, target, !!args.stacked, beforeCardId);
+    if (moved.cards.length === 0) return current;
+    let ranks: string[] | undefined;
+    if (args.ranked) {
+      // Ranked between the cards around the moved block, the same way as a single card
+      const count = moved.cards.length;
+      const targetCards = moved.columns[target].cards;
+      const others = [...targetCards.slice(0, moved.index), ...targetCards.slice(moved.index + count)];
+      ranks = ranksAt(others, moved.index, count);
+      const rankedCards = targetCards.slice();
+      ranks.forEach((rank, i) => {
+        rankedCards[moved.index + i] = { ...rankedCards[moved.index + i], rank };
+      });
+      moved.columns[target] = { ...moved.columns[target], cards: rankedCards };
+    }
+    recordOp({ type: 'bulkMove', cards: moved.cards, from: moved.from, to: target, index: moved.index, ...(ranks ? { ranks } : {}) });
+    cardIndexRef.current = { columns: moved.columns, index: cardIndex };
+    return moved.columns;
+  };
+
+  // A dragged selection lands in one state update, so Streamlit gets a single value
+  const dropSelection = (
+    ids: string[],
+    targetColumnId: string,
+    isTargetPseudoColumn: boolean,
+    beforeCardId?: string | null
+  ) => {
+    const cardIndex = getCardIndex(columns);
+    let current = columns;
+    let target: number | undefined;
+    if (isTargetPseudoColumn) {
+      current = columns.slice();
+      target = createColumn(current, [], pseudoColumnLane(targetColumnId));
+    } else {
+      target = getColumnIndex(columns).get(targetColumnId);
+      if (target === undefined) return;
+    }
+    userEditRef.current = true;
+    setColumns(applyBulkMove(current, cardIndex, ids, target, beforeCardId));
+    setSelection(EMPTY_SELECTION);
+  };
+
+  // Column by id, falling back to the first column with that title
+  const findColumn = (current: ColumnData[], idOrTitle: string) => {
+    const index = getColumnIndex(current).get(idOrTitle);
+    if (index !== undefined) return index;
+    const byTitle = current.findIndex(column => column.title === idOrTitle);
+    return byTitle === -1 ? undefined : byTitle;
+  };
+
+  const bulkMoveCards = (current: ColumnData[], cardIndex: CardIndex, move: BulkMoveRequest, from?: number) => {
+    if (move.cards) {
+      return from === undefined ? move.cards : move.cards.filter(id => cardIndex.get(id)?.column === from);
+    }
+    const fields = Object.entries(move.match || {});
+    const ids: string[] = [];
+    (from === undefined ? current : [current[from]]).forEach(column => {
+      column.cards.forEach(card => {
+        const values = card as unknown as Record<string, unknown>;
+        if (fields.every(([field, value]) => values[field] != null && String(values[field]) === value)) {
+          ids.push(card.id);
         }
+      });
+    });
+    return ids;
+  };
+
+  // Apply the moves Python asked for with bulk_move, all of a rerun as one board change
+  useEffect(() => {
+    // Python stops sending a request once a value reported it, a token left out is done with
+    const sent = new Set((args.bulkMoves ?? []).map(move => move.request));
+    appliedBulkMovesRef.current.forEach(request => {
+      if (!sent.has(request)) appliedBulkMovesRef.current.delete(request);
+    });
+    const requests = (args.bulkMoves ?? []).filter(move => !appliedBulkMovesRef.current.has(move.request));
+    if (requests.length === 0 || !hydratedRef.current) return;
+    const cardIndex = getCardIndex(columns);
+    let current = columns;
+    for (const move of requests) {
+      appliedBulkMovesRef.current.add(move.request);
+      const target = findColumn(current, move.to);
+      const from = move.from != null ? findColumn(current, move.from) : undefined;
+      if (target === undefined || (move.from != null && from === undefined)) {
+        console.warn(`bulk_move: column "${target === undefined ? move.to : move.from}" not found, move skipped`);
+        continue;
       }
+      current = applyBulkMove(current, cardIndex, bulkMoveCards(current, cardIndex, move, from), target);
+    }
+    if (current !== columns) setColumns(current);
+  }, [args.bulkMoves, columns]);
 
-      return updatedColumns;
+  const handleDrop = (e: React.DragEvent, targetColumnId: string, isTargetPseudoColumn: boolean, beforeCardId?: string | null) => {
+    e.preventDefault();
+    if (disabled || !draggedCardIds) return;
+
+    profiler.start('drop');
+    setDraggedCardIds(null);
+    if (draggedCardIds.length > 1) {
+      dropSelection(draggedCardIds, targetColumnId, isTargetPseudoColumn, beforeCardId);
+      return;
+    }
+    const draggedCardId = draggedCardIds[0];
+
+    // Work from the current render's columns (not a state updater) so each drop
+    // records its delta operations and updates the card index exactly once
+    const cardIndex = getCardIndex(columns);
+    const location = cardIndex.get(draggedCardId);
+    if (!location) return;
+
+    const sourceColumnIndex = location.column;
+    const sourcePosition = location.index;
+    // Dropped on its own left half, where it already is
+    if (beforeCardId === draggedCardId) return;
+    let movedCard = columns[sourceColumnIndex].cards[sourcePosition];
+
+    // Copy only the columns that change, the rest keep their references
+    const updatedColumns = columns.slice();
+    const sourceCards = columns[sourceColumnIndex].cards.slice();
+    sourceCards.splice(sourcePosition, 1);
+    updatedColumns[sourceColumnIndex] = { ...columns[sourceColumnIndex], cards: sourceCards };
+
+    let targetColumnIndex: number;
+    let targetPosition: number;
+
+    // Handle dropping in pseudo column using the flag
+    if (isTargetPseudoColumn) { // Use the boolean flag here
+      // Add the new column with the card
+      if (args.ranked) movedCard = { ...movedCard, rank: ranksAt([], 0)[0] };
+      targetColumnIndex = createColumn(updatedColumns, [movedCard], pseudoColumnLane(targetColumnId));
+      targetPosition = 0;
+    } else {
+      // Find target column and add card
+      const targetIndex = getColumnIndex(columns).get(targetColumnId);
+      if (targetIndex === undefined) return;
+      targetColumnIndex = targetIndex;
+      const targetCards = targetColumnIndex === sourceColumnIndex
+        ? sourceCards
+        : columns[targetColumnIndex].cards.slice();
+      // In front of the card under the cursor, else on top of a stack or at the bottom
+      const before = beforeCardId != null ? cardIndex.get(beforeCardId) : undefined;
+      if (before && before.column === targetColumnIndex) {
+        targetPosition = before.index - (targetColumnIndex === sourceColumnIndex && before.index > sourcePosition ? 1 : 0);
+      } else {
+        targetPosition = args.stacked && beforeCardId === undefined ? 0 : targetCards.length;
+      }
+      if (targetColumnIndex === sourceColumnIndex && targetPosition === sourcePosition) return;
+      // Only the moved card gets a new rank, its neighbours keep theirs
+      if (args.ranked) movedCard = { ...movedCard, rank: ranksAt(targetCards, targetPosition)[0] };
+      targetCards.splice(targetPosition, 0, movedCard);
+      updatedColumns[targetColumnIndex] = { ...updatedColumns[targetColumnIndex], cards: targetCards };
+    }
+    recordOp({
+      type: 'move',
+      card: movedCard.id,
+      from: sourceColumnIndex,
+      fromIndex: sourcePosition,
+      to: targetColumnIndex,
+      index: targetPosition,
+      ...(args.ranked ? { rank: movedCard.rank } : {})
     });
 
-    setDraggedCardId(null);
-  };
+    // Only the cards after the removal / insertion points change location
+    reindexColumn(cardIndex, updatedColumns, sourceColumnIndex, sourcePosition);
+    reindexColumn(cardIndex, updatedColumns, targetColumnIndex,
+      targetColumnIndex === sourceColumnIndex ? Math.min(sourcePosition, targetPosition) : targetPosition);
+    cardIndexRef.current = { columns: updatedColumns, index: cardIndex };
 
-  const handleDragOver = (e: React.DragEvent) => {
-    e.preventDefault(); // This is necessary to allow dropping
+    userEditRef.current = true;
+    setColumns(updatedColumns);
   };
 
+  // Columns and cards are memoized, so they get handlers that keep their identity across
+  // renders and call the latest version of the functions above
+  const handlersRef = useRef({ handleDragStart, handleDrop, handleTitleChange, requestPage, handleSelectCard, handleSelectAll });
+  handlersRef.current = { handleDragStart, handleDrop, handleTitleChange, requestPage, handleSelectCard, handleSelectAll };
+  // Cards and columns are styled by one stylesheet per theme, put in the page once
+  useBoardStylesheet(theme);
+
+  const onDragStart = useCallback((e: React.DragEvent, cardId: string) =>
+    handlersRef.current.handleDragStart(e, cardId), []);
+  const onDrop = useCallback((e: React.DragEvent, title: string, isPseudo: boolean, beforeCardId?: string | null) =>
+    handlersRef.current.handleDrop(e, title, isPseudo, beforeCardId), []);
+  const onTitleChange = useCallback((oldTitle: string, newTitle: string, columnIndex: number) =>
+    handlersRef.current.handleTitleChange(oldTitle, newTitle, columnIndex), []);
+  const onLoadMore = useCallback((columnIndex: number) => handlersRef.current.requestPage(columnIndex), []);
+  const onSelectCard = useCallback((e: React.MouseEvent, cardId: string) =>
+    handlersRef.current.handleSelectCard(e, cardId), []);
+  const onSelectAll = useCallback((columnIndex: number) => handlersRef.current.handleSelectAll(columnIndex), []);
+
+  const renderColumn = (column: ColumnData, index: number) => (
+    <Column
+      key={column.id}
+      id={column.id!}
+      title={column.title}
+      cards={column.cards}
+      index={index}
+      onDragStart={onDragStart}
+      onDrop={onDrop} // Called with the column id, isPseudo flag and the card dropped in front of
+      onDragOver={handleDragOver}
+      onTitleChange={onTitleChange}
+      disabled={disabled}
+      theme={theme}
+      minWidth={args.minWidth}
+      minHeight={args.minHeight}
+      stacked={args.stacked}
+      isMainColumn={column.is_main_column}
+      mainColumnMinWidth={column.is_main_column ? (args.mainColumnMinWidth === 'stretch' ? '90%' : args.mainColumnMinWidth) : undefined}
+      mainColumnMinHeight={column.is_main_column ? (args.mainColumnMinHeight === 'stretch' ? '90%' : args.mainColumnMinHeight) : undefined}
+      isPseudoColumn={column.isPseudoColumn}
+      isNewColumn={column.isNewColumn}
+      allowRename={args.renameCategories === 'all' || 
+        (args.renameCategories === 'new_only' && column.isNewColumn)}
+      virtualizeAfter={args.virtualizeAfter}
+      virtualColumnHeight={args.virtualColumnHeight}
+      total={column.total}
+      hasMore={column.hasMore}
+      onLoadMore={onLoadMore}
+      multiSelect={args.multiSelect && !column.isPseudoColumn}
+      selection={selectedColumns.has(index) ? selection : EMPTY_SELECTION}
+      onSelectCard={onSelectCard}
+      onSelectAll={onSelectAll}
+      matches={matches}
+      highlight={highlightWords}
+    />
+  );
+
   return (
-    <div className="board stMarkdown" style={style}>
+    <div ref={boardRef} className={`board stMarkdown ${gapClass(args.gap)}`} style={boardStyle}>
+      {args.search && (
+        <div style={{ width: '100%', display: 'flex', alignItems: 'center', gap: '0.5rem' }}>
+          <input
+            type="search"
+            value={query}
+            placeholder={args.searchPlaceholder || 'Search cards'}
+            onChange={e => setQuery(e.target.value)}
+            onKeyDown={e => {
+              if (e.key === 'Escape') setQuery('');
+            }}
+            style={{
+              flex: 1,
+              maxWidth: '400px',
+              padding: '0.25rem 0.5rem',
+              borderRadius: '8px',
+              border: `1px solid ${theme?.fadedText10 || 'rgba(49, 51, 63, 0.2)'}`,
+              background: theme?.secondaryBackgroundColor || '#f0f2f6',
+              color: theme?.textColor || '#31333F',
+              fontFamily: 'inherit',
+            }}
+          />
+          {matches && (
+            <span style={{ fontSize: '0.85em', color: theme?.fadedText60 || 'rgba(49, 51, 63, 0.6)' }}>
+              {matches.size === 1 ? '1 card' : `${matches.size} cards`}
+            </span>
+          )}
+        </div>
+      )}
+      {args.commit === 'manual' && (
+        <div style={{ width: '100%', display: 'flex', justifyContent: 'flex-end' }}>
+          <button
+            onClick={publish}
+            disabled={disabled || pendingChanges === 0}
+            style={{
+              background: pendingChanges > 0 ? (theme?.primaryColor || '#ff4b4b') : 'transparent',
+              color: pendingChanges > 0 ? '#fff' : (theme?.textColor || '#31333F'),
+              border: `1px solid ${theme?.primaryColor || '#ff4b4b'}`,
+              borderRadius: '8px',
+              padding: '0.25rem 0.75rem',
+              fontFamily: 'inherit',
+              cursor: pendingChanges > 0 ? 'pointer' : 'default',
+            }}
+          >
+            {pendingChanges > 0 ? `${args.saveLabel || 'Save'} (${pendingChanges})` : (args.saveLabel || 'Save')}
+          </button>
+        </div>
+      )}
       
       {/* Debug message for theme font */}
       {args.debug_font && (
-        <div style={{
-          position: 'absolute',
-          top: '5px',
-          right: '5px',
-          background: 'rgba(255, 255, 255, 0.95)',
-          padding: '8px',
-          borderRadius: '4px',
-          fontSize: '11px',
-          color: '#333',
-          border: '1px solid #ccc',
-          zIndex: 1000,
-          maxWidth: '320px',
-          maxHeight: '400px',
-          overflowY: 'auto',
-          wordWrap: 'break-word',
-          boxShadow: '0 2px 4px rgba(0,0,0,0.1)'
-        }}>
-          <div><strong>🎨 Font Debug</strong></div>
-          <div>Theme font: <code>{theme?.font || 'undefined'}</code></div>
-          <div>Font file name passed: <code>{args.font_file_name || 'N/A'}</code></div>
-          <div>Custom font loaded: <code>{fontUrl ? 'Yes' : 'No'}</code></div>
-          <div>Font URL: <code>{fontUrl || 'N/A'}</code></div>
-          <div>Applied CSS: <code>{appliedFontFamily}</code></div>
-          <div>Font List: <code>{fontList.join(', ') || 'N/A'}</code></div>
-          <div style={{fontSize: '9px', marginTop: '4px', color: '#666'}}>
-            Fonts loaded from: <code>/app/static/*</code>
-          </div>
-        </div>
+        <Suspense fallback={null}>
+          <FontDebugPanel
+            themeFont={theme?.font}
+            fontFileName={args.font_file_name}
+            fontUrl={fontUrl}
+            fontStatus={fontStatus}
+            appliedFontFamily={appliedFontFamily}
+            fontList={fontList}
+          />
+        </Suspense>
       )}
-      {displayColumns.map((column, index) => (
-        <Column
-          key={`${column.title}-${index}`}
-          title={column.title}
-          cards={column.cards}
-          onDragStart={handleDragStart}
-          onDrop={(e, title, isPseudo) => handleDrop(e, title, isPseudo)} // Pass title and isPseudo flag
-          onDragOver={handleDragOver}
-          onTitleChange={(oldTitle, newTitle) => handleTitleChange(oldTitle, newTitle, index)}
-          disabled={disabled}
-          theme={theme}
-          minWidth={args.minWidth}
-          minHeight={args.minHeight}
-          stacked={args.stacked}
-          isMainColumn={column.is_main_column}
-          mainColumnMinWidth={column.is_main_column ? (args.mainColumnMinWidth === 'stretch' ? '90%' : args.mainColumnMinWidth) : undefined}
-          mainColumnMinHeight={column.is_main_column ? (args.mainColumnMinHeight === 'stretch' ? '90%' : args.mainColumnMinHeight) : undefined}
-          isPseudoColumn={column.isPseudoColumn}
-          isNewColumn={column.isNewColumn}
-          allowRename={args.renameCategories === 'all' || 
-            (args.renameCategories === 'new_only' && column.isNewColumn)}
-        />
-      ))}
+      {laneGroups ? laneGroups.map(([lane, entries]) => (
+        <section key={lane} style={{ width: '100%' }}>
+          <h2 style={laneTitleStyle}>{lane}</h2>
+          <div className={gapClass(args.gap)} style={laneColumnsStyle}>
+            {entries.map(([column, index]) => renderColumn(column, index))}
+            {args.allowNewCategories && renderColumn(pseudoColumn(lane), columns.length)}
+          </div>
+        </section>
+      )) : displayColumns.map(renderColumn)}
     </div>
   );
 };
 
+// The unconnected component is exported for the frontend benchmarks (see bench/)
+export { Board };
 export default withStreamlitConnection(Board);
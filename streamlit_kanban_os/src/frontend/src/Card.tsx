@@ -1,8 +1,10 @@
-import React from 'react';
+import React, { memo } from 'react';
 import { SimpleTooltip } from './SimpleTooltip';
 import { CardProps } from './types';
+import { highlightParts } from './searchIndex';
+import { CLASSES, cardClassName } from './styles';
 
-export const Card: React.FC<CardProps> = ({ 
+const CardComponent: React.FC<CardProps> = ({ 
   id, 
   title, 
   help, 
@@ -11,39 +13,20 @@ export const Card: React.FC<CardProps> = ({
   theme,
   stacked,
   index,
-  style
+  style,
+  selected,
+  onSelect,
+  highlight
 }) => {
-  const cardStyle = {
-    background: theme?.lightenedBg05 || '#ffffff',
-    color: theme?.textColor || '#31333F',
-    padding: '0.75rem',
-    marginBottom: stacked ? '0.1rem' : '0.5rem', // Decreased margin for stacked cards
-    borderRadius: '4px',
-    // border: `1px solid ${theme?.fadedText05 || 'rgba(49, 51, 63, 0.1)'}`,
-    boxShadow: `0 2px 4px ${theme?.darkenedBgMix25 || 'rgba(255, 72, 0, 0.15)'}`,
-    cursor: disabled ? 'not-allowed' : 'grab',
-    transition: 'all 0.2s ease',
-    display: 'flex' as 'flex',
-    alignItems: 'center' as 'center',
-    justifyContent: 'space-between' as 'space-between',
-    position: stacked ? 'absolute' as 'absolute' : 'static' as 'static',
-    width: stacked ? 'calc(100% - 2rem)' : 'auto',
-    maxWidth: stacked ? 'none' : '300px', // Max width for non-stacked cards
-    top: stacked ? `${index! * 16}px` : 'auto',
-    bottom: stacked ? '4rem' : 'auto',
-    // left: stacked ? '1rem' : 'auto',
-    zIndex: stacked ? 100 - index! : 'auto',
-    ...style, // Apply passed in style
-    ':hover': {
-      boxShadow: `0 2px 4px ${theme?.darkenedBgMix25 || 'rgba(151, 166, 195, 0.25)'}`,
-      borderColor: theme?.primaryColor || '#ff4b4b',
-    }
-  };
-
   return (
     <div
-      style={cardStyle}
+      // Styled by the board stylesheet (styles.ts), so no style object is built per card
+      className={cardClassName(stacked, index, selected, disabled)}
+      style={style}
+      data-card-id={id}
       draggable={!disabled}
+      aria-selected={onSelect ? !!selected : undefined}
+      onClick={onSelect && !disabled ? (e) => onSelect(e, id) : undefined}
       onDragStart={(e) => {
         e.dataTransfer.setData('text/plain', id);
         onDragStart(e, id);
@@ -51,15 +34,14 @@ export const Card: React.FC<CardProps> = ({
     >
       {/* add a subtle :: to hint this is dragable */}
 
-      <span style={{
-        overflow: 'hidden',
-        textOverflow: 'ellipsis',
-        whiteSpace: 'nowrap',
-        flex: 1
-      }}>
-        {title}
+      <span className={CLASSES.cardTitle}>
+        {highlight && highlight.length > 0
+          ? highlightParts(title, highlight).map((part, i) => part.match ? <mark key={i}>{part.text}</mark> : part.text)
+          : title}
       </span>
       {help && <SimpleTooltip content={help} theme={theme} />}
     </div>
   );
 };
+
+export const Card = memo(CardComponent);
@@ -1,11 +1,15 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect, useMemo, memo } from 'react';
 import { Card } from './Card';
 import { ColumnProps, CardData } from './types';
-import { Edit } from 'react-feather'; // Import the Edit icon
+import { CheckSquare, Edit } from './icons';
+import { useVirtualWindow } from './useVirtualWindow';
+import { CLASSES, STACK_DEPTH } from './styles';
 
-export const Column: React.FC<ColumnProps> = ({ 
+const ColumnComponent: React.FC<ColumnProps> = ({ 
+  id,
   title, 
-  cards, 
+  index: columnIndex,
+  cards: allCards, 
   onDragStart, 
   onDrop, 
   onDragOver, 
@@ -20,98 +24,93 @@ export const Column: React.FC<ColumnProps> = ({
   onTitleChange,
   isPseudoColumn,
   isNewColumn,
-  allowRename 
+  allowRename,
+  virtualizeAfter,
+  virtualColumnHeight = 600,
+  total,
+  hasMore,
+  onLoadMore,
+  multiSelect,
+  selection,
+  onSelectCard,
+  onSelectAll,
+  matches,
+  highlight
 }) => {
   const [isEditing, setIsEditing] = useState(false);
   const [editedTitle, setEditedTitle] = useState(title);
 
-  const getColumnStyle = (props: { stacked: boolean | undefined, isMainColumn: boolean | undefined, mainColumnMinWidth: string | number | undefined, mainColumnMinHeight: string | number | undefined }) => {
-    const { stacked, isMainColumn, mainColumnMinWidth, mainColumnMinHeight } = props;
+  // While searching only the matching cards are drawn
+  const cards = useMemo(
+    () => matches ? allCards.filter(card => matches.has(card.id)) : allCards,
+    [allCards, matches]
+  );
 
-    const baseStyle = {
-      background: theme?.secondaryBackgroundColor || '#f0f2f6',
-      padding: '1rem',
-      borderRadius: '8px',
-      boxShadow: `0 1px 3px ${theme?.darkenedBgMix15 || 'rgba(151, 166, 195, 0.15)'}`,
-      ...(minWidth ? { minWidth } : {}),
-      ...(minHeight ? { minHeight } : {}),
-      ...(isMainColumn && mainColumnMinWidth ? { minWidth: mainColumnMinWidth } : {}),
-      ...(isMainColumn && mainColumnMinHeight ? { minHeight: mainColumnMinHeight } : {}),
-      maxWidth: '400px', // Max width for columns
-    };
+  // Long non stacked columns scroll and only mount the cards in view
+  const virtualized = !stacked && virtualizeAfter != null && cards.length > virtualizeAfter;
+  const virtualWindow = useVirtualWindow(cards.length, virtualColumnHeight, virtualized);
+  const hiddenStackedCards = stacked ? Math.max(0, cards.length - STACK_DEPTH) : 0;
 
-    if (stacked) {
-      return {
-        ...baseStyle,
-        position: 'relative' as 'relative',
-        overflow: 'visible' as 'visible', // needed because stacked cards use absolute positioning
-        top: '0rem',
-        // Only set minWidth if not already set by props or main column settings
-        ...(baseStyle.minWidth ? {} : { minWidth: '200px' }), // Ensure minimum width for stacked columns
-        // top margin reduction
-        // marginTop: '-1rem',
-      };
+  // Paged columns load the next page once a virtualized column is scrolled to the end
+  // (not while searching, the end of the results is not the end of the column)
+  useEffect(() => {
+    if (virtualized && !matches && hasMore && onLoadMore && virtualWindow.end >= cards.length) {
+      onLoadMore(columnIndex);
     }
+  }, [virtualized, matches, hasMore, virtualWindow.end, cards.length]);
 
-    return baseStyle;
-  };
-  // a function to make more transparent a box background
-  const makeBackgroundTransparent = (color: string, opacity: number) => {
-    // Handle RGB/RGBA format
-    const rgbaMatch = color.match(/rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*[\d.]+)?\)/);
-    if (rgbaMatch) {
-      const [_, r, g, b] = rgbaMatch;
-      return `rgba(${r}, ${g}, ${b}, ${opacity})`;
-    }
+  // Only the sizes passed to kanban_board are set inline, the rest comes from the board stylesheet
+  const columnMinWidth = (isMainColumn && mainColumnMinWidth) || minWidth;
+  const columnMinHeight = (isMainColumn && mainColumnMinHeight) || minHeight;
+  const columnStyle = useMemo(() => (columnMinWidth || columnMinHeight)
+    ? { ...(columnMinWidth ? { minWidth: columnMinWidth } : {}), ...(columnMinHeight ? { minHeight: columnMinHeight } : {}) }
+    : undefined, [columnMinWidth, columnMinHeight]);
+  const columnClassName = [
+    CLASSES.column,
+    stacked && CLASSES.columnStacked,
+    isPseudoColumn && CLASSES.columnPseudo,
+  ].filter(Boolean).join(' ');
 
-    // Handle HEX format
-    const hexMatch = color.match(/^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i);
-    if (hexMatch) {
-      const [_, r, g, b] = hexMatch;
-      const rgb = {
-        r: parseInt(r, 16),
-        g: parseInt(g, 16),
-        b: parseInt(b, 16)
-      };
-      return `rgba(${rgb.r}, ${rgb.g}, ${rgb.b}, ${opacity})`;
+  // The card a drop lands in front of (null after the last card), from where the cursor is
+  // among the cards drawn. Stacked columns keep dropping on top of the stack.
+  const dropTarget = (e: React.DragEvent<HTMLElement>): string | null | undefined => {
+    if (stacked || isPseudoColumn) return undefined;
+    const elements = Array.from(e.currentTarget.querySelectorAll<HTMLElement>('[data-card-id]'));
+    for (const element of elements) {
+      const rect = element.getBoundingClientRect();
+      // cards wrap into rows: above this card's row, or on its row left of its middle
+      if (e.clientY < rect.top || (e.clientY <= rect.bottom && e.clientX < rect.left + rect.width / 2)) {
+        return element.dataset.cardId!;
+      }
     }
-
-    // If color format is not recognized, return with default opacity
-    console.warn(`Unrecognized color format: ${color}`);
-    return `${color.split(')')[0]}, ${opacity})`;
-  };
-  const columnStyle = {
-    ...getColumnStyle({ stacked, isMainColumn, mainColumnMinWidth, mainColumnMinHeight }),
-    ...(isPseudoColumn && {
-      border: '2px dashed rgba(49, 51, 63, 0.8)',
-      background: makeBackgroundTransparent(theme?.secondaryBackgroundColor || '#f0f2f6', 0.2),
-      backdropFilter: 'blur(2px)',
-    })
-  };
-
-  const titleStyle = {
-    color: theme?.textColor || '#31333F',
-    fontSize: stacked ? '0.9em' : '1.1em',
-    fontWeight: 600,
-    marginBottom: stacked ? '0.5rem' : '1rem',
-    padding: stacked ? '0.2rem 0.5rem' : '0.5rem',
-    borderBottom: stacked ? 'none' : `2px solid ${theme?.fadedText10 || 'rgba(49, 51, 63, 0.2)'}`,
-    marginTop: stacked ? '0rem' : '0rem',
-    // textAlign is removed here as flexbox's justifyContent will handle alignment
+    if (elements.length === 0) return null;
+    // after the last card drawn, which isn't the last one when virtualized or searching
+    const last = allCards.findIndex(card => card.id === elements[elements.length - 1].dataset.cardId);
+    return allCards[last + 1]?.id ?? null;
   };
 
-  const getCardOpacity = (index: number) => {
-    // Use a logarithmic scale to reduce opacity with depth
-    if (index < 3) return 1
-    const maxOpacity = 1;
-    const minOpacity = 0;
-    const depthFactor = Math.log(index + 1); // Using log to slow down the opacity reduction
-    
-    return Math.min(maxOpacity, Math.max(minOpacity, 1 - (depthFactor * 0.6)));
-  };
+  const renderCard = (card: CardData, index: number) => (
+    <Card
+      key={card.id}
+      id={card.id}
+      title={card.title}
+      help={card.help}
+      stacked={stacked}
+      onDragStart={onDragStart}
+      disabled={disabled}
+      theme={theme}
+      // Only stacked cards use their position, so other cards don't re-render when it shifts
+      index={stacked ? index : undefined}
+      selected={selection?.has(card.id)}
+      onSelect={multiSelect ? onSelectCard : undefined}
+      highlight={matches ? highlight : undefined}
+    />
+  );
 
   const handleTitleClick = () => {
     if (allowRename) {
+      // Start from the current title, it may have been renamed elsewhere since the last edit
+      setEditedTitle(title);
       setIsEditing(true);
     }
   };
@@ -126,7 +125,7 @@ export const Column: React.FC<ColumnProps> = ({
       // Notify parent of title change only if onTitleChange is provided
       if (onTitleChange) { // Add this check
         
-        onTitleChange(title, editedTitle);
+        onTitleChange(title, editedTitle, columnIndex);
       }
       else {
         console.warn("onTitleChange handler is not provided.");
@@ -136,10 +135,11 @@ export const Column: React.FC<ColumnProps> = ({
 
   return (
     <div
+      className={columnClassName}
       style={columnStyle}
       onDrop={(e) => {
         e.preventDefault();
-        onDrop(e, title, !!isPseudoColumn); // Pass title and isPseudoColumn flag
+        onDrop(e, id, !!isPseudoColumn, dropTarget(e)); // Pass id, isPseudoColumn flag and drop position
       }}
       onDragOver={(e) => {
         e.preventDefault();
@@ -151,64 +151,83 @@ export const Column: React.FC<ColumnProps> = ({
           onChange={handleTitleChange}
           onBlur={handleTitleBlur}
           autoFocus
-          style={{
-            ...titleStyle,
-            border: 'none',
-            background: 'transparent',
-            width: '100%'
-          }}
+          className={`${CLASSES.columnTitle} ${CLASSES.columnTitleInput}`}
         />
       ) : (
-        <h3 
-          style={{
-            ...titleStyle,
-            cursor: allowRename ? 'pointer' : 'default',
-            display: 'flex', // Make h3 a flex container
-            alignItems: 'center', // Vertically center items
-            justifyContent: stacked ? 'center' : 'flex-start', // Align based on stacked prop
-          }}
+        <h3
+          className={allowRename ? `${CLASSES.columnTitle} ${CLASSES.renamable}` : CLASSES.columnTitle}
           onClick={handleTitleClick}
         >
-          {editedTitle}
+          {title}
+          {matches
+            ? <span className={CLASSES.badge}>{cards.length}</span>
+            : total != null
+              ? <span className={CLASSES.badge}>{cards.length}/{total}</span>
+              : virtualized && <span className={CLASSES.badge}>{cards.length}</span>}
+          {multiSelect && cards.length > 0 && (
+            <span
+              title="Select all"
+              role="button"
+              onClick={(e) => {
+                e.stopPropagation(); // don't start renaming the column
+                if (!disabled && onSelectAll) onSelectAll(columnIndex);
+              }}
+              className={disabled ? `${CLASSES.selectAll} ${CLASSES.disabled}` : CLASSES.selectAll}
+            >
+              <CheckSquare size={16} className={CLASSES.icon} />
+            </span>
+          )}
           {allowRename && (
-            <Edit 
-              size={16} // Adjust size as needed
-              style={{ 
-                marginLeft: '0.5rem', // Space between title and icon
-                color: theme?.fadedText10 || 'rgba(49, 51, 63, 0.5)', // Icon color
-                flexShrink: 0, // Prevent icon from shrinking
-              }} 
-            />
+            <Edit size={16} className={`${CLASSES.icon} ${CLASSES.iconAfter}`} />
           )}
         </h3>
       )}
-      <div style={{
-        position: 'relative',
-        minHeight: stacked ? `${Math.min(cards.length, 2) * 30 + 20}px` : 'auto',
-        display: stacked ? 'block' : 'flex',
-        flexWrap: stacked ? 'nowrap' : 'wrap',
-        gap: stacked ? '0' : '0.5rem'
-      }}>
-        {cards.map((card, index) => (
-          <Card
-            key={card.id}
-            id={card.id}
-            title={card.title}
-            help={card.help}
-            stacked={stacked}
-            onDragStart={(e) => onDragStart(e, card.id)}
+      {virtualized ? (
+        <div
+          className={CLASSES.scroller}
+          style={{ maxHeight: virtualColumnHeight }}
+          onScroll={virtualWindow.onScroll}
+        >
+          <div style={{ paddingTop: virtualWindow.paddingTop, paddingBottom: virtualWindow.paddingBottom }}>
+            {cards.slice(virtualWindow.start, virtualWindow.end).map((card, offset) => (
+              // flow-root keeps the card margin inside the measured row height
+              <div
+                key={card.id}
+                className={CLASSES.row}
+                ref={offset === 0 ? virtualWindow.measureRef : undefined}
+              >
+                {renderCard(card, virtualWindow.start + offset)}
+              </div>
+            ))}
+          </div>
+        </div>
+      ) : (
+        <div
+          className={CLASSES.cards}
+          style={stacked ? { minHeight: `${Math.min(cards.length, 2) * 30 + 20}px` } : undefined}
+        >
+          {(stacked ? cards.slice(0, STACK_DEPTH) : cards).map(renderCard)}
+        </div>
+      )}
+      {hasMore && onLoadMore && (
+        <div className={CLASSES.footer}>
+          <button
+            onClick={() => onLoadMore(columnIndex)}
             disabled={disabled}
-            theme={theme}
-            index={index}
-            style={{
-              ...(!stacked ? {} : {
-                display: index >= 6 ? 'none' : 'flex',
-                opacity: getCardOpacity(index)
-              })
-            }}
-          />
-        ))}
-      </div>
+            className={`${CLASSES.badge} ${CLASSES.button}${disabled ? ` ${CLASSES.disabled}` : ''}`}
+          >
+            Load more
+          </button>
+        </div>
+      )}
+      {hiddenStackedCards > 0 && (
+        <div className={CLASSES.footer}>
+          <span className={CLASSES.badge}>+{hiddenStackedCards} more</span>
+        </div>
+      )}
     </div>
   );
 };
+
+// Re-renders only when its own props change, e.g. the source and target columns of a drop
+export const Column = memo(ColumnComponent);
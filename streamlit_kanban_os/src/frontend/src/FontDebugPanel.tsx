@@ -0,0 +1,57 @@
+import React, { useRef } from 'react';
+import { FontStatus } from './fonts';
+import { useFrameOverlay } from './frameHeight';
+
+interface FontDebugPanelProps {
+  themeFont?: string;
+  fontFileName?: string;
+  fontUrl: string | null;
+  fontStatus: FontStatus;
+  appliedFontFamily?: string;
+  fontList: string[];
+}
+
+// Shown with kanban_board(debug_font=True), loaded as its own chunk only then
+const FontDebugPanel: React.FC<FontDebugPanelProps> = ({
+  themeFont,
+  fontFileName,
+  fontUrl,
+  fontStatus,
+  appliedFontFamily,
+  fontList
+}) => {
+  const ref = useRef<HTMLDivElement>(null);
+  useFrameOverlay(ref);
+  return (
+    <div ref={ref} style={{
+      position: 'absolute',
+      top: '5px',
+      right: '5px',
+      background: 'rgba(255, 255, 255, 0.95)',
+      padding: '8px',
+      borderRadius: '4px',
+      fontSize: '11px',
+      color: '#333',
+      border: '1px solid #ccc',
+      zIndex: 1000,
+      maxWidth: '320px',
+      maxHeight: '400px',
+      overflowY: 'auto',
+      wordWrap: 'break-word',
+      boxShadow: '0 2px 4px rgba(0,0,0,0.1)'
+    }}>
+      <div><strong>🎨 Font Debug</strong></div>
+      <div>Theme font: <code>{themeFont || 'undefined'}</code></div>
+      <div>Font file name passed: <code>{fontFileName || 'N/A'}</code></div>
+      <div>Custom font loaded: <code>{fontUrl ? 'Yes' : 'No'}</code> ({fontStatus})</div>
+      <div>Font URL: <code>{fontUrl || 'N/A'}</code></div>
+      <div>Applied CSS: <code>{appliedFontFamily}</code></div>
+      <div>Font List: <code>{fontList.join(', ') || 'N/A'}</code></div>
+      <div style={{fontSize: '9px', marginTop: '4px', color: '#666'}}>
+        Fonts loaded from: <code>/app/static/*</code>
+      </div>
+    </div>
+  );
+};
+
+export default FontDebugPanel;
@@ -0,0 +1,38 @@
+import React, { useRef } from 'react';
+import { useFrameOverlay } from './frameHeight';
+import { SimpleTooltipProps } from './types';
+
+// The hover text of SimpleTooltip, loaded on the first hover (see SimpleTooltip.tsx)
+const TooltipBubble: React.FC<SimpleTooltipProps & { visible: boolean }> = ({ content, theme, visible }) => {
+  const ref = useRef<HTMLDivElement>(null);
+  useFrameOverlay(ref);
+  const tooltipContentStyle = {
+    position: 'absolute' as const,
+    top: '50%',
+    left: '110%', // Position to the right of the icon
+    transform: 'translateY(-50%)',
+    background: theme?.lightenedBg05 || '#ffffff',
+    color: theme?.textColor || '#31333F',
+    padding: '0.5rem 0.75rem',
+    borderRadius: '4px',
+    fontSize: '12px',
+    whiteSpace: 'nowrap' as const,
+    pointerEvents: 'auto' as const, // Allow interactions
+    opacity: visible ? 1 : 0,
+    visibility: (visible ? "visible" : "hidden") as "visible" | "hidden",
+    transition: 'opacity 0.2s, visibility 0.2s',
+    zIndex: 100,
+    boxShadow: '0 2px 8px rgba(0, 0, 0, 0.1)',
+    border: `1px solid ${theme?.fadedText05 || 'rgba(49, 51, 63, 0.1)'}`,
+    marginLeft: '0.5rem',
+  };
+
+  return (
+    <div ref={ref} style={tooltipContentStyle}>
+      {content} 
+      {/* TODO ALLOW USER TO SELECT TEXT OR OPEN HYPERLINKS HERE */}
+    </div>
+  );
+};
+
+export default TooltipBubble;
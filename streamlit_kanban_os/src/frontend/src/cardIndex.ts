@@ -0,0 +1,108 @@
+import { ColumnData } from './types';
+
+// Where a card currently sits on the board
+export interface CardLocation {
+  column: number;
+  index: number;
+}
+
+export type CardIndex = Map<string, CardLocation>;
+
+/**
+ * Builds the card id -> location map for a whole board. O(total cards), so
+ * only done when the board is replaced wholesale, moves update it incrementally.
+ */
+export const buildCardIndex = (columns: ColumnData[]): CardIndex => {
+  const index: CardIndex = new Map();
+  columns.forEach((column, columnIndex) => {
+    column.cards.forEach((card, cardIndex) => {
+      index.set(card.id, { column: columnIndex, index: cardIndex });
+    });
+  });
+  return index;
+};
+
+/**
+ * Refreshes the locations of the cards of one column from position `start`
+ * onwards, which is all that changes when a card is removed from or inserted into it.
+ */
+export const reindexColumn = (index: CardIndex, columns: ColumnData[], columnIndex: number, start: number = 0) => {
+  const cards = columns[columnIndex].cards;
+  for (let i = Math.max(0, start); i < cards.length; i++) {
+    index.set(cards[i].id, { column: columnIndex, index: i });
+  }
+};
+
+export interface BulkMove {
+  columns: ColumnData[];
+  // Moved card ids in board order, with the column each one came from
+  cards: string[];
+  from: number[];
+  // Position of the first moved card in the target column
+  index: number;
+}
+
+/**
+ * Moves several cards into one column, keeping their board order. They land in
+ * front of `beforeId` (or the first card after it that isn't moving), at the
+ * bottom when it is null, and without one at the top when `atTop` and at the
+ * bottom otherwise, the same way as a single dropped card. Each column the cards leave is
+ * filtered once and only the touched columns are copied and reindexed, so a
+ * whole selection costs about the same as a single move. Updates `index` in place,
+ * ids that are not on the board are ignored.
+ */
+export const moveCards = (
+  columns: ColumnData[],
+  index: CardIndex,
+  ids: Iterable<string>,
+  target: number,
+  atTop: boolean,
+  beforeId?: string | null
+): BulkMove => {
+  const located: Array<{ id: string } & CardLocation> = [];
+  for (const id of ids) {
+    const location = index.get(id);
+    if (location) located.push({ id, ...location });
+  }
+  located.sort((a, b) => a.column - b.column || a.index - b.index);
+  const moving = new Set(located.map(card => card.id));
+  const movedCards = located.map(card => columns[card.column].cards[card.index]);
+
+  // First removed position per source column, where its reindexing starts
+  const firstRemoved = new Map<number, number>();
+  located.forEach(card => {
+    if (!firstRemoved.has(card.column)) firstRemoved.set(card.column, card.index);
+  });
+
+  const updated = columns.slice();
+  firstRemoved.forEach((_, column) => {
+    updated[column] = { ...columns[column], cards: columns[column].cards.filter(card => !moving.has(card.id)) };
+  });
+  const remaining = updated[target].cards;
+  let position = atTop && beforeId === undefined ? 0 : remaining.length;
+  const before = beforeId != null ? index.get(beforeId) : undefined;
+  if (before && before.column === target) {
+    // Cards staying in the target column in front of the drop point
+    const targetCards = columns[target].cards;
+    let staying = 0;
+    for (let i = 0; i < targetCards.length; i++) {
+      if (moving.has(targetCards[i].id)) continue;
+      if (i >= before.index) {
+        position = staying;
+        break;
+      }
+      staying++;
+    }
+  }
+  updated[target] = {
+    ...updated[target],
+    cards: [...remaining.slice(0, position), ...movedCards, ...remaining.slice(position)]
+  };
+
+  firstRemoved.forEach((start, column) => {
+    if (column !== target) reindexColumn(index, updated, column, start);
+  });
+  reindexColumn(index, updated, target, Math.min(position, firstRemoved.get(target) ?? position));
+
+  return { columns: updated, cards: located.map(card => card.id), from: located.map(card => card.column), index: position };
+};
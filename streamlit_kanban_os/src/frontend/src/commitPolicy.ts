@@ -0,0 +1,37 @@
+import { BoardArgs } from './types';
+
+export type CommitPolicy = NonNullable<BoardArgs['commit']>;
+
+// What happens to a board change: sent now, sent once edits stop for debounceMs,
+// held for the Save button, or nothing (the board is the one Streamlit has)
+export type CommitAction = 'publish' | 'debounce' | 'hold' | 'none';
+
+export interface BoardChange {
+  // Nothing was sent to Streamlit yet on this mount
+  first: boolean;
+  // The board is the one last sent
+  unchanged: boolean;
+  // Made by the user on this board (a drop or a rename), not a loaded page, an update
+  // from another session or a move Python asked for
+  userEdit: boolean;
+  // User edits the policy is holding back
+  pendingEdits: number;
+}
+
+/**
+ * Decides what the commit policy does with a board change. Only user edits wait for
+ * the policy and count towards the Save button. Other changes go out straight away,
+ * unless user edits are waiting: sending them would commit those edits too, so they
+ * go out with them.
+ */
+export const commitAction = (policy: CommitPolicy | undefined, change: BoardChange): CommitAction => {
+  if (change.first || !policy || policy === 'immediate') return 'publish';
+  if (change.unchanged) return 'none';
+  if (!change.userEdit && change.pendingEdits === 0) return 'publish';
+  return policy === 'debounce' ? 'debounce' : 'hold';
+};
+
+// A snapshot Python asked for would also commit the edits the policy is holding
+// back, so it waits for them
+export const deferSnapshot = (policy: CommitPolicy | undefined, pendingEdits: number) =>
+  !!policy && policy !== 'immediate' && pendingEdits > 0;
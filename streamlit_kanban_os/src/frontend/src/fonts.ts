@@ -0,0 +1,105 @@
+// Font loading shared by every board rendered in this document.
+// Each @font-face is registered once and its load result is cached, so
+// re-renders and additional boards reuse it instead of injecting it again.
+
+// Font file extensions in order of preference, the Python side picks the first one present
+export const FONT_EXTS = ["woff2", "woff", "ttf", "otf"];
+
+const FONT_FORMATS: Record<string, string> = {
+  woff2: 'woff2',
+  woff: 'woff',
+  ttf: 'truetype',
+  otf: 'opentype',
+};
+
+// CSS generic families never have a file behind them
+const GENERIC_FAMILIES = new Set([
+  'serif', 'sans-serif', 'monospace', 'cursive', 'fantasy', 'system-ui',
+  'ui-serif', 'ui-sans-serif', 'ui-monospace', 'ui-rounded', 'emoji', 'math',
+]);
+
+export type FontStatus = 'idle' | 'loading' | 'loaded' | 'failed';
+
+const fontLoads = new Map<string, Promise<boolean>>();
+
+/**
+ * Font names to load - font_file_name takes priority over theme.font
+ */
+export const parseFontList = (fontFileName?: string, themeFont?: string): string[] => {
+  if (fontFileName && fontFileName.trim() !== '') {
+    return [fontFileName.trim()];
+  }
+  return themeFont
+    ? themeFont.replace(/"/g, '').split(',').map(f => f.trim()).filter(f => f !== '')
+    : [];
+};
+
+export const getAppBaseUrl = () => {
+  try {
+    if (window.parent && window.parent.location) {
+      return window.parent.location.origin;
+    }
+  } catch (e) {
+    // CORS might block this
+  }
+  return window.location.origin.replace(':5173', ':9268');
+};
+
+/**
+ * URL of the file for `fontName` under /app/static. `resolvedFile` is the file
+ * name Python found on disk, without it the name is used as is when it has an
+ * extension and `.ttf` is assumed otherwise.
+ */
+export const fontFileUrl = (fontName: string, appBaseUrl: string, resolvedFile?: string | null) => {
+  const hasExtension = new RegExp(`\\.(${FONT_EXTS.join('|')})$`, 'i').test(fontName);
+  const fontFileName = resolvedFile || (hasExtension ? fontName : `${fontName.replace(/\s+/g, '')}.ttf`);
+  return `${appBaseUrl}/app/static/${fontFileName}`;
+};
+
+const fontFormat = (url: string) => {
+  const ext = url.split('.').pop()?.toLowerCase() || '';
+  return FONT_FORMATS[ext] || 'truetype';
+};
+
+const loadWithFontFace = (family: string, url: string) => {
+  const face = new FontFace(family, `url("${url}") format("${fontFormat(url)}")`, {
+    weight: '400',
+    style: 'normal',
+    display: 'swap',
+  });
+  document.fonts.add(face);
+  return face.load().then(() => true, () => false);
+};
+
+// Older browsers without the FontFace API
+const loadWithStyleElement = (family: string, url: string) => {
+  const styleElement = document.createElement('style');
+  styleElement.textContent = `
+@font-face {
+  font-family: "${family}";
+  src: url("${url}") format("${fontFormat(url)}");
+  font-weight: 400;
+  font-style: normal;
+  font-display: swap;
+}
+`;
+  document.head.appendChild(styleElement);
+  if (!document.fonts) return Promise.resolve(true);
+  return document.fonts.load(`16px "${family}"`).then(faces => faces.length > 0, () => false);
+};
+
+/**
+ * Registers `family` from `url` once per document and resolves to whether it loaded.
+ */
+export const loadFont = (family: string, url: string): Promise<boolean> => {
+  if (GENERIC_FAMILIES.has(family.toLowerCase())) return Promise.resolve(false);
+  const cacheKey = `${family}|${url}`;
+  let load = fontLoads.get(cacheKey);
+  if (!load) {
+    load = typeof FontFace !== 'undefined' && document.fonts
+      ? loadWithFontFace(family, url)
+      : loadWithStyleElement(family, url);
+    fontLoads.set(cacheKey, load);
+  }
+  return load;
+};
@@ -0,0 +1,51 @@
+import { ArrowTable } from 'streamlit-component-lib';
+import { CardData, ColumnData, FrameColumns } from './types';
+
+/**
+ * Groups the rows of a DataFrame sent by kanban_board(group_by=...) into board columns.
+ *
+ * Columns follow `categories`, groups that are not listed are appended in
+ * order of first appearance.
+ */
+export const columnsFromFrame = (table: ArrowTable, spec: FrameColumns, categories: string[] = []): ColumnData[] => {
+  // Position of each DataFrame column in the table, from the (single level) header row
+  const positions = new Map<string, number>();
+  for (let c = table.headerColumns; c < table.headerColumns + table.dataColumns; c++) {
+    positions.set(String(table.getCell(table.headerRows - 1, c).content), c);
+  }
+  const position = (name: string) => {
+    const c = positions.get(name);
+    if (c === undefined) {
+      throw new Error(`Column "${name}" not found in the DataFrame`);
+    }
+    return c;
+  };
+  const idColumn = position(spec.id);
+  const titleColumn = position(spec.title);
+  const groupColumn = position(spec.group);
+  const helpColumn = spec.help ? position(spec.help) : null;
+
+  // Groups are unique, so they double as column ids
+  const columns: ColumnData[] = categories.map(title => ({ id: title, title, cards: [] }));
+  const byTitle = new Map(columns.map(column => [column.title, column]));
+
+  for (let r = table.headerRows; r < table.headerRows + table.dataRows; r++) {
+    const group = String(table.getCell(r, groupColumn).content);
+    let column = byTitle.get(group);
+    if (!column) {
+      column = { id: group, title: group, cards: [] };
+      columns.push(column);
+      byTitle.set(group, column);
+    }
+    const card: CardData = {
+      id: String(table.getCell(r, idColumn).content),
+      title: String(table.getCell(r, titleColumn).content ?? ''),
+    };
+    if (helpColumn !== null) {
+      const help = table.getCell(r, helpColumn).content;
+      if (help != null && help !== '') card.help = String(help);
+    }
+    column.cards.push(card);
+  }
+  return columns;
+};
@@ -0,0 +1,91 @@
+import { RefObject, useEffect, useRef } from 'react';
+import { Streamlit } from 'streamlit-component-lib';
+import { Profiler } from './profiler';
+
+const requestFrame = (callback: () => void): number =>
+  typeof requestAnimationFrame === 'function' ? requestAnimationFrame(callback) : window.setTimeout(callback, 16);
+const cancelFrame = (handle: number) =>
+  typeof cancelAnimationFrame === 'function' ? cancelAnimationFrame(handle) : window.clearTimeout(handle);
+
+// Overlays registered with useFrameOverlay, and how the mounted useFrameHeight hears of them
+const overlays = new Set<HTMLElement>();
+let overlayChanged: ((element: HTMLElement, mounted: boolean) => void) | null = null;
+
+/**
+ * Keeps the iframe as tall as the document while `ref`'s element changes size.
+ *
+ * A ResizeObserver on the element and on the body (rather than an effect on
+ * every render) catches drops, reruns and font swaps alike. Overlays such as
+ * tooltips are positioned absolutely and resize neither, they register with
+ * useFrameOverlay and are observed too, and measured when they mount and
+ * unmount. Changes are batched into one measurement per animation frame, and
+ * the host page is only told about heights that actually changed. Without
+ * ResizeObserver the height is checked after every render.
+ */
+export const useFrameHeight = (ref: RefObject<HTMLElement>, profiler?: Profiler) => {
+  const scheduleRef = useRef<(() => void) | null>(null);
+  const observed = typeof ResizeObserver !== 'undefined';
+
+  useEffect(() => {
+    const element = ref.current;
+    if (!element) return;
+    let lastHeight: number | null = null;
+    let frame: number | null = null;
+
+    const update = () => {
+      frame = null;
+      const height = document.body.scrollHeight;
+      if (height === lastHeight) return;
+      lastHeight = height;
+      if (profiler) {
+        profiler.time('frameHeight', () => Streamlit.setFrameHeight(height));
+      } else {
+        Streamlit.setFrameHeight(height);
+      }
+    };
+    const schedule = () => {
+      if (frame === null) frame = requestFrame(update);
+    };
+    scheduleRef.current = schedule;
+    schedule();
+
+    const observer = observed ? new ResizeObserver(schedule) : null;
+    observer?.observe(element);
+    observer?.observe(document.body);
+    overlays.forEach(overlay => observer?.observe(overlay));
+    overlayChanged = (overlay, mounted) => {
+      if (mounted) observer?.observe(overlay);
+      else observer?.unobserve(overlay);
+      schedule();
+    };
+    window.addEventListener('resize', schedule);
+    return () => {
+      observer?.disconnect();
+      overlayChanged = null;
+      window.removeEventListener('resize', schedule);
+      if (frame !== null) cancelFrame(frame);
+      scheduleRef.current = null;
+    };
+  }, []);
+
+  useEffect(() => {
+    if (!observed) scheduleRef.current?.();
+  });
+};
+
+/**
+ * Registers an absolutely positioned overlay (tooltip, panel) with useFrameHeight,
+ * so the frame grows to show it while it is mounted.
+ */
+export const useFrameOverlay = (ref: RefObject<HTMLElement>) => {
+  useEffect(() => {
+    const element = ref.current;
+    if (!element) return;
+    overlays.add(element);
+    overlayChanged?.(element, true);
+    return () => {
+      overlays.delete(element);
+      overlayChanged?.(element, false);
+    };
+  }, []);
+};
@@ -0,0 +1,51 @@
+import React from 'react';
+
+// The few Feather icons (https://feathericons.com, MIT) the board uses, inlined so the
+// bundle doesn't carry the whole react-feather package
+
+interface IconProps {
+  size?: number;
+  color?: string;
+  style?: React.CSSProperties;
+  className?: string;
+}
+
+const Icon: React.FC<IconProps & { children: React.ReactNode }> = ({ size = 24, color = 'currentColor', style, className, children }) => (
+  <svg
+    xmlns="http://www.w3.org/2000/svg"
+    width={size}
+    height={size}
+    viewBox="0 0 24 24"
+    fill="none"
+    stroke={color}
+    strokeWidth={2}
+    strokeLinecap="round"
+    strokeLinejoin="round"
+    style={style}
+    className={className}
+  >
+    {children}
+  </svg>
+);
+
+export const Edit: React.FC<IconProps> = props => (
+  <Icon {...props}>
+    <path d="M11 4H4a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7" />
+    <path d="M18.5 2.5a2.121 2.121 0 0 1 3 3L12 15l-4 1 1-4 9.5-9.5z" />
+  </Icon>
+);
+
+export const CheckSquare: React.FC<IconProps> = props => (
+  <Icon {...props}>
+    <polyline points="9 11 12 14 22 4" />
+    <path d="M21 12v7a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2h11" />
+  </Icon>
+);
+
+export const HelpCircle: React.FC<IconProps> = props => (
+  <Icon {...props}>
+    <circle cx="12" cy="12" r="10" />
+    <path d="M9.09 9a3 3 0 0 1 5.83 1c0 2-3 3-3 3" />
+    <line x1="12" y1="17" x2="12.01" y2="17" />
+  </Icon>
+);
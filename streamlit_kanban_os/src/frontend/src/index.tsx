@@ -12,8 +12,9 @@ if (!rootElement) {
 
 const root = createRoot(rootElement);
 
+// StrictMode's double renders and checks only help during development, the release build skips them
 root.render(
-  <StrictMode>
-    <Board />
-  </StrictMode>
-);
\ No newline at end of file
+  import.meta.env.DEV
+    ? <StrictMode><Board /></StrictMode>
+    : <Board />
+);
@@ -0,0 +1,73 @@
+// Timings recorded with kanban_board(profile=True), sent back to Python with the component value.
+// Each measurement is also added to the performance timeline (named "kanban:<name>") so it shows
+// up in the browser's DevTools.
+
+export interface TimingStats {
+  count: number;
+  last: number;
+  mean: number;
+  max: number;
+}
+
+export type ProfileStats = Record<string, TimingStats>;
+
+const round = (value: number) => Math.round(value * 100) / 100;
+
+export class Profiler {
+  enabled = false;
+  private stats: ProfileStats = {};
+  private started = new Map<string, number>();
+
+  start(name: string) {
+    if (!this.enabled) return;
+    this.started.set(name, performance.now());
+  }
+
+  // Ends a measurement opened with start(), does nothing if there is none
+  end(name: string) {
+    const start = this.started.get(name);
+    if (start === undefined) return;
+    this.started.delete(name);
+    const end = performance.now();
+    try {
+      performance.measure(`kanban:${name}`, { start, end });
+    } catch {
+      // Older browsers only take mark names, the stats below are all we need
+    }
+    this.record(name, end - start);
+  }
+
+  pending(name: string) {
+    return this.started.has(name);
+  }
+
+  // Times a synchronous call
+  time<T>(name: string, fn: () => T): T {
+    this.start(name);
+    try {
+      return fn();
+    } finally {
+      this.end(name);
+    }
+  }
+
+  record(name: string, value: number) {
+    if (!this.enabled) return;
+    const stats = this.stats[name];
+    if (!stats) {
+      this.stats[name] = { count: 1, last: round(value), mean: round(value), max: round(value) };
+      return;
+    }
+    const mean = stats.mean + (value - stats.mean) / (stats.count + 1);
+    this.stats[name] = {
+      count: stats.count + 1,
+      last: round(value),
+      mean: round(mean),
+      max: round(Math.max(stats.max, value)),
+    };
+  }
+
+  snapshot(): ProfileStats {
+    return { ...this.stats };
+  }
+}
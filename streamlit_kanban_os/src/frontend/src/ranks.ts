@@ -0,0 +1,60 @@
+import { CardData } from './types';
+
+// Fractional rank keys, computed the same way as ranks.py: base 62 fractions without
+// the leading "0." that never end with "0", so string order is card order. Both are
+// tested against tests/data/rank_vectors.json at the repository root
+const DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz';
+
+const digitValue = (digit: string) => DIGITS.indexOf(digit);
+
+const isRank = (value: unknown): value is string =>
+  typeof value === 'string' && value !== '' && !value.endsWith('0') &&
+  Array.from(value).every(digit => digitValue(digit) !== -1);
+
+// low < high as fractions, high null stands for 1
+const midpoint = (low: string, high: string | null): string => {
+  if (high !== null) {
+    let shared = 0;
+    while (shared < high.length && (low[shared] ?? '0') === high[shared]) shared++;
+    if (shared > 0) return high.slice(0, shared) + midpoint(low.slice(shared), high.slice(shared));
+  }
+  const lowDigit = low ? digitValue(low[0]) : 0;
+  const highDigit = high !== null ? digitValue(high[0]) : DIGITS.length;
+  if (highDigit - lowDigit > 1) return DIGITS[(lowDigit + highDigit + 1) >> 1];
+  // consecutive digits, go one digit further
+  if (high !== null && high.length > 1) return high.slice(0, 1);
+  return DIGITS[lowDigit] + midpoint(low.slice(1), null);
+};
+
+// Throws like key_between in ranks.py when `before` doesn't sort before `after`, the ranks
+// Python sends are put in order by ranks.fill
+export const keyBetween = (before: string | null, after: string | null): string => {
+  if (before !== null && after !== null && before >= after) {
+    throw new RangeError(`Rank ${before} does not sort before ${after}`);
+  }
+  return midpoint(before ?? '', after);
+};
+
+export const keysBetween = (before: string | null, after: string | null, count: number): string[] => {
+  if (count <= 0) return [];
+  const middle = keyBetween(before, after);
+  const half = count >> 1;
+  return [...keysBetween(before, middle, half), middle, ...keysBetween(middle, after, count - half - 1)];
+};
+
+/**
+ * Ranks for `count` cards inserted at `position` of `cards` (which doesn't hold them
+ * yet), between the nearest ranked cards on either side. Cards without a rank,
+ * e.g. from a page loaded later, are skipped.
+ */
+export const ranksAt = (cards: CardData[], position: number, count: number = 1): string[] => {
+  let before: string | null = null;
+  for (let i = position - 1; i >= 0 && before === null; i--) {
+    if (isRank(cards[i].rank)) before = cards[i].rank!;
+  }
+  let after: string | null = null;
+  for (let i = position; i < cards.length && after === null; i++) {
+    if (isRank(cards[i].rank)) after = cards[i].rank!;
+  }
+  return keysBetween(before, after, count);
+};
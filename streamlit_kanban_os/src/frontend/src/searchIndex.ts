@@ -0,0 +1,100 @@
+import { CardData, ColumnData } from './types';
+
+const WORD = /[\p{L}\p{N}]+/gu;
+
+export const tokenize = (text: string): string[] => (text.toLowerCase().match(WORD) || []);
+
+/**
+ * Word index over the card titles and help texts, for the search box.
+ *
+ * It maps words to card ids and never stores where a card is, so moves leave
+ * it untouched: it is built once for a board and only grows when cards are
+ * added (pages of paged columns). Query words match as prefixes, found by a
+ * binary search over the sorted vocabulary.
+ */
+export class SearchIndex {
+  private postings = new Map<string, Set<string>>();
+  private sortedWords: string[] | null = null;
+
+  constructor(columns: ColumnData[]) {
+    columns.forEach(column => this.add(column.cards));
+  }
+
+  add(cards: CardData[]) {
+    cards.forEach(card => {
+      const words = tokenize(card.help ? `${card.title} ${card.help}` : card.title);
+      words.forEach(word => {
+        let ids = this.postings.get(word);
+        if (!ids) {
+          ids = new Set();
+          this.postings.set(word, ids);
+          this.sortedWords = null;
+        }
+        ids.add(card.id);
+      });
+    });
+  }
+
+  // Ids of the cards having a word that starts with each query word, null for an empty query
+  search(query: string): Set<string> | null {
+    const words = tokenize(query);
+    if (words.length === 0) return null;
+    let result: Set<string> | null = null;
+    for (const word of words) {
+      const ids = this.prefixMatches(word);
+      result = result === null ? ids : intersect(result, ids);
+      if (result.size === 0) break;
+    }
+    return result;
+  }
+
+  private prefixMatches(prefix: string): Set<string> {
+    if (this.sortedWords === null) {
+      this.sortedWords = Array.from(this.postings.keys()).sort();
+    }
+    const words = this.sortedWords;
+    let low = 0;
+    let high = words.length;
+    while (low < high) {
+      const middle = (low + high) >> 1;
+      if (words[middle] < prefix) low = middle + 1;
+      else high = middle;
+    }
+    const ids = new Set<string>();
+    for (let i = low; i < words.length && words[i].startsWith(prefix); i++) {
+      this.postings.get(words[i])!.forEach(id => ids.add(id));
+    }
+    return ids;
+  }
+}
+
+const intersect = (a: Set<string>, b: Set<string>) => {
+  const [small, large] = a.size <= b.size ? [a, b] : [b, a];
+  const result = new Set<string>();
+  small.forEach(id => {
+    if (large.has(id)) result.add(id);
+  });
+  return result;
+};
+
+export interface TextPart {
+  text: string;
+  match: boolean;
+}
+
+// Splits text so the start of every word matching a query word can be highlighted
+export const highlightParts = (text: string, queryWords: string[]): TextPart[] => {
+  const parts: TextPart[] = [];
+  let last = 0;
+  for (const found of text.matchAll(WORD)) {
+    const word = found[0].toLowerCase();
+    const length = queryWords.reduce((longest, query) => word.startsWith(query) ? Math.max(longest, query.length) : longest, 0);
+    if (length === 0) continue;
+    const start = found.index!;
+    if (start > last) parts.push({ text: text.slice(last, start), match: false });
+    parts.push({ text: text.slice(start, start + length), match: true });
+    last = start + length;
+  }
+  if (last < text.length) parts.push({ text: text.slice(last), match: false });
+  return parts;
+};
@@ -0,0 +1,62 @@
+import { CardData, ColumnData, SharedOp } from './types';
+
+/**
+ * Applies operations committed by other sessions (kanban_board(shared=...), see
+ * sharing.py). Cards and columns are looked up by id rather than position, as
+ * this board can hold edits the commit policy hasn't sent yet. Only the touched
+ * columns are copied, and the same array is returned when nothing applied.
+ */
+export const applySharedOps = (columns: ColumnData[], ops: SharedOp[]): ColumnData[] => {
+  let updated = columns;
+  const columnById = (id?: string) => id === undefined ? -1 : updated.findIndex(column => column.id === id);
+  const edit = () => {
+    if (updated === columns) updated = columns.slice();
+    return updated;
+  };
+
+  for (const op of ops) {
+    if (op.type === 'move' || op.type === 'bulkMove') {
+      const target = columnById(op.toId);
+      if (target === -1) continue;
+      const ids = op.type === 'move' ? [op.card] : op.cards;
+      const moving = new Set(ids);
+      const taken = new Map<string, CardData>();
+      updated.forEach((column, i) => {
+        if (!column.cards.some(card => moving.has(card.id))) return;
+        edit()[i] = {
+          ...column,
+          cards: column.cards.filter(card => {
+            if (!moving.has(card.id)) return true;
+            taken.set(card.id, card);
+            return false;
+          })
+        };
+      });
+      const ranks = op.type === 'move' ? (op.rank !== undefined ? [op.rank] : undefined) : op.ranks;
+      const cards = ids
+        .map((id, i) => {
+          const card = taken.get(id);
+          return card && ranks?.[i] !== undefined ? { ...card, rank: ranks[i] } : card;
+        })
+        .filter((card): card is CardData => card !== undefined);
+      if (cards.length === 0) continue;
+      const targetCards = updated[target].cards.slice();
+      targetCards.splice(Math.min(op.index, targetCards.length), 0, ...cards);
+      edit()[target] = { ...updated[target], cards: targetCards };
+    } else if (op.type === 'rename') {
+      const column = columnById(op.columnId);
+      if (column === -1 || updated[column].title === op.title) continue;
+      edit()[column] = { ...updated[column], title: op.title };
+    } else if (op.type === 'create') {
+      if (columnById(op.id) !== -1) continue;
+      edit().push({
+        id: op.id,
+        title: op.title,
+        cards: [],
+        isNewColumn: true,
+        ...(op.lane !== undefined ? { lane: op.lane } : {})
+      });
+    }
+  }
+  return updated;
+};
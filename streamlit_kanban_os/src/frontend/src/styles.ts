@@ -0,0 +1,150 @@
+import { useInsertionEffect, useMemo } from 'react';
+
+// Stacked columns only draw this many cards, the rest are summarised in a badge
+export const STACK_DEPTH = 6;
+
+// Class names of the board stylesheet, cards and columns only pick from these
+export const CLASSES = {
+  card: 'kb-card',
+  cardStacked: 'kb-card--stacked',
+  cardSelected: 'kb-card--selected',
+  cardDisabled: 'kb-card--disabled',
+  cardTitle: 'kb-card__title',
+  column: 'kb-column',
+  columnStacked: 'kb-column--stacked',
+  columnPseudo: 'kb-column--pseudo',
+  columnTitle: 'kb-column__title',
+  columnTitleInput: 'kb-column__title-input',
+  renamable: 'kb-renamable',
+  cards: 'kb-cards',
+  scroller: 'kb-scroller',
+  row: 'kb-row',
+  footer: 'kb-footer',
+  badge: 'kb-badge',
+  button: 'kb-button',
+  icon: 'kb-icon',
+  iconAfter: 'kb-icon--after',
+  selectAll: 'kb-select-all',
+  disabled: 'kb-disabled',
+} as const;
+
+export const gapClass = (gap?: string) => `kb-gap-${gap === 'small' || gap === 'large' ? gap : 'medium'}`;
+
+// Precomputed so a card's class name is a lookup, not a string built per render
+const CARD_CLASSES = new Map<string, string>();
+export const cardClassName = (stacked?: boolean, depth?: number, selected?: boolean, disabled?: boolean) => {
+  const key = `${stacked ? depth : ''}|${selected ? 1 : 0}|${disabled ? 1 : 0}`;
+  let className = CARD_CLASSES.get(key);
+  if (className === undefined) {
+    className = [
+      CLASSES.card,
+      stacked && `${CLASSES.cardStacked} kb-card--depth-${depth}`,
+      selected && CLASSES.cardSelected,
+      disabled && CLASSES.cardDisabled,
+    ].filter(Boolean).join(' ');
+    CARD_CLASSES.set(key, className);
+  }
+  return className;
+};
+
+const stackedOpacity = (depth: number) => {
+  // Use a logarithmic scale to reduce opacity with depth
+  if (depth < 3) return 1;
+  return Math.min(1, Math.max(0, 1 - Math.log(depth + 1) * 0.6));
+};
+
+// A theme color with another opacity, for the see-through pseudo column
+export const withOpacity = (color: string, opacity: number) => {
+  const rgbaMatch = color.match(/rgba?\((\d+),\s*(\d+),\s*(\d+)(?:,\s*[\d.]+)?\)/);
+  if (rgbaMatch) {
+    const [, r, g, b] = rgbaMatch;
+    return `rgba(${r}, ${g}, ${b}, ${opacity})`;
+  }
+  const hexMatch = color.match(/^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i);
+  if (hexMatch) {
+    const [, r, g, b] = hexMatch;
+    return `rgba(${parseInt(r, 16)}, ${parseInt(g, 16)}, ${parseInt(b, 16)}, ${opacity})`;
+  }
+  console.warn(`Unrecognized color format: ${color}`);
+  return `${color.split(')')[0]}, ${opacity})`;
+};
+
+interface Palette {
+  text: string;
+  primary: string;
+  cardBackground: string;
+  columnBackground: string;
+  cardShadow: string;
+  columnShadow: string;
+  faded05: string;
+  faded10: string;
+}
+
+const paletteOf = (theme: any): Palette => ({
+  text: theme?.textColor || '#31333F',
+  primary: theme?.primaryColor || '#ff4b4b',
+  cardBackground: theme?.lightenedBg05 || '#ffffff',
+  columnBackground: theme?.secondaryBackgroundColor || '#f0f2f6',
+  cardShadow: theme?.darkenedBgMix25 || 'rgba(255, 72, 0, 0.15)',
+  columnShadow: theme?.darkenedBgMix15 || 'rgba(151, 166, 195, 0.15)',
+  faded05: theme?.fadedText05 || 'rgba(49, 51, 63, 0.1)',
+  faded10: theme?.fadedText10 || 'rgba(49, 51, 63, 0.2)',
+});
+
+export const buildStylesheet = (p: Palette) => {
+  const depths = Array.from({ length: STACK_DEPTH }, (_, depth) =>
+    `.kb-card--depth-${depth}{top:${depth * 16}px;z-index:${100 - depth};opacity:${stackedOpacity(depth)}}`
+  ).join('\n');
+  return `
+.kb-card{background:${p.cardBackground};color:${p.text};padding:0.75rem;margin-bottom:0.5rem;border-radius:4px;box-shadow:0 2px 4px ${p.cardShadow};cursor:grab;transition:box-shadow 0.2s ease;display:flex;align-items:center;justify-content:space-between;max-width:300px}
+.kb-card:hover{box-shadow:0 2px 4px ${p.cardShadow},0 0 0 1px ${p.primary}}
+.kb-card--disabled{cursor:not-allowed}
+.kb-card--disabled:hover{box-shadow:0 2px 4px ${p.cardShadow}}
+.kb-card--selected{outline:2px solid ${p.primary};outline-offset:-2px}
+.kb-card--stacked{position:absolute;width:calc(100% - 2rem);max-width:none;margin-bottom:0.1rem;bottom:4rem}
+${depths}
+.kb-card__title{overflow:hidden;text-overflow:ellipsis;white-space:nowrap;flex:1}
+.kb-column{background:${p.columnBackground};padding:1rem;border-radius:8px;box-shadow:0 1px 3px ${p.columnShadow};max-width:400px}
+.kb-column--stacked{position:relative;overflow:visible;top:0;min-width:200px}
+.kb-column--pseudo{border:2px dashed rgba(49, 51, 63, 0.8);background:${withOpacity(p.columnBackground, 0.2)};backdrop-filter:blur(2px)}
+.kb-column__title{color:${p.text};font-size:1.1em;font-weight:600;margin:0 0 1rem 0;padding:0.5rem;border-bottom:2px solid ${p.faded10};display:flex;align-items:center;justify-content:flex-start;cursor:default}
+.kb-column--stacked .kb-column__title{font-size:0.9em;margin-bottom:0.5rem;padding:0.2rem 0.5rem;border-bottom:none;justify-content:center}
+.kb-column__title-input{display:block;border:none;background:transparent;width:100%;font-family:inherit}
+.kb-renamable{cursor:pointer}
+.kb-cards{position:relative;display:flex;flex-wrap:wrap;gap:0.5rem}
+.kb-column--stacked .kb-cards{display:block;flex-wrap:nowrap;gap:0}
+.kb-scroller{position:relative;overflow-y:auto}
+.kb-row{display:flow-root}
+.kb-footer{display:flex;justify-content:center;margin-top:0.5rem}
+.kb-badge{margin-left:0.5rem;padding:0 0.4rem;border-radius:999px;font-size:0.75em;font-weight:400;background:${p.faded05};color:${p.text}}
+.kb-button{margin-left:0;padding:0.2rem 0.75rem;border:none;font-family:inherit;cursor:pointer}
+.kb-icon{color:${p.faded10};flex-shrink:0}
+.kb-icon--after{margin-left:0.5rem}
+.kb-select-all{display:flex;margin-left:0.5rem;cursor:pointer}
+.kb-disabled{cursor:not-allowed}
+.kb-gap-small{gap:0.5rem}
+.kb-gap-medium{gap:1rem}
+.kb-gap-large{gap:2rem}
+`;
+};
+
+const STYLESHEET_ID = 'kanban-board-styles';
+
+/**
+ * Puts the board stylesheet for `theme` in the document head. It is built and
+ * written once per theme, however many cards and columns use it.
+ */
+export const useBoardStylesheet = (theme: any) => {
+  const palette = paletteOf(theme);
+  const paletteKey = Object.values(palette).join('|');
+  const css = useMemo(() => buildStylesheet(palette), [paletteKey]);
+  useInsertionEffect(() => {
+    let element = document.getElementById(STYLESHEET_ID) as HTMLStyleElement | null;
+    if (!element) {
+      element = document.createElement('style');
+      element.id = STYLESHEET_ID;
+      document.head.appendChild(element);
+    }
+    if (element.textContent !== css) element.textContent = css;
+  }, [css]);
+};
@@ -1,5 +1,5 @@
 import React from 'react';
-import { ComponentProps } from 'streamlit-component-lib';
+import { ArrowTable, ComponentProps } from 'streamlit-component-lib';
 
 // Centralized type definitions for the Kanban board components
 
@@ -7,14 +7,52 @@ export interface CardData {
   id: string;
   title: string;
   help?: string;
+  // Sort key within the column, kanban_board(ranked=True)
+  rank?: string;
 }
 
 export interface ColumnData {
+  // Optional in the payload, every column on the board has one (see withColumnIds)
+  id?: string;
   title: string;
   cards: CardData[];
   is_main_column?: boolean;
   isPseudoColumn?: boolean;
   isNewColumn?: boolean;
+  // Paged columns (PagedColumn in Python) only hold the cards loaded so far
+  total?: number | null;
+  loaded?: number;
+  pageSize?: number;
+  hasMore?: boolean;
+  // Swimlane the column belongs to, kanban_board(columns={lane: [...]})
+  lane?: string;
+}
+
+// A page of cards served by Python for a "load more" request
+export interface PageResponse {
+  request: string;
+  column: number;
+  offset: number;
+  cards: CardData[];
+  hasMore: boolean;
+}
+
+// A move requested by Python with kanban_board(bulk_move=...), columns by id or title
+export interface BulkMoveRequest {
+  // Token of the request, applied once and reported back under bulkApplied
+  request: string;
+  to: string;
+  from?: string | null;
+  cards?: string[] | null;
+  match?: Record<string, string> | null;
+}
+
+// DataFrame column names sent with kanban_board(group_by=...)
+export interface FrameColumns {
+  id: string;
+  title: string;
+  help?: string | null;
+  group: string;
 }
 
 export interface BoardArgs {
@@ -25,7 +63,12 @@ export interface BoardArgs {
   width: 'stretch' | number;
   height: 'content' | 'stretch' | number;
   border: boolean;
-  columns: ColumnData[];
+  columns: ColumnData[] | null;
+  revision?: string | null;
+  page?: PageResponse | null;
+  data?: ArrowTable | null;
+  dataColumns?: FrameColumns | null;
+  categories?: string[] | null;
   minWidth?: string | number;
   minHeight?: string | number;
   stacked?: boolean;
@@ -33,9 +76,51 @@ export interface BoardArgs {
   mainColumnMinHeight?: string | number;
   debug_font?: boolean;
   font_file_name?: string;
+  fontFile?: string | null;
   allowNewCategories?: boolean;
   renameCategories?: 'none' | 'new_only' | 'all';
   newCategoryTitle?: string;
+  virtualizeAfter?: number | null;
+  virtualColumnHeight?: number;
+  commit?: 'immediate' | 'debounce' | 'manual';
+  debounceMs?: number;
+  saveLabel?: string;
+  delta?: boolean;
+  deltaAck?: DeltaAck | null;
+  deltaResync?: number | null;
+  profile?: boolean;
+  multiSelect?: boolean;
+  bulkMoves?: BulkMoveRequest[] | null;
+  search?: boolean;
+  searchPlaceholder?: string;
+  lanes?: string[] | null;
+  shared?: SharedUpdate | null;
+  ranked?: boolean;
+}
+
+// Operations sent to Python in delta mode, columns are addressed by position
+export type BoardOp =
+  | { type: 'move'; card: string; from: number; fromIndex: number; to: number; index: number; rank?: string }
+  | { type: 'rename'; column: number; title: string }
+  | { type: 'create'; column: number; title: string; id: string; lane?: string }
+  | { type: 'append'; column: number; request: string; cards: string[]; loaded: number }
+  | { type: 'bulkMove'; cards: string[]; from: number[]; to: number; index: number; ranks?: string[] };
+
+export type SequencedOp = BoardOp & { seq: number };
+
+// Operations other sessions committed to a shared board, their columns are also named by id
+export type SharedOp = BoardOp & { fromId?: string; fromIds?: string[]; toId?: string; columnId?: string };
+
+// News from kanban_board(shared=...): operations other sessions committed, or the whole board
+export interface SharedUpdate {
+  id: number;
+  ops?: SharedOp[] | null;
+  columns?: ColumnData[] | null;
+}
+
+export interface DeltaAck {
+  session: string;
+  seq: number;
 }
 
 export interface BoardProps extends ComponentProps {
@@ -44,12 +129,15 @@ export interface BoardProps extends ComponentProps {
 }
 
 export interface ColumnProps {
+  id: string;
   title: string;
+  index: number;
   cards: CardData[];
   onDragStart: (e: React.DragEvent, cardId: string) => void;
-  onDrop: (e: React.DragEvent, targetColumnTitle: string, isTargetPseudoColumn: boolean) => void; // Updated signature
+  // beforeCardId: the card the drop lands in front of, null after the last card
+  onDrop: (e: React.DragEvent, targetColumnId: string, isTargetPseudoColumn: boolean, beforeCardId?: string | null) => void;
   onDragOver: (e: React.DragEvent) => void;
-  onTitleChange?: (oldTitle: string, newTitle: string) => void;
+  onTitleChange?: (oldTitle: string, newTitle: string, columnIndex: number) => void;
   disabled?: boolean;
   theme?: any;
   minWidth?: string | number;
@@ -61,6 +149,18 @@ export interface ColumnProps {
   isPseudoColumn?: boolean;
   isNewColumn?: boolean;
   allowRename?: boolean;
+  virtualizeAfter?: number | null;
+  virtualColumnHeight?: number;
+  total?: number | null;
+  hasMore?: boolean;
+  onLoadMore?: (columnIndex: number) => void;
+  multiSelect?: boolean;
+  selection?: ReadonlySet<string>;
+  onSelectCard?: (e: React.MouseEvent, cardId: string) => void;
+  onSelectAll?: (columnIndex: number) => void;
+  // Search box results: ids of the matching cards (null shows every card) and the query words
+  matches?: ReadonlySet<string> | null;
+  highlight?: string[];
 }
 
 export interface CardProps {
@@ -73,6 +173,9 @@ export interface CardProps {
   stacked?: boolean;
   index?: number;
   style?: React.CSSProperties;
+  selected?: boolean;
+  onSelect?: (e: React.MouseEvent, id: string) => void;
+  highlight?: string[];
 }
 
 export interface SimpleTooltipProps {
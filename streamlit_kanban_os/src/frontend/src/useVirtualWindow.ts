@@ -0,0 +1,61 @@
+import React, { useState, useCallback } from 'react';
+
+// Rough height of a non stacked card (padding, one line of text and margin)
+// used until the first mounted row has been measured
+const ESTIMATED_ROW_HEIGHT = 52;
+
+export interface VirtualWindow {
+  start: number;
+  end: number;
+  paddingTop: number;
+  paddingBottom: number;
+  onScroll: (e: React.UIEvent<HTMLElement>) => void;
+  measureRef: (element: HTMLElement | null) => void;
+}
+
+/**
+ * Works out which rows of a fixed-height scrolling list are visible.
+ *
+ * Only rows in [start, end) should be mounted, the rest of the scroll height
+ * is filled with paddingTop / paddingBottom. When disabled every row is in the window.
+ *
+ * @param count - Number of rows in the list
+ * @param viewportHeight - Height of the scrolling container in pixels
+ * @param enabled - Whether to window the list at all
+ * @param overscan - Extra rows mounted above and below the visible ones
+ */
+export const useVirtualWindow = (
+  count: number,
+  viewportHeight: number,
+  enabled: boolean,
+  overscan: number = 5
+): VirtualWindow => {
+  const [scrollTop, setScrollTop] = useState(0);
+  const [rowHeight, setRowHeight] = useState(ESTIMATED_ROW_HEIGHT);
+
+  const onScroll = useCallback((e: React.UIEvent<HTMLElement>) => {
+    setScrollTop(e.currentTarget.scrollTop);
+  }, []);
+
+  // Attach to one rendered row, rows are assumed to share its height
+  const measureRef = useCallback((element: HTMLElement | null) => {
+    if (element && element.offsetHeight > 0) {
+      setRowHeight(prev => prev === element.offsetHeight ? prev : element.offsetHeight);
+    }
+  }, []);
+
+  if (!enabled) {
+    return { start: 0, end: count, paddingTop: 0, paddingBottom: 0, onScroll, measureRef };
+  }
+
+  const start = Math.min(count, Math.max(0, Math.floor(scrollTop / rowHeight) - overscan));
+  const end = Math.min(count, Math.ceil((scrollTop + viewportHeight) / rowHeight) + overscan);
+  return {
+    start,
+    end,
+    paddingTop: start * rowHeight,
+    paddingBottom: (count - end) * rowHeight,
+    onScroll,
+    measureRef
+  };
+};
@@ -0,0 +1,75 @@
+import { describe, expect, it } from "vitest"
+import { buildCardIndex, moveCards } from "../src/cardIndex"
+import { ColumnData } from "../src/types"
+
+const board = (): ColumnData[] => [
+  { id: "a", title: "A", cards: ["1", "2", "3"].map(id => ({ id, title: id })) },
+  { id: "b", title: "B", cards: ["4", "5", "6"].map(id => ({ id, title: id })) },
+]
+
+const cardIds = (columns: ColumnData[]) => columns.map(column => column.cards.map(card => card.id))
+
+describe("moveCards", () => {
+  it("drops the cards in front of the card under the cursor", () => {
+    const columns = board()
+    const moved = moveCards(columns, buildCardIndex(columns), ["1", "2"], 1, false, "5")
+    expect(cardIds(moved.columns)).toEqual([["3"], ["4", "1", "2", "5", "6"]])
+    expect(moved.index).toBe(1)
+  })
+
+  it("skips moving cards to find where the drop lands", () => {
+    const columns = board()
+    const moved = moveCards(columns, buildCardIndex(columns), ["4", "1"], 1, false, "4")
+    expect(cardIds(moved.columns)).toEqual([["2", "3"], ["1", "4", "5", "6"]])
+    expect(moved.index).toBe(0)
+  })
+
+  it("goes to the bottom below the last card, and on top of a stack without a card", () => {
+    let columns = board()
+    expect(cardIds(moveCards(columns, buildCardIndex(columns), ["1"], 1, true, null).columns)[1])
+      .toEqual(["4", "5", "6", "1"])
+    columns = board()
+    expect(cardIds(moveCards(columns, buildCardIndex(columns), ["1"], 1, true).columns)[1])
+      .toEqual(["1", "4", "5", "6"])
+  })
+
+  it("drops in front of a card in the target column when the cards come from several columns", () => {
+    const columns = board()
+    const moved = moveCards(columns, buildCardIndex(columns), ["5", "1", "3"], 1, true, "6")
+    expect(cardIds(moved.columns)).toEqual([["2"], ["4", "1", "3", "5", "6"]])
+    expect(moved.cards).toEqual(["1", "3", "5"])
+    expect(moved.from).toEqual([0, 0, 1])
+    expect(moved.index).toBe(1)
+  })
+
+  it("goes to the bottom when every card from beforeId on is moving", () => {
+    const columns = board()
+    const moved = moveCards(columns, buildCardIndex(columns), ["2", "3"], 0, true, "2")
+    expect(cardIds(moved.columns)).toEqual([["1", "2", "3"], ["4", "5", "6"]])
+    expect(moved.index).toBe(1)
+  })
+
+  it("reorders within a column", () => {
+    const columns = board()
+    const moved = moveCards(columns, buildCardIndex(columns), ["3"], 0, false, "1")
+    expect(cardIds(moved.columns)).toEqual([["3", "1", "2"], ["4", "5", "6"]])
+    expect(moved.index).toBe(0)
+  })
+
+  it("goes to the bottom when beforeId is not in the target column", () => {
+    let columns = board()
+    expect(cardIds(moveCards(columns, buildCardIndex(columns), ["1"], 1, true, "2").columns)[1])
+      .toEqual(["4", "5", "6", "1"])
+    columns = board()
+    expect(cardIds(moveCards(columns, buildCardIndex(columns), ["1"], 1, false, "missing").columns)[1])
+      .toEqual(["4", "5", "6", "1"])
+  })
+
+  it("keeps the index up to date", () => {
+    const columns = board()
+    const index = buildCardIndex(columns)
+    const moved = moveCards(columns, index, ["3", "6"], 0, false, "2")
+    expect(cardIds(moved.columns)).toEqual([["1", "3", "6", "2"], ["4", "5"]])
+    expect(index).toEqual(buildCardIndex(moved.columns))
+  })
+})
@@ -0,0 +1,45 @@
+import { describe, expect, it } from "vitest"
+import { BoardChange, commitAction, deferSnapshot } from "../src/commitPolicy"
+
+const change = (overrides: Partial<BoardChange> = {}): BoardChange => ({
+  first: false,
+  unchanged: false,
+  userEdit: true,
+  pendingEdits: 0,
+  ...overrides,
+})
+
+describe("commitAction", () => {
+  it("sends every change right away with the immediate policy", () => {
+    expect(commitAction("immediate", change())).toBe("publish")
+    expect(commitAction(undefined, change({ userEdit: false }))).toBe("publish")
+  })
+
+  it("always sends the first board of a mount", () => {
+    expect(commitAction("manual", change({ first: true }))).toBe("publish")
+  })
+
+  it("holds user edits for the timer or the Save button", () => {
+    expect(commitAction("debounce", change())).toBe("debounce")
+    expect(commitAction("manual", change({ pendingEdits: 2 }))).toBe("hold")
+    expect(commitAction("manual", change({ unchanged: true, pendingEdits: 2 }))).toBe("none")
+  })
+
+  it("sends other changes right away unless user edits are waiting", () => {
+    expect(commitAction("manual", change({ userEdit: false }))).toBe("publish")
+    expect(commitAction("debounce", change({ userEdit: false }))).toBe("publish")
+    // sending now would commit the waiting edits
+    expect(commitAction("manual", change({ userEdit: false, pendingEdits: 1 }))).toBe("hold")
+    // the change cancelled the running timer, it is started again
+    expect(commitAction("debounce", change({ userEdit: false, pendingEdits: 1 }))).toBe("debounce")
+  })
+})
+
+describe("deferSnapshot", () => {
+  it("waits for held back edits", () => {
+    expect(deferSnapshot("manual", 1)).toBe(true)
+    expect(deferSnapshot("debounce", 3)).toBe(true)
+    expect(deferSnapshot("manual", 0)).toBe(false)
+    expect(deferSnapshot("immediate", 1)).toBe(false)
+  })
+})
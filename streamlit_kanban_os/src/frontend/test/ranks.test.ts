@@ -0,0 +1,23 @@
+import { describe, expect, it } from "vitest"
+import { keyBetween, keysBetween } from "../src/ranks"
+// Shared with tests/test_ranks.py, so both sides compute the same ranks
+import vectors from "../../../../tests/data/rank_vectors.json"
+
+type Bound = string | null
+
+describe("ranks", () => {
+  it.each(vectors.between as [Bound, Bound, string][])("keyBetween(%s, %s) is %s", (before, after, expected) => {
+    expect(keyBetween(before, after)).toBe(expected)
+  })
+
+  it.each(vectors.outOfOrder as [string, string][])("keyBetween(%s, %s) throws", (before, after) => {
+    expect(() => keyBetween(before, after)).toThrow(RangeError)
+  })
+
+  it.each(vectors.spread as [Bound, Bound, number, string[]][])(
+    "keysBetween(%s, %s, %i)",
+    (before, after, count, expected) => {
+      expect(keysBetween(before, after, count)).toEqual(expected)
+    }
+  )
+})
@@ -1,5 +1,49 @@
-import { defineConfig, loadEnv, UserConfig } from "vite"
+import { defineConfig, loadEnv, Plugin, UserConfig } from "vite"
 import react from "@vitejs/plugin-react-swc"
+import { readFileSync, writeFileSync } from "node:fs"
+import { join } from "node:path"
+import { brotliCompressSync, constants, gzipSync } from "node:zlib"
+
+/**
+ * Writes a .gz and a .br copy next to every text file of the build, for servers
+ * and proxies in front of Streamlit that serve precompressed files
+ * (e.g. nginx gzip_static / brotli_static)
+ */
+const precompress = (): Plugin => ({
+  name: "precompress",
+  apply: "build",
+  writeBundle(options, bundle) {
+    for (const fileName of Object.keys(bundle)) {
+      if (!/\.(js|css|html|svg)$/.test(fileName)) continue
+      const file = join(options.dir!, fileName)
+      const source = readFileSync(file)
+      writeFileSync(`${file}.gz`, gzipSync(source, { level: 9 }))
+      writeFileSync(`${file}.br`, brotliCompressSync(source, {
+        params: { [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY },
+      }))
+    }
+  },
+})
+
+// Version of the kanban_board arguments this frontend understands, matches
+// _FRONTEND_PROTOCOL in streamlit_kanban_os/__init__.py. Bump both together.
+const FRONTEND_PROTOCOL = 1
+
+/**
+ * Writes build-info.json, from which Python tells a current build from an
+ * older one (which can't take skipped columns) and warns about the latter
+ */
+const buildInfo = (): Plugin => ({
+  name: "build-info",
+  apply: "build",
+  generateBundle() {
+    this.emitFile({
+      type: "asset",
+      fileName: "build-info.json",
+      source: JSON.stringify({ protocol: FRONTEND_PROTOCOL }),
+    })
+  },
+})
 
 /**
  * Vite configuration for Streamlit React Component development
@@ -13,7 +57,7 @@ export default defineConfig(({ mode }) => {
 
   return {
     base: "./",
-    plugins: [react()],
+    plugins: [react(), buildInfo(), precompress()],
     server: {
       port,
     },
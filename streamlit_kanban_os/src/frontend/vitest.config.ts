@@ -0,0 +1,19 @@
+import { defineConfig } from "vitest/config"
+import react from "@vitejs/plugin-react-swc"
+
+/**
+ * Vitest configuration for the tests in test/ and the headless frontend
+ * benchmarks in bench/
+ *
+ * Run with `npm test` and `npm run bench`, see the Tests and Benchmarks sections of the README
+ */
+export default defineConfig({
+  plugins: [react()],
+  test: {
+    environment: "jsdom",
+    include: ["test/**/*.test.ts"],
+    benchmark: {
+      include: ["bench/**/*.bench.tsx"],
+    },
+  },
+})
@@ -0,0 +1,84 @@
+import pytest
+
+from streamlit_kanban_os import Board, deltas
+
+COLUMNS = [
+    {"id": "todo", "title": "To Do", "is_main_column": True,
+     "cards": [{"id": "1", "title": "One", "help": "first"}, {"id": "2", "title": "Two", "owner": "ana"}]},
+    {"id": "doing", "title": "Doing", "cards": [{"id": "3", "title": "Three"}]},
+    {"title": "Done", "cards": [], "color": "green"},
+]
+
+
+def card_ids(board):
+    return [list(column.card_ids()) for column in board.columns]
+
+
+def test_round_trips_the_column_format():
+    assert Board.from_columns(COLUMNS).to_columns() == COLUMNS
+
+
+def test_looks_cards_up_by_id():
+    board = Board.from_columns(COLUMNS)
+    assert "2" in board and "9" not in board
+    assert len(board) == 3
+    assert (board.column_of("2"), board.position_of("2")) == (0, 1)
+    assert board.card("3").title == "Three"
+
+
+def test_rejects_duplicate_card_ids():
+    with pytest.raises(ValueError, match="Duplicate"):
+        Board.from_columns([{"title": "A", "cards": [{"id": "1", "title": "x"}]},
+                            {"title": "B", "cards": [{"id": "1", "title": "y"}]}])
+
+
+def test_move_keeps_the_index_up_to_date():
+    board = Board.from_columns(COLUMNS)
+    board.move("1", 1, 0)
+    board.move("2", 1)
+    assert card_ids(board) == [[], ["1", "3", "2"], []]
+    assert [board.position_of(card_id) for card_id in ("1", "3", "2")] == [0, 1, 2]
+    assert board.column_of("2") == 1
+
+
+def test_move_many_keeps_the_given_order():
+    board = Board.from_columns(COLUMNS)
+    board.move_many(["3", "1"], 2, 0)
+    assert card_ids(board) == [["2"], [], ["3", "1"]]
+    assert board.position_of("2") == 0 and board.position_of("1") == 1
+
+
+def test_add_column_shifts_the_columns_after_it():
+    board = Board.from_columns(COLUMNS)
+    board.add_column("Blocked", 1, is_new_column=True, id="blocked")
+    assert board.column_of("3") == 2
+    assert board.columns[1].to_dict() == {"title": "Blocked", "cards": [], "id": "blocked", "isNewColumn": True}
+
+
+def test_apply_ops_matches_the_deltas_module():
+    ops = [
+        {"type": "move", "card": "1", "from": 0, "fromIndex": 0, "to": 1, "index": 1, "rank": "V"},
+        {"type": "rename", "column": 2, "title": "Shipped"},
+        {"type": "create", "column": 3, "title": "New Category", "id": "new-1"},
+        {"type": "bulkMove", "cards": ["2", "3"], "from": [0, 1], "to": 3, "index": 0},
+    ]
+    expected = deltas.apply_ops([dict(column, cards=list(column["cards"])) for column in COLUMNS], ops)
+    assert Board.from_columns(COLUMNS).apply_ops(ops).to_columns() == expected
+
+
+def test_diff_reports_only_cards_out_of_order():
+    old = Board.from_columns([{"title": "A", "cards": [{"id": str(i), "title": ""} for i in range(5)]},
+                              {"title": "B", "cards": []}])
+    new = [{"title": "A", "cards": [{"id": card_id, "title": ""} for card_id in "01324"]},
+           {"title": "C", "cards": []},
+           {"title": "New", "cards": []}]
+    diff = old.diff(new)
+    assert [move.card_id for move in diff.moves] == ["3"]
+    assert diff.renamed == [(1, "B", "C")]
+    assert diff.created == [2]
+
+
+def test_diff_of_an_unchanged_board_is_empty():
+    board = Board.from_columns(COLUMNS)
+    assert not board.diff(COLUMNS)
+    assert not board.diff({"columns": COLUMNS})
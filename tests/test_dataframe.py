@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_kanban_os import dataframe, to_dataframe
+
+
+def test_payload_keeps_only_the_board_columns_as_strings():
+    data = pd.DataFrame({"id": [1, 2, 3], "title": [10.5, 11.5, 12.5], "status": ["Todo", "Done", "Todo"],
+                         "owner": ["ana", "bo", "cy"]})
+    frame, categories = dataframe.frame_payload(data, "status")
+    assert list(frame.columns) == ["id", "title", "status"]
+    assert frame["id"].tolist() == ["1", "2", "3"]
+    assert frame["title"].tolist() == ["10.5", "11.5", "12.5"]
+    assert categories == ["Todo", "Done"]
+
+
+@pytest.mark.parametrize("missing", [None, np.nan])
+def test_rows_without_a_group_get_a_column_of_their_own(missing):
+    data = pd.DataFrame({"id": ["1", "2", "3"], "title": ["One", None, "Three"], "status": ["Todo", missing, "Todo"]})
+    frame, categories = dataframe.frame_payload(data, "status")
+    assert frame["status"].tolist() == ["Todo", dataframe.MISSING_GROUP, "Todo"]
+    assert frame["title"].tolist() == ["One", "", "Three"]
+    assert categories == ["Todo", dataframe.MISSING_GROUP]
+    assert dataframe.frame_revision(frame, categories) != dataframe.frame_revision(frame, categories[::-1])
+
+
+def test_missing_card_ids_are_refused():
+    data = pd.DataFrame({"id": [1.0, np.nan], "title": ["One", "Two"], "status": ["Todo", "Todo"]})
+    with pytest.raises(ValueError, match="card id"):
+        dataframe.frame_payload(data, "status")
+
+
+def test_one_column_can_be_id_and_title():
+    data = pd.DataFrame({"name": ["write docs", "fix bug"], "status": ["Todo", "Done"]})
+    frame, categories = dataframe.frame_payload(data, "status", id_column="name", title_column="name")
+    assert list(frame.columns) == ["name", "status"]
+    assert dataframe.frame_revision(frame, categories)
+
+
+def test_pyarrow_tables_are_accepted():
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"id": [1, 2], "title": ["One", "Two"], "status": ["Todo", None]})
+    frame, categories = dataframe.frame_payload(table, "status")
+    assert frame["id"].tolist() == ["1", "2"]
+    assert categories == ["Todo", dataframe.MISSING_GROUP]
+
+
+def test_to_dataframe_maps_the_board_back():
+    data = pd.DataFrame({"id": [1, 2, 3], "status": ["Todo", None, "Todo"]})
+    board = [
+        {"title": "Todo", "cards": [{"id": "3"}]},
+        {"title": "Done", "cards": [{"id": "2"}]},
+        {"title": dataframe.MISSING_GROUP, "cards": [{"id": "1"}]},
+    ]
+    result = to_dataframe({"columns": board}, data, "status", position_column="position")
+    assert result["status"].tolist()[1:] == ["Done", "Todo"]
+    assert pd.isna(result["status"][0])
+    assert result["position"].tolist() == [0, 0, 0]
+    assert data["status"].tolist()[0] == "Todo"
@@ -0,0 +1,140 @@
+import copy
+
+import pytest
+
+from streamlit_kanban_os import deltas
+
+
+def make_columns():
+    return [
+        {"id": "todo", "title": "To Do", "cards": [{"id": "1", "title": "One"}, {"id": "2", "title": "Two"}]},
+        {"id": "doing", "title": "Doing", "cards": [{"id": "3", "title": "Three"}]},
+        {"id": "done", "title": "Done", "cards": []},
+    ]
+
+
+def card_ids(columns):
+    return [[card["id"] for card in column["cards"]] for column in columns]
+
+
+def test_move_uses_and_checks_the_from_index_hint():
+    columns = make_columns()
+    deltas.apply_op(columns, {"type": "move", "card": "2", "from": 0, "fromIndex": 1, "to": 2, "index": 0})
+    # a stale hint falls back to a scan of the source column
+    deltas.apply_op(columns, {"type": "move", "card": "1", "from": 0, "fromIndex": 5, "to": 1, "index": 1})
+    assert card_ids(columns) == [[], ["3", "1"], ["2"]]
+
+
+def test_rename_create_and_append():
+    columns = make_columns()
+    pages = {"r1": [{"id": "7", "title": "Seven"}, {"id": "8", "title": "Eight"}]}
+    deltas.apply_ops(columns, [
+        {"type": "rename", "column": 1, "title": "In Progress"},
+        {"type": "create", "column": 3, "title": "New Category", "id": "k-new-1", "lane": "Team A"},
+        {"type": "append", "column": 2, "request": "r1", "cards": ["8"], "loaded": 52},
+    ], pages)
+    assert columns[1]["title"] == "In Progress"
+    assert columns[3] == {"title": "New Category", "cards": [], "isNewColumn": True, "id": "k-new-1",
+                          "lane": "Team A"}
+    assert columns[2]["cards"] == [{"id": "8", "title": "Eight"}]
+    assert columns[2]["loaded"] == 52
+
+
+def test_bulk_move_keeps_the_listed_order():
+    columns = make_columns()
+    deltas.apply_op(columns, {"type": "bulkMove", "cards": ["1", "3"], "from": [0, 1], "to": 2, "index": 0})
+    assert card_ids(columns) == [["2"], [], ["1", "3"]]
+
+
+def test_ranks_are_set_on_copies_of_the_cards():
+    columns = make_columns()
+    original = columns[0]["cards"][0]
+    deltas.apply_ops(columns, [
+        {"type": "move", "card": "1", "from": 0, "fromIndex": 0, "to": 1, "index": 1, "rank": "k"},
+        {"type": "bulkMove", "cards": ["2"], "from": [0], "to": 2, "index": 0, "ranks": ["V"]},
+    ])
+    assert columns[1]["cards"][1] == {"id": "1", "title": "One", "rank": "k"}
+    assert columns[2]["cards"][0]["rank"] == "V"
+    assert "rank" not in original
+
+
+def test_touched_columns_are_copies_untouched_ones_are_kept():
+    columns = make_columns()
+    before = list(columns)
+    deltas.apply_op(columns, {"type": "move", "card": "3", "from": 1, "fromIndex": 0, "to": 0, "index": 0})
+    assert columns[2] is before[2]
+    assert columns[0] is not before[0] and columns[1] is not before[1]
+    assert card_ids(before) == card_ids(make_columns())
+
+
+@pytest.mark.parametrize("bad_op", [
+    {"type": "move", "card": "9", "from": 0, "fromIndex": 0, "to": 1, "index": 0},
+    {"type": "move", "card": "3", "from": 1, "fromIndex": 0, "to": 7, "index": 0},
+    {"type": "bulkMove", "cards": ["1", "9"], "from": [0, 1], "to": 2, "index": 0},
+    {"type": "explode"},
+])
+def test_a_failing_batch_leaves_the_board_as_it_was(bad_op):
+    columns = make_columns()
+    expected = copy.deepcopy(columns)
+    ops = [
+        {"type": "move", "card": "1", "from": 0, "fromIndex": 0, "to": 2, "index": 0},
+        {"type": "rename", "column": 0, "title": "Renamed"},
+        bad_op,
+    ]
+    with pytest.raises((KeyError, IndexError, ValueError)):
+        deltas.apply_ops(columns, ops)
+    assert columns == expected
+
+
+def delta_value(session, *ops):
+    return {"mode": "delta", "session": session, "seq": ops[-1]["seq"] if ops else 0, "ops": list(ops)}
+
+
+def test_sync_applies_new_operations_once():
+    state = deltas.new_state(make_columns())
+    state["session"] = "s1"
+    move = {"seq": 1, "type": "move", "card": "1", "from": 0, "fromIndex": 0, "to": 2, "index": 0}
+    value = delta_value("s1", move)
+    assert deltas.sync(state, value) == [move]
+    # Streamlit hands the same value back on the next rerun
+    assert deltas.sync(state, value) == []
+    assert card_ids(state["columns"]) == [["2"], ["3"], ["1"]]
+    assert deltas.ack(state) == {"session": "s1", "seq": 1}
+
+
+def test_sync_takes_a_snapshot_from_a_new_mount():
+    state = deltas.new_state(make_columns())
+    snapshot = make_columns()[::-1]
+    deltas.sync(state, {"mode": "snapshot", "session": "s2", "seq": 0, "columns": snapshot})
+    assert state["columns"] == snapshot
+    assert state["session"] == "s2"
+
+
+def test_sync_asks_for_a_snapshot_after_a_gap():
+    state = deltas.new_state(make_columns())
+    state["session"] = "s1"
+    value = delta_value("s1", {"seq": 2, "type": "rename", "column": 0, "title": "Skipped one"})
+    assert deltas.sync(state, value) == []
+    assert state["awaiting_snapshot"] and state["resync"] == 1
+    assert state["columns"] == make_columns()
+
+
+def test_sync_keeps_the_board_when_a_batch_fails():
+    state = deltas.new_state(make_columns())
+    state["session"] = "s1"
+    value = delta_value(
+        "s1",
+        {"seq": 1, "type": "move", "card": "1", "from": 0, "fromIndex": 0, "to": 2, "index": 0},
+        {"seq": 2, "type": "move", "card": "1", "from": 0, "fromIndex": 0, "to": 1, "index": 0},
+    )
+    assert deltas.sync(state, value) == []
+    assert state["columns"] == make_columns()
+    assert state["seq"] == 0
+    assert state["awaiting_snapshot"]
+
+
+def test_bulk_move_with_a_missing_card_takes_no_card_out():
+    columns = make_columns()
+    with pytest.raises(KeyError, match="'9'"):
+        deltas.apply_op(columns, {"type": "bulkMove", "cards": ["1", "9"], "from": [0, 1], "to": 2, "index": 0})
+    assert card_ids(columns) == [["1", "2"], ["3"], []]
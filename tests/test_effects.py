@@ -0,0 +1,62 @@
+import threading
+
+from streamlit_kanban_os import Board, CardMove, SideEffectQueue, effects
+
+COLUMNS = [
+    {"id": "todo", "title": "To Do", "cards": [{"id": "1", "title": "One"}, {"id": "2", "title": "Two"}]},
+    {"id": "done", "title": "Done", "cards": []},
+]
+
+
+def test_moves_from_ops_name_the_columns_by_id():
+    moves = effects.moves_from_ops([
+        {"type": "create", "column": 1, "title": "Doing", "id": "doing"},
+        {"type": "move", "card": "1", "from": 0, "fromIndex": 0, "to": 1, "index": 0},
+        {"type": "bulkMove", "cards": ["2"], "from": [0], "to": 2, "index": 0},
+    ], ["todo", "done"])
+    assert moves == [CardMove("1", 0, 0, 1, 0, "todo", "doing"), CardMove("2", 0, None, 2, 0, "todo", "done")]
+
+
+def test_diff_moves_name_the_columns_by_id():
+    new = [dict(COLUMNS[0], cards=COLUMNS[0]["cards"][1:]), dict(COLUMNS[1], cards=COLUMNS[0]["cards"][:1])]
+    assert Board.from_columns(COLUMNS).diff(new).moves == [CardMove("1", 0, 0, 1, 0, "todo", "done")]
+
+
+def test_detect_change_compares_with_the_previous_rerun():
+    state = {"columns": COLUMNS}
+    assert effects.detect_change(state, COLUMNS) == (False, [])
+    moved = [dict(COLUMNS[0], cards=COLUMNS[0]["cards"][:1]), dict(COLUMNS[1], cards=COLUMNS[0]["cards"][1:])]
+    changed, moves = effects.detect_change(state, moved)
+    assert changed and [move.card_id for move in moves] == ["2"]
+    assert effects.detect_change(state, moved) == (False, [])
+
+
+def test_queue_hands_events_over_in_batches():
+    batches = []
+    queue = SideEffectQueue(batches.append, max_workers=1, batch_size=2, batch_wait=0.5)
+    queue.submit(range(5))
+    assert queue.flush(timeout=5)
+    queue.close()
+    assert [event for batch in batches for event in batch] == list(range(5))
+    assert max(len(batch) for batch in batches) == 2
+
+
+def test_queue_retries_then_keeps_failed_batches():
+    attempts = []
+    lock = threading.Lock()
+
+    def handler(batch):
+        with lock:
+            attempts.append(batch)
+        if batch == ["bad"] or len(attempts) == 1:
+            raise RuntimeError("unavailable")
+
+    queue = SideEffectQueue(handler, max_workers=1, batch_wait=0, retries=2, backoff=0)
+    queue.submit(["good"])
+    assert queue.flush(timeout=5)
+    queue.submit(["bad"])
+    assert queue.flush(timeout=5)
+    queue.close()
+    assert attempts == [["good"], ["good"], ["bad"], ["bad"], ["bad"]]
+    assert [batch for batch, _ in queue.failed] == [["bad"]]
+    assert queue.pending == 0
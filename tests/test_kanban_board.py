@@ -0,0 +1,156 @@
+import datetime
+from types import SimpleNamespace
+
+import pytest
+import streamlit as st
+
+import streamlit_kanban_os
+from streamlit_kanban_os import kanban_board
+
+COLUMNS = [
+    {"id": "todo", "title": "To Do", "cards": [{"id": "1", "title": "One"}, {"id": "2", "title": "Two"}]},
+    {"id": "done", "title": "Done", "cards": []},
+]
+
+
+@pytest.fixture
+def component(monkeypatch):
+    """Stands in for the frontend: records the arguments of each call and returns queued values."""
+    for name in list(st.session_state.keys()):
+        del st.session_state[name]
+    fake = SimpleNamespace(calls=[], values=[])
+
+    def component_func(**kwargs):
+        fake.calls.append(kwargs)
+        return fake.values.pop(0) if fake.values else None
+
+    monkeypatch.setattr(streamlit_kanban_os, "_component_func", component_func)
+    monkeypatch.setattr(streamlit_kanban_os, "_LEGACY_FRONTEND", False)
+    return fake
+
+
+def test_unchanged_revision_is_not_sent_again(component):
+    kanban_board(COLUMNS, key="board")
+    kanban_board(COLUMNS, key="board")
+    assert component.calls[0]["columns"] == COLUMNS
+    assert component.calls[1]["columns"] is None
+    assert component.calls[0]["revision"] == component.calls[1]["revision"]
+
+
+def test_columns_are_always_sent_to_an_older_build(component, monkeypatch):
+    monkeypatch.setattr(streamlit_kanban_os, "_LEGACY_FRONTEND", True)
+    kanban_board(COLUMNS, key="board")
+    kanban_board(COLUMNS, key="board")
+    assert all(call["columns"] == COLUMNS for call in component.calls)
+
+
+def test_build_protocol(tmp_path):
+    assert streamlit_kanban_os._build_protocol(str(tmp_path)) == 0
+    (tmp_path / "build-info.json").write_text('{"protocol": 1}')
+    assert streamlit_kanban_os._build_protocol(str(tmp_path)) == streamlit_kanban_os._FRONTEND_PROTOCOL
+
+
+def test_columns_are_always_sent_without_a_key(component):
+    kanban_board(COLUMNS)
+    kanban_board(COLUMNS)
+    assert all(call["columns"] == COLUMNS for call in component.calls)
+
+
+def test_needs_columns_without_a_key_is_ignored(component):
+    component.values.append({"needsColumns": "mount-1"})
+    assert kanban_board(COLUMNS) is None
+
+
+def test_needs_columns_resends_the_board(component, monkeypatch):
+    reruns = []
+    monkeypatch.setattr(st, "rerun", lambda: reruns.append(True))
+    kanban_board(COLUMNS, key="board")
+    component.values.append({"needsColumns": "mount-2"})
+    assert kanban_board(COLUMNS, key="board") is None
+    assert reruns == [True]
+    kanban_board(COLUMNS, key="board")
+    assert component.calls[-1]["columns"] == COLUMNS
+
+
+def test_delta_ack_covers_the_operations_of_this_rerun(component):
+    snapshot = {"mode": "snapshot", "session": "s1", "seq": 0, "columns": COLUMNS}
+    move = {"seq": 1, "type": "move", "card": "1", "from": 0, "fromIndex": 0, "to": 1, "index": 0}
+    delta = {"mode": "delta", "session": "s1", "seq": 1, "ops": [move]}
+    for sent in (None, snapshot, delta):
+        # Streamlit keeps the component value under the key before the script reruns
+        st.session_state["board"] = sent
+        component.values.append(sent)
+        value = kanban_board(COLUMNS, key="board", delta=True)
+    assert [call["deltaAck"] for call in component.calls] == [None, {"session": "s1", "seq": 0},
+                                                               {"session": "s1", "seq": 1}]
+    assert value["ops"] == [move]
+    assert [[card["id"] for card in column["cards"]] for column in value["columns"]] == [["2"], ["1"]]
+
+
+def test_board_revision_follows_the_content():
+    revision = streamlit_kanban_os._board_revision
+    assert revision(COLUMNS) == revision([dict(column, cards=list(column["cards"])) for column in COLUMNS])
+    assert revision(COLUMNS) != revision([dict(COLUMNS[0], title="Renamed"), COLUMNS[1]])
+    # values marshal can't write fall back to JSON
+    dated = [dict(COLUMNS[0], due=datetime.date(2026, 1, 1))]
+    assert revision(dated) != revision([dict(COLUMNS[0], due=datetime.date(2026, 1, 2))])
+
+
+def test_page_requests_are_not_returned(component):
+    paged = [streamlit_kanban_os.PagedColumn("Backlog", [{"id": str(i), "title": str(i)} for i in range(60)],
+                                             page_size=50)]
+    kanban_board(paged, key="board")
+    request = {"request": "m-1", "column": 0, "offset": 50}
+    value = {"columns": [{"title": "Backlog", "cards": []}], "loadMore": request}
+    st.session_state["board"] = value
+    component.values.append(value)
+    returned = kanban_board(paged, key="board")
+    assert component.calls[-1]["page"]["request"] == "m-1"
+    assert returned == {"columns": [{"title": "Backlog", "cards": []}]}
+    assert "loadMore" in value
+
+
+def test_bulk_move_is_sent_until_the_frontend_applied_it(component):
+    move = {"cards": ["1"], "to": "done", "request": "close-1"}
+    kanban_board(COLUMNS, key="board", bulk_move=move)
+    token = component.calls[0]["bulkMoves"][0]["request"]
+    assert token.startswith("close-1")
+    # not reported yet, e.g. the frontend remounted before it could apply it
+    kanban_board(COLUMNS, key="board", bulk_move=move)
+    assert [request["request"] for request in component.calls[1]["bulkMoves"]] == [token]
+    st.session_state["board"] = {"columns": COLUMNS, "bulkApplied": [token]}
+    component.values.append(st.session_state["board"])
+    value = kanban_board(COLUMNS, key="board", bulk_move=move)
+    assert "bulkApplied" not in value
+    kanban_board(COLUMNS, key="board", bulk_move=move)
+    assert component.calls[2]["bulkMoves"] == component.calls[3]["bulkMoves"] == []
+
+
+def test_bulk_move_passed_again_runs_again(component):
+    move = {"match": {"title": "One"}, "to": "done"}
+    kanban_board(COLUMNS, key="board", bulk_move=move)
+    first = component.calls[0]["bulkMoves"][0]["request"]
+    st.session_state["board"] = {"columns": COLUMNS, "bulkApplied": [first]}
+    kanban_board(COLUMNS, key="board", bulk_move=move)
+    kanban_board(COLUMNS, key="board")
+    # the same move later, the old report doesn't cover it
+    kanban_board(COLUMNS, key="board", bulk_move=move)
+    kanban_board(COLUMNS, key="board", bulk_move=move)
+    assert component.calls[1]["bulkMoves"] == component.calls[2]["bulkMoves"] == []
+    again = component.calls[3]["bulkMoves"][0]["request"]
+    assert again != first
+    assert [request["request"] for request in component.calls[4]["bulkMoves"]] == [again]
+
+
+def test_bulk_move_requires_a_key(component):
+    with pytest.raises(ValueError, match="bulk_move"):
+        kanban_board(COLUMNS, bulk_move={"cards": ["1"], "to": "done"})
+
+
+def test_an_older_build_refuses_options_it_would_ignore(component, monkeypatch):
+    monkeypatch.setattr(streamlit_kanban_os, "_LEGACY_FRONTEND", True)
+    with pytest.raises(RuntimeError, match=r"kanban_board\(delta\)"):
+        kanban_board(COLUMNS, key="board", delta=True)
+    with pytest.raises(RuntimeError, match="commit, lanes"):
+        kanban_board({"Team": COLUMNS}, key="board", commit="manual")
+    assert component.calls == []
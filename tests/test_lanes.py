@@ -0,0 +1,50 @@
+import pandas as pd
+import pytest
+
+from streamlit_kanban_os import Board, PagedColumn, lanes
+
+TEAM_A = [{"id": "a-todo", "title": "To Do", "cards": [{"id": "1", "title": "One"}]}]
+TEAM_B = [{"id": "b-todo", "title": "To Do", "cards": []}, {"id": "b-done", "title": "Done", "cards": []}]
+
+
+def test_only_dicts_are_lanes():
+    assert lanes.is_lanes({"Team A": TEAM_A})
+    assert not lanes.is_lanes(TEAM_A)
+    assert not lanes.is_lanes(pd.DataFrame({"id": [1]}))
+
+
+def test_flatten_and_tag_keep_lane_order():
+    columns, column_lanes, names = lanes.flatten({"Team A": TEAM_A, "Team B": Board.from_columns(TEAM_B)})
+    assert names == ["Team A", "Team B"]
+    assert column_lanes == ["Team A", "Team B", "Team B"]
+    tagged = lanes.tag(columns, column_lanes)
+    assert [column["lane"] for column in tagged] == column_lanes
+    assert "lane" not in TEAM_A[0]
+
+
+def test_flatten_rejects_other_lane_values():
+    with pytest.raises(ValueError, match="Team A"):
+        lanes.flatten({"Team A": "To Do"})
+
+
+def test_flatten_rejects_column_ids_shared_by_lanes():
+    with pytest.raises(ValueError, match="'a-todo'.*'Team A'.*'Team B'"):
+        lanes.flatten({"Team A": TEAM_A, "Team B": [{"id": "a-todo", "title": "To Do", "cards": []}]})
+    with pytest.raises(ValueError, match="'b-done'"):
+        lanes.flatten({"Team A": [PagedColumn("Done", [], id="b-done")], "Team B": TEAM_B})
+    # Columns without an id are matched by position, the same title in two lanes is fine
+    columns, _, _ = lanes.flatten({"Team A": [{"title": "To Do", "cards": []}], "Team B": [{"title": "To Do", "cards": []}]})
+    assert len(columns) == 2
+
+
+def test_group_round_trips_and_keeps_empty_lanes():
+    columns, column_lanes, names = lanes.flatten({"Team A": TEAM_A, "Team B": TEAM_B, "Team C": []})
+    tagged = lanes.tag(columns, column_lanes)
+    assert lanes.group(tagged, names) == {"Team A": TEAM_A, "Team B": TEAM_B, "Team C": []}
+
+
+def test_group_puts_unknown_lanes_last():
+    tagged = [dict(TEAM_A[0], lane="Team A"), {"id": "x", "title": "New Category", "cards": [], "lane": "Other"}]
+    grouped = lanes.group(tagged, ["Team A"])
+    assert list(grouped) == ["Team A", "Other"]
+    assert grouped["Other"] == [{"id": "x", "title": "New Category", "cards": []}]
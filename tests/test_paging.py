@@ -0,0 +1,63 @@
+from streamlit_kanban_os import PagedColumn, deltas, paging
+
+
+def make_cards(count):
+    return [{"id": str(i), "title": f"Task {i}"} for i in range(count)]
+
+
+def test_first_page_only():
+    state = paging.new_state()
+    columns, page = paging.prepare([PagedColumn("Backlog", make_cards(120), page_size=50, id="backlog")], state)
+    column = columns[0]
+    assert [card["id"] for card in column["cards"]] == [str(i) for i in range(50)]
+    assert (column["total"], column["loaded"], column["hasMore"], column["id"]) == (120, 50, True, "backlog")
+    assert page is None
+
+
+def test_callable_source_is_queried_once_per_page():
+    calls = []
+
+    def source(offset, limit):
+        calls.append((offset, limit))
+        return make_cards(70)[offset:offset + limit]
+
+    state = paging.new_state()
+    paged = [PagedColumn("Backlog", source, page_size=50)]
+    paging.prepare(paged, state)
+    request = {"request": "m-1", "column": 0, "offset": 50}
+    _, page = paging.prepare(paged, state, request)
+    # Streamlit returns the same request on the next rerun, it is served from the cache
+    _, again = paging.prepare(paged, state, request)
+    assert calls == [(0, 50), (50, 50)]
+    assert [card["id"] for card in page["cards"]] == [str(i) for i in range(50, 70)]
+    assert page["hasMore"] is False
+    assert again is page
+
+
+def test_iterator_is_not_read_twice():
+    iterator = iter(make_cards(60))
+    paged = [PagedColumn("Backlog", iterator, page_size=25)]
+    state = paging.new_state()
+    first, _ = paging.prepare(paged, state)
+    again, _ = paging.prepare(paged, state)
+    assert first[0]["cards"] == again[0]["cards"]
+    _, page = paging.prepare(paged, state, {"request": "m-1", "column": 0, "offset": 25})
+    assert [card["id"] for card in page["cards"]] == [str(i) for i in range(25, 50)]
+
+
+def test_plain_columns_pass_through():
+    plain = {"title": "Done", "cards": []}
+    columns, _ = paging.prepare([plain, PagedColumn("Backlog", make_cards(3))], paging.new_state())
+    assert columns[0] is plain
+    assert columns[1]["hasMore"] is False
+
+
+def test_served_pages_resolve_append_operations():
+    state = paging.new_state()
+    paged = [PagedColumn("Backlog", make_cards(60), page_size=50)]
+    columns, _ = paging.prepare(paged, state)
+    paging.prepare(paged, state, {"request": "m-1", "column": 0, "offset": 50})
+    deltas.apply_op(columns, {"type": "append", "column": 0, "request": "m-1", "cards": ["50", "51"], "loaded": 60},
+                    state["served"])
+    assert [card["id"] for card in columns[0]["cards"][-2:]] == ["50", "51"]
+    assert columns[0]["loaded"] == 60
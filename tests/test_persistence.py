@@ -0,0 +1,61 @@
+import pytest
+
+from streamlit_kanban_os import MemoryStore, SQLiteStore, persistence
+
+COLUMNS = [
+    {"id": "todo", "title": "To Do", "cards": [{"id": "1", "title": "One"}, {"id": "2", "title": "Two"}]},
+    {"id": "done", "title": "Done", "cards": []},
+]
+
+
+def move(card, to, from_column=0, from_index=0):
+    return {"seq": 1, "type": "move", "card": card, "from": from_column, "fromIndex": from_index, "to": to,
+            "index": 0}
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryStore()
+        return
+    store = SQLiteStore(str(tmp_path / "boards.sqlite3"))
+    yield store
+    store.close()
+
+
+def card_ids(columns):
+    return [[card["id"] for card in column["cards"]] for column in columns]
+
+
+def test_a_new_log_replays_the_recorded_operations(store):
+    writer = persistence.BoardLog(store, "board", snapshot_every=2)
+    columns = writer.load(COLUMNS)
+    for op in (move("1", 1), move("2", 1)):
+        persistence.deltas.apply_op(columns, op)
+        writer.record([op], columns)
+    assert store.latest_snapshot("board")[0] == 2
+    assert card_ids(persistence.BoardLog(store, "board").load(COLUMNS)) == [[], ["2", "1"]]
+
+
+def test_a_second_writer_is_refused(store):
+    first = persistence.BoardLog(store, "board")
+    second = persistence.BoardLog(store, "board")
+    first_columns = first.load(COLUMNS)
+    second_columns = second.load(COLUMNS)
+    persistence.deltas.apply_op(first_columns, move("1", 1))
+    first.record([move("1", 1)], first_columns)
+    persistence.deltas.apply_op(second_columns, move("1", 1))
+    with pytest.raises(persistence.LogConflict):
+        second.record([move("1", 1)], second_columns)
+    assert card_ids(persistence.BoardLog(store, "board").load(COLUMNS)) == [["2"], ["1"]]
+
+
+def test_events_that_no_longer_apply_are_skipped_once(store):
+    # a log two writers appended to before appends were checked
+    store.save_snapshot("board", 0, COLUMNS)
+    store.append("board", [move("1", 1), move("1", 1), move("2", 1)])
+    log = persistence.BoardLog(store, "board")
+    assert card_ids(log.load()) == [[], ["2", "1"]]
+    assert log.seq == 3
+    assert store.latest_snapshot("board")[0] == 3
+    assert card_ids(persistence.BoardLog(store, "board").load()) == [[], ["2", "1"]]
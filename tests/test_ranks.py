@@ -0,0 +1,55 @@
+import json
+import os
+
+import pytest
+
+from streamlit_kanban_os import ranks
+
+# Shared with the frontend's test/ranks.test.ts, so both sides compute the same ranks
+with open(os.path.join(os.path.dirname(__file__), "data", "rank_vectors.json")) as vectors_file:
+    VECTORS = json.load(vectors_file)
+
+
+@pytest.mark.parametrize("before, after, expected", VECTORS["between"])
+def test_key_between(before, after, expected):
+    assert ranks.key_between(before, after) == expected
+    assert (before or "") < expected and (after is None or expected < after)
+    assert ranks.is_rank(expected)
+
+
+@pytest.mark.parametrize("before, after", VECTORS["outOfOrder"])
+def test_key_between_out_of_order_raises(before, after):
+    with pytest.raises(ValueError):
+        ranks.key_between(before, after)
+
+
+@pytest.mark.parametrize("before, after, count, expected", VECTORS["spread"])
+def test_keys_between(before, after, count, expected):
+    assert ranks.keys_between(before, after, count) == expected
+
+
+def column(*card_ranks):
+    return {"title": "A", "cards": [{"id": str(i), **({"rank": rank} if rank else {})}
+                                    for i, rank in enumerate(card_ranks)]}
+
+
+def test_fill_keeps_a_board_in_order():
+    columns = [column("G", "V", "l")]
+    assert ranks.fill(columns) is columns
+
+
+def test_fill_ranks_cards_missing_one_between_their_neighbours():
+    columns = [column("G", None, None, "l"), column("V")]
+    filled = ranks.fill(columns)
+    assert [card["rank"] for card in filled[0]["cards"]][::3] == ["G", "l"]
+    assert sorted(card["rank"] for card in filled[0]["cards"]) == [card["rank"] for card in filled[0]["cards"]]
+    assert filled[1] is columns[1]
+    assert "rank" not in columns[0]["cards"][1]
+
+
+def test_fill_only_reranks_cards_out_of_order():
+    columns = [column("G", "V", "8", "d", "l", "bad0")]
+    filled = [card["rank"] for card in ranks.fill(columns)[0]["cards"]]
+    assert filled == sorted(filled) and len(set(filled)) == len(filled)
+    # "8" and the malformed rank are the only ones replaced
+    assert [filled[i] for i in (0, 1, 3, 4)] == ["G", "V", "d", "l"]
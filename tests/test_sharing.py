@@ -0,0 +1,101 @@
+from streamlit_kanban_os import MemoryStore, SharedBoards, deltas, effects, sharing
+
+COLUMNS = [
+    {"id": "todo", "title": "To Do", "cards": [{"id": "1", "title": "One"}, {"id": "2", "title": "Two"}]},
+    {"id": "done", "title": "Done", "cards": []},
+]
+IDS = ["todo", "done"]
+
+
+def card_ids(columns):
+    return [[card["id"] for card in column["cards"]] for column in columns]
+
+
+def move(card, source, to, from_index=0, index=0, seq=1):
+    return {"seq": seq, "type": "move", "card": card, "from": source, "fromIndex": from_index, "to": to,
+            "index": index}
+
+
+def test_commits_on_an_old_version_are_rebased():
+    boards = SharedBoards()
+    version, _ = boards.checkout("board", COLUMNS)
+    first = boards.commit("board", version, [move("1", 0, 1)], IDS)
+    # made on the board before the first commit, card 2 was at index 1 then
+    second = boards.commit("board", version, [move("2", 0, 1, from_index=1, index=1)], IDS)
+    assert (first.version, second.version) == (1, 2)
+    assert second.remote == first.accepted
+    assert second.accepted[0]["fromIndex"] == 0
+    assert card_ids(boards.checkout("board")[1]) == [[], ["1", "2"]]
+
+
+def test_a_card_moved_by_someone_else_is_not_moved_again():
+    boards = SharedBoards()
+    version, _ = boards.checkout("board", COLUMNS)
+    boards.commit("board", version, [move("1", 0, 1)], IDS)
+    result = boards.commit("board", version, [move("1", 0, 1, index=0), move("2", 0, 1, from_index=1)], IDS)
+    assert [op["card"] for op in result.rejected] == ["1"]
+    assert [op["card"] for op in result.accepted] == ["2"]
+
+
+def test_columns_are_matched_by_id():
+    boards = SharedBoards()
+    version, _ = boards.checkout("board", COLUMNS)
+    boards.commit("board", version, [{"type": "create", "column": 2, "title": "Later", "id": "later"}], IDS)
+    # the session's board has its own new column first
+    result = boards.commit("board", version, [
+        {"type": "rename", "column": 2, "title": "Shipped"},
+        move("1", 0, 1),
+    ], ["todo", "mine", "done"])
+    assert result.accepted == [{"type": "rename", "column": 1, "title": "Shipped", "columnId": "done"}]
+    # the session's own column is not on the shared board
+    assert result.rejected == [move("1", 0, 1)]
+
+
+def test_sync_session_sends_other_sessions_changes():
+    boards = SharedBoards()
+    sessions = {}
+    for name in ("a", "b"):
+        version, columns = boards.checkout("board", COLUMNS)
+        sessions[name] = dict(deltas.new_state(columns), version=version)
+        sessions[name]["session"] = name
+    value = {"mode": "delta", "session": "a", "seq": 1, "ops": [move("1", 0, 1)]}
+    ops, update, conflicts = sharing.sync_session(boards, "board", sessions["a"], value)
+    assert (len(ops), update, conflicts) == (1, None, [])
+    ops, update, conflicts = sharing.sync_session(boards, "board", sessions["b"], None)
+    assert ops == [] and update["ops"][0]["card"] == "1"
+    assert card_ids(sessions["b"]["columns"]) == [["2"], ["1"]]
+
+
+def test_sync_session_returns_the_operations_as_committed():
+    boards = SharedBoards()
+    a = dict(deltas.new_state(boards.checkout("board", COLUMNS)[1]), version=0, session="a")
+    b = dict(deltas.new_state(boards.checkout("board")[1]), version=0, session="b")
+    sharing.sync_session(boards, "board", a, {"mode": "delta", "session": "a", "seq": 1, "ops": [
+        {"seq": 1, "type": "create", "column": 2, "title": "Later", "id": "later"}]})
+    # b made its own column at the same position and moved a card there
+    ops, update, _ = sharing.sync_session(boards, "board", b, {"mode": "delta", "session": "b", "seq": 2, "ops": [
+        {"seq": 1, "type": "create", "column": 2, "title": "Mine", "id": "mine"}, move("1", 0, 2, seq=2)]})
+    assert [column["id"] for column in update["columns"]] == ["todo", "done", "later", "mine"]
+    assert [(op["type"], op.get("to")) for op in ops] == [("create", None), ("move", 3)]
+    [card_move] = effects.moves_from_ops(ops)
+    assert (card_move.from_column_id, card_move.to_column_id) == ("todo", "mine")
+
+
+def test_sync_session_resets_a_session_whose_change_conflicted():
+    boards = SharedBoards()
+    a = dict(deltas.new_state(boards.checkout("board", COLUMNS)[1]), version=0, session="a")
+    b = dict(deltas.new_state(boards.checkout("board")[1]), version=0, session="b")
+    sharing.sync_session(boards, "board", a, {"mode": "delta", "session": "a", "seq": 1, "ops": [move("1", 0, 1)]})
+    _, update, conflicts = sharing.sync_session(
+        boards, "board", b, {"mode": "delta", "session": "b", "seq": 1, "ops": [move("1", 0, 1)]})
+    assert [op["card"] for op in conflicts] == ["1"]
+    assert card_ids(update["columns"]) == card_ids(a["columns"]) == [["2"], ["1"]]
+    assert b["version"] == 1
+
+
+def test_a_persisted_shared_board_outlives_the_process():
+    store = MemoryStore()
+    boards = SharedBoards(store=store)
+    boards.checkout("board", COLUMNS)
+    boards.commit("board", 0, [move("1", 0, 1)], IDS)
+    assert card_ids(SharedBoards(store=store).checkout("board", COLUMNS)[1]) == [["2"], ["1"]]